@@ -1,12 +1,82 @@
 """Entry point for WrestleGM MVP."""
 
-from wrestlegm.ui import WrestleGMApp
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Sequence
+
+from wrestlegm import persistence
+from wrestlegm.session import SAVE_BACKENDS
+
+if TYPE_CHECKING:
+    from wrestlegm.ui import WrestleGMApp
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command-line options for the app."""
+
+    parser = argparse.ArgumentParser(description="Run the WrestleGM Textual app.")
+    parser.add_argument(
+        "data_packs",
+        nargs="*",
+        type=Path,
+        help="data pack directories layered over the bundled data",
+    )
+    parser.add_argument(
+        "--save-dir",
+        type=Path,
+        default=None,
+        help=f"save slot directory (default: {persistence.DEFAULT_SAVE_DIR})",
+    )
+    parser.add_argument(
+        "--save-format",
+        choices=sorted(persistence.SAVE_FORMATS),
+        default=persistence.DEFAULT_SAVE_FORMAT,
+        help="format for newly created save slots",
+    )
+    parser.add_argument(
+        "--save-backend",
+        choices=SAVE_BACKENDS,
+        default="files",
+        help="store slots as files, or in one SQLite database with unlimited slots",
+    )
+    parser.add_argument(
+        "--journal",
+        action="store_true",
+        help="append delta records to a slot journal instead of rewriting the slot",
+    )
+    return parser.parse_args(argv)
+
+
+def build_app(argv: Sequence[str] | None = None) -> WrestleGMApp:
+    """Build the app from command-line options.
+
+    Set WRESTLEGM_TIMINGS to a JSON path to time screen handlers (F9 shows
+    them) and write the summary there on exit.
+    """
+
+    args = parse_args(argv)
+    # Textual and the UI widgets load only once an app is actually built, so
+    # option parsing and --help stay on the headless import path.
+    from wrestlegm.ui import WrestleGMApp
+
+    timings = os.environ.get("WRESTLEGM_TIMINGS")
+    return WrestleGMApp(
+        data_packs=args.data_packs,
+        timings_path=Path(timings) if timings else None,
+        save_dir=args.save_dir,
+        save_format=args.save_format,
+        journal_mode=args.journal,
+        save_backend=args.save_backend,
+    )
 
 
 def main() -> None:
-    """Run the WrestleGM Textual app."""
+    """Run the WrestleGM Textual app, layering any data pack directories given."""
 
-    WrestleGMApp().run()
+    build_app().run()
 
 
 if __name__ == "__main__":
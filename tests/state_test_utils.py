@@ -0,0 +1,78 @@
+"""Textual-free helpers for tests that only need game state."""
+
+from __future__ import annotations
+
+from wrestlegm import constants
+from wrestlegm.models import (
+    CooldownState,
+    Match,
+    Promo,
+    RivalryState,
+    WrestlerDefinition,
+)
+from wrestlegm.rivalries import ordered_pairs
+from wrestlegm.state import GameState
+
+
+def build_test_slots(state: GameState) -> list[Match | Promo]:
+    """Build a full show card from the fixture roster."""
+
+    wrestler_ids = list(state.roster.keys())
+    match_type_id = next(iter(state.match_types))
+    match_category_id = "singles"
+    slots: list[Match | Promo] = []
+    cursor = 0
+    for slot_type in constants.SHOW_SLOT_TYPES:
+        if slot_type == "match":
+            wrestler_count = constants.MATCH_CATEGORIES[match_category_id]["size"]
+            slots.append(
+                Match(
+                    wrestler_ids=wrestler_ids[cursor : cursor + wrestler_count],
+                    match_category_id=match_category_id,
+                    match_type_id=match_type_id,
+                )
+            )
+            cursor += wrestler_count
+        else:
+            slots.append(Promo(wrestler_id=wrestler_ids[cursor]))
+            cursor += 1
+    return slots
+
+
+def seed_show_card(state: GameState) -> None:
+    """Populate the show card with deterministic matches."""
+
+    slots = build_test_slots(state)
+    for index, slot in enumerate(slots):
+        state.set_slot(index, slot)
+
+
+def build_large_roster(count: int) -> list[WrestlerDefinition]:
+    """Build a synthetic roster for scale tests."""
+
+    return [
+        WrestlerDefinition(
+            id=f"w{index:06d}",
+            name=f"Wrestler {index}",
+            alignment="Face" if index % 2 else "Heel",
+            popularity=index % 100,
+            stamina=20 + index % 80,
+            mic_skill=(index * 7) % 100,
+        )
+        for index in range(count)
+    ]
+
+
+def seed_rivalry_pairs(state: GameState, cooldown_every: int = 4) -> None:
+    """Give every roster pair a rivalry, putting every Nth pair on cooldown."""
+
+    manager = state.rivalry_manager
+    for n, key in enumerate(ordered_pairs(sorted(state.roster))):
+        if n % cooldown_every == 0:
+            manager.cooldown_states[key] = CooldownState(
+                *key, remaining_shows=1 + n % constants.COOLDOWN_SHOWS
+            )
+        else:
+            manager.rivalry_states[key] = RivalryState(
+                *key, rivalry_value=1 + n % constants.RIVALRY_LEVEL_CAP
+            )
@@ -0,0 +1,182 @@
+"""Tests for data definition loading."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import tracemalloc
+
+import pytest
+
+from wrestlegm import data
+from wrestlegm.data import load_match_types
+from wrestlegm.session import SessionManager
+from wrestlegm.state import GameState
+
+
+def test_compiled_cache_is_reused_until_source_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    source = tmp_path / "wrestlers.json"
+    source.write_bytes((data.DATA_DIR / "wrestlers.json").read_bytes())
+    cache_dir = tmp_path / "cache"
+    parses = []
+    parse = data._parse_wrestlers
+    monkeypatch.setattr(data, "_parse_wrestlers", lambda *args: parses.append(1) or parse(*args))
+
+    expected = data.load_wrestlers(source)
+    assert data.load_wrestlers(source, cache_dir=cache_dir) == expected
+    assert data.load_wrestlers(source, cache_dir=cache_dir) == expected
+    assert len(parses) == 1
+
+    # Touching the file without changing it revalidates by hash only.
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert data.load_wrestlers(source, cache_dir=cache_dir) == expected
+    assert len(parses) == 1
+
+    source.write_bytes(source.read_bytes().replace(b'"name": "', b'"name": "X', 1))
+    updated = data.load_wrestlers(source, cache_dir=cache_dir)
+    assert len(parses) == 2
+    assert updated[0].name == "X" + expected[0].name
+
+    data.cache_path([source], "wrestlers", cache_dir).write_bytes(b"not a pickle")
+    assert data.load_wrestlers(source, cache_dir=cache_dir) == updated
+    assert len(parses) == 3
+
+    # A model layout change keys a new cache file instead of unpickling the old one.
+    monkeypatch.setattr(data, "MODEL_FINGERPRINT", "changed-layout")
+    assert data.load_wrestlers(source, cache_dir=cache_dir) == updated
+    assert len(parses) == 4
+
+
+def test_default_cache_dir_does_not_depend_on_cwd() -> None:
+    assert data.DEFAULT_CACHE_DIR.is_absolute()
+    assert data.DEFAULT_CACHE_DIR.parent == data.DATA_DIR.parent / "dist" / "data"
+
+
+@pytest.mark.parametrize("suffix", [".json", ".jsonl"])
+def test_streaming_wrestler_loader_keeps_memory_flat(tmp_path: Path, suffix: str) -> None:
+    count = 20_000
+    entries = (
+        {
+            "id": f"w{index}",
+            "name": f"Wrestler {index}",
+            "alignment": "Face" if index % 2 else "Heel",
+            "popularity": index % 100,
+            "stamina": 50,
+            "mic_skill": 50,
+        }
+        for index in range(count)
+    )
+    source = tmp_path / f"roster{suffix}"
+    with source.open("w", encoding="utf-8") as handle:
+        if suffix == ".jsonl":
+            handle.writelines(json.dumps(entry) + "\n" for entry in entries)
+        else:
+            handle.write("[\n" + ",\n".join(json.dumps(entry) for entry in entries) + "\n]")
+
+    tracemalloc.start()
+    try:
+        seen = sum(1 for _ in data.iter_wrestlers(source))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert seen == count
+    assert peak < 1024 * 1024 < source.stat().st_size
+
+    state = GameState(data.iter_wrestlers(source), load_match_types())
+    assert len(state.roster) == count
+    assert data.load_wrestlers(source)[-1].id == f"w{count - 1}"
+
+
+def test_session_restreams_wrestlers_for_each_new_game(tmp_path: Path) -> None:
+    source = tmp_path / "roster.jsonl"
+    with source.open("w", encoding="utf-8") as handle:
+        for wrestler in data.load_wrestlers():
+            handle.write(json.dumps(wrestler.__dict__) + "\n")
+    streams = []
+
+    def stream() -> object:
+        streams.append(1)
+        return data.iter_wrestlers(source)
+
+    session = SessionManager(stream, load_match_types(), save_dir=tmp_path)
+    assert streams == []
+    first = session.new_game(1, "First")
+    second = session.new_game(2, "Second")
+    assert len(streams) == 2
+    assert list(first.roster) == list(second.roster) == [
+        wrestler.id for wrestler in data.load_wrestlers()
+    ]
+
+    with pytest.raises(ValueError, match="wrestler_iterator_not_reusable"):
+        SessionManager(data.iter_wrestlers(source), load_match_types(), save_dir=tmp_path)
+
+
+def test_data_packs_merge_by_id_and_report_conflicts(tmp_path: Path) -> None:
+    base = tmp_path / "base"
+    league = tmp_path / "league"
+    base.mkdir()
+    league.mkdir()
+    (base / "wrestlers.json").write_bytes((data.DATA_DIR / "wrestlers.json").read_bytes())
+    (base / "match_types.json").write_bytes(
+        (data.DATA_DIR / "match_types.json").read_bytes()
+    )
+    base_wrestlers = data.load_wrestlers(base / "wrestlers.json")
+    first = base_wrestlers[0]
+    (league / "wrestlers.jsonl").write_text(
+        json.dumps({"id": first.id, "popularity": 99, "name": first.name})
+        + "\n"
+        + json.dumps(
+            {
+                "id": "new-face",
+                "name": "New Face",
+                "alignment": "Face",
+                "popularity": 40,
+                "stamina": 70,
+                "mic_skill": 35,
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    merged = data.load_data_packs([base, league], cache_dir=tmp_path / "cache")
+
+    assert [wrestler.id for wrestler in merged.wrestlers] == [
+        *(wrestler.id for wrestler in base_wrestlers),
+        "new-face",
+    ]
+    assert merged.wrestlers[0].popularity == 99
+    assert merged.wrestlers[0].stamina == first.stamina
+    assert merged.match_types == data.load_match_types(base / "match_types.json")
+    assert merged.conflicts == (
+        data.DataConflict("wrestlers", first.id, "base", "league", ("popularity",)),
+    )
+    cached = data.cache_path(
+        [base / "wrestlers.json", base / "match_types.json", league / "wrestlers.jsonl"],
+        "packs",
+        tmp_path / "cache",
+    )
+    assert cached.exists()
+    assert data.load_data_packs([base, league], cache_dir=tmp_path / "cache") == merged
+
+
+def test_data_pack_new_id_with_partial_fields_names_the_pack(tmp_path: Path) -> None:
+    base = tmp_path / "base"
+    league = tmp_path / "league"
+    base.mkdir()
+    league.mkdir()
+    (base / "wrestlers.json").write_bytes((data.DATA_DIR / "wrestlers.json").read_bytes())
+    source = league / "wrestlers.jsonl"
+    source.write_text(json.dumps({"id": "new-face", "popularity": 40}) + "\n", encoding="utf-8")
+
+    with pytest.raises(ValueError) as error:
+        data.load_data_packs([base, league])
+    assert str(error.value) == (
+        f"incomplete_pack_entry: {source} new-face missing "
+        "name, alignment, stamina, mic_skill"
+    )
@@ -0,0 +1,76 @@
+"""Import-time budget for the headless (non-UI) modules."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+CORE_MODULES = (
+    "wrestlegm.data",
+    "wrestlegm.persistence",
+    "wrestlegm.session",
+    "wrestlegm.state",
+)
+# Loaded only on the code paths that need them.
+DEFERRED_MODULES = ("textual", "wrestlegm.ui", "sqlite3", "concurrent.futures")
+# Summed self time of the wrestlegm modules, best of a few runs.
+IMPORT_BUDGET_US = 75_000
+
+
+def _import_profile(code: str, pycache: Path) -> dict[str, int]:
+    """Run `code` under -X importtime in a fresh interpreter; return self times in µs.
+
+    Bytecode is cached under `pycache`, and the first run only warms it, so
+    source compilation never counts toward the budget.
+    """
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    command = [
+        sys.executable,
+        "-X",
+        f"pycache_prefix={pycache}",
+        "-X",
+        "importtime",
+        "-c",
+        code,
+    ]
+    subprocess.run(command, capture_output=True, check=True, env=env)
+    result = subprocess.run(
+        command,
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def test_core_modules_import_without_ui_and_within_budget(tmp_path: Path) -> None:
+    code = f"import {', '.join(CORE_MODULES)}"
+    profiles = [_import_profile(code, tmp_path) for _ in range(3)]
+
+    assert set(CORE_MODULES) <= profiles[0].keys()
+    for module in DEFERRED_MODULES:
+        assert module not in profiles[0]
+    own_time = min(
+        sum(time for name, time in profile.items() if name.startswith("wrestlegm"))
+        for profile in profiles
+    )
+    assert own_time < IMPORT_BUDGET_US
+
+
+def test_entry_point_parses_options_without_loading_the_ui(tmp_path: Path) -> None:
+    loaded = _import_profile("import main; main.parse_args(['--journal'])", tmp_path)
+
+    assert "main" in loaded
+    assert not any(name == "textual" or name.startswith("textual.") for name in loaded)
+    assert "wrestlegm.ui" not in loaded
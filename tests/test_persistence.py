@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import copy
+from dataclasses import replace
+import io
 from pathlib import Path
 import json
+import threading
 
 import pytest
 
-from wrestlegm import persistence
+from wrestlegm import binary_save, migrations, persistence
 from wrestlegm.data import load_match_types, load_wrestlers
-from wrestlegm.session import SessionManager
+from wrestlegm.jsonstream import JsonStreamReader
+from wrestlegm.session import BackgroundSaver, SessionManager
+from wrestlegm.state import GameState
 
-from tests.ui_test_utils import seed_show_card
+from tests.state_test_utils import build_large_roster, seed_rivalry_pairs, seed_show_card
 
 
 def test_save_load_round_trip_integrity(tmp_path: Path) -> None:
@@ -96,7 +102,7 @@ def test_load_rejects_unsupported_version(tmp_path: Path) -> None:
         tmp_path,
     )
     payload = {
-        "version": 1,
+        "version": persistence.SAVE_VERSION + 1,
         "slot": {"slot_index": 1, "name": "Test"},
         "state": {"show_index": 1, "show_card": [], "rng_seed": 1337},
     }
@@ -106,3 +112,769 @@ def test_load_rejects_unsupported_version(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError, match="unsupported_save_version"):
         session.load_game(1)
+
+
+def test_game_state_from_payload_matches_loaded_state(tmp_path: Path) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(wrestlers, match_types, save_dir=tmp_path)
+    state = session.new_game(1, "Test")
+
+    seed_show_card(state)
+    state.run_show()
+    payload = persistence.serialize_game_state(state)
+
+    hydrated = GameState.from_payload(payload, match_types)
+
+    assert hydrated.roster == state.roster
+    assert hydrated.show_index == state.show_index
+    assert hydrated.show_card == state.show_card
+    assert hydrated.rivalry_manager.rivalry_states == state.rivalry_manager.rivalry_states
+    assert hydrated.engine.seed == state.engine.seed
+    assert hydrated.engine.rng.getstate() == state.engine.rng.getstate()
+
+
+@pytest.mark.parametrize("save_format", ["binary", "binary-zlib", "binary-lzma"])
+def test_binary_save_round_trip(tmp_path: Path, save_format: str) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(wrestlers, match_types, save_dir=tmp_path)
+    state = session.new_game(1, "Binary", save_format=save_format)
+
+    seed_show_card(state)
+    state.run_show()
+    seed_show_card(state)
+    session.save_current_slot(state)
+
+    assert persistence.load_slot_index(tmp_path)[0].save_format == save_format
+    assert persistence.slot_path(1, tmp_path, save_format).exists()
+    json_payload = persistence.save_payload(state, 1, "Binary")
+    assert persistence.load_save_payload(1, tmp_path) == json.loads(json.dumps(json_payload))
+
+    loaded = session.load_game(1)
+
+    assert loaded.roster == state.roster
+    assert loaded.show_card == state.show_card
+    assert loaded.rivalry_manager.rivalry_states == state.rivalry_manager.rivalry_states
+    assert loaded.engine.rng.getstate() == state.engine.rng.getstate()
+
+
+def test_current_binary_save_is_decoded_once_per_load(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(wrestlers, match_types, save_dir=tmp_path, save_format="binary")
+    state = session.new_game(1, "Binary")
+    session.save_current_slot(state)
+    decodes: list[int] = []
+    original_decode = binary_save.decode_payload
+
+    def counting_decode(data: bytes) -> dict:
+        decodes.append(len(data))
+        return original_decode(data)
+
+    monkeypatch.setattr(binary_save, "decode_payload", counting_decode)
+    session.load_game(1)
+    assert len(decodes) == 1
+
+    # An older save still takes the full decode to migrate, once.
+    payload = persistence.save_payload(state, 1, "Binary")
+    payload["version"] = persistence.SAVE_VERSION - 1
+    path = persistence.slot_path(1, tmp_path, "binary")
+    path.write_bytes(binary_save.encode_payload(payload))
+    decodes.clear()
+    assert session.load_game(1).roster == state.roster
+    assert len(decodes) == 2
+    assert binary_save.read_header(path.read_bytes()).save_version == persistence.SAVE_VERSION
+
+
+def test_save_format_switch_replaces_slot_file(tmp_path: Path) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(wrestlers, match_types, save_dir=tmp_path)
+    state = session.new_game(1, "Switch")
+    session.save_current_slot(state)
+    assert persistence.slot_path(1, tmp_path).exists()
+
+    session.pending_save_format = "binary-zlib"
+    session.save_current_slot(state)
+
+    assert not persistence.slot_path(1, tmp_path).exists()
+    assert persistence.slot_path(1, tmp_path, "binary").exists()
+    assert session.load_game(1).roster == state.roster
+
+    session.clear_save_slot(1)
+    assert not persistence.slot_path(1, tmp_path, "binary").exists()
+
+
+def test_truncated_or_unknown_binary_save_is_corrupt(tmp_path: Path) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(wrestlers, match_types, save_dir=tmp_path, save_format="binary")
+    state = session.new_game(1, "Truncated")
+    session.save_current_slot(state)
+
+    path = persistence.slot_path(1, tmp_path, "binary")
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])
+
+    with pytest.raises(ValueError, match="corrupt_save_file"):
+        session.load_game(1)
+
+    older = bytearray(data)
+    older[len(binary_save.MAGIC)] = binary_save.FORMAT_VERSION - 1
+    path.write_bytes(bytes(older))
+    with pytest.raises(ValueError, match="corrupt_save_file"):
+        session.load_game(1)
+
+
+def test_journal_mode_appends_deltas_and_replays_on_load(tmp_path: Path) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(wrestlers, match_types, save_dir=tmp_path, journal_mode=True)
+    state = session.new_game(1, "Journal")
+    session.save_current_slot(state)
+    base_bytes = persistence.slot_path(1, tmp_path).read_bytes()
+
+    seed_show_card(state)
+    state.run_show()
+    session.save_current_slot(state)
+    seed_show_card(state)
+    session.save_current_slot(state)
+
+    journal = persistence.journal_path(1, tmp_path)
+    records = list(persistence.read_journal(journal))
+    assert len(records) == 2
+    assert persistence.slot_path(1, tmp_path).read_bytes() == base_bytes
+    assert records[0]["roster"]
+    assert records[1]["roster"] == []
+    assert records[1]["rivalry_states"] == []
+    assert persistence.load_slot_index(tmp_path)[0].last_saved_show_index == 1
+
+    with journal.open("ab") as handle:
+        handle.write(b'{"show_index": 99')
+
+    loaded = session.load_game(1)
+
+    assert loaded.roster == state.roster
+    assert loaded.show_index == state.show_index
+    assert loaded.rivalry_manager.rivalry_states == state.rivalry_manager.rivalry_states
+    assert loaded.rivalry_manager.cooldown_states == state.rivalry_manager.cooldown_states
+    assert loaded.engine.rng.getstate() == state.engine.rng.getstate()
+
+    session.save_current_slot(loaded)
+    assert len(persistence.read_journal(journal)) == 3
+
+    data = bytearray(journal.read_bytes())
+    data[data.index(b'"show_index"') + 14] ^= 0x01
+    journal.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="corrupt_save_file"):
+        session.load_game(1)
+
+
+def test_delta_records_replay_recovery_and_cooldown_ticks(tmp_path: Path) -> None:
+    from wrestlegm.sqlite_save import SqliteSaveStore
+
+    state = GameState(build_large_roster(40), load_match_types())
+    seed_rivalry_pairs(state)
+    for wrestler_id in list(state.roster)[:12]:
+        # Fresh enough for the same card three shows running.
+        state.roster[wrestler_id].stamina = 100
+    store = SqliteSaveStore(tmp_path / persistence.DATABASE_NAME)
+    store.save(state, 1, "Delta")
+    base = persistence.save_payload(state, 1, "Delta")
+    baseline = persistence.SaveBaseline.capture(state)
+
+    records = []
+    for _ in range(3):
+        seed_show_card(state)
+        state.run_show()
+        # Every record diffs against the same baseline, so they overlap.
+        records.append(baseline.delta_record(state))
+    store.save(state, 1, "Delta")
+    expected = persistence.save_payload(state, 1, "Delta")["state"]
+
+    def tables(saved: dict) -> dict:
+        # A cooldown that expires and restarts moves to the end of the manager's
+        # dict but keeps its place in a replay; loads key pairs, so order is moot.
+        return {
+            "roster": {entry["id"]: entry for entry in saved["roster"]},
+            **{
+                key: {(e["wrestler_a_id"], e["wrestler_b_id"]): e for e in saved[key]}
+                for key in ("rivalry_states", "cooldown_states")
+            },
+            "show_index": saved["show_index"],
+        }
+
+    final = records[-1]
+    assert {entry["id"] for entry in final["roster"]} == state.roster_changes_since(0)
+    assert len(final["roster"]) < len(state.roster)
+    assert len(final["cooldown_states"]) < len(expected["cooldown_states"])
+    assert "pairs_full" not in final
+    for replayed in (records, [final]):
+        payload = copy.deepcopy(base)
+        persistence.apply_journal_records(payload, replayed)
+        assert tables(payload["state"]) == tables(expected)
+    assert tables(store.load_payload(1)["state"]) == tables(expected)
+
+    # Without change history the record falls back to full tables.
+    state._roster_changes.clear()
+    state.rivalry_manager._changes.clear()
+    fallback = baseline.delta_record(state)
+    assert len(fallback["roster"]) == len(state.roster)
+    assert fallback["pairs_full"]
+    payload = copy.deepcopy(base)
+    persistence.apply_journal_records(payload, [fallback])
+    assert tables(payload["state"]) == tables(expected)
+    store.close()
+
+
+def test_journal_compaction_folds_into_new_base(tmp_path: Path) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(wrestlers, match_types, save_dir=tmp_path, journal_mode=True)
+    state = session.new_game(1, "Compact")
+    session.save_current_slot(state)
+    journal = session._journal
+    assert journal is not None
+    journal.compact_threshold = 1
+
+    seed_show_card(state)
+    state.run_show()
+    session.save_current_slot(state)
+    journal.wait_for_compaction()
+
+    assert not persistence.journal_path(1, tmp_path).exists()
+    assert not persistence.compacting_journal_path(1, tmp_path).exists()
+    base = persistence.decode_save_bytes(persistence.slot_path(1, tmp_path).read_bytes())
+    assert base["state"]["show_index"] == state.show_index
+    assert session.load_game(1).roster == state.roster
+
+
+def test_background_saver_coalesces_queued_jobs() -> None:
+    saver = BackgroundSaver()
+    release = threading.Event()
+    started = threading.Event()
+    ran: list[str] = []
+    completions: list[BaseException | None] = []
+
+    def blocking_job() -> None:
+        started.set()
+        release.wait(timeout=5)
+        ran.append("first")
+
+    saver.submit(blocking_job, completions.append)
+    assert started.wait(timeout=5)
+    saver.submit(lambda: ran.append("second"), completions.append)
+    saver.submit(lambda: ran.append("third"), completions.append)
+    release.set()
+
+    assert saver.flush(timeout=5)
+    assert ran == ["first", "third"]
+    assert completions == [None, None, None]
+
+
+def test_async_save_writes_snapshot_atomically(tmp_path: Path) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(wrestlers, match_types, save_dir=tmp_path)
+    state = session.new_game(1, "Async")
+    seed_show_card(state)
+    state.run_show()
+    expected_roster = {key: replace(value) for key, value in state.roster.items()}
+    done = threading.Event()
+
+    assert session.save_current_slot_async(state, lambda error: done.set())
+    seed_show_card(state)
+    state.run_show()
+
+    assert done.wait(timeout=5)
+    assert session.flush_saves(timeout=5)
+    assert not list(tmp_path.glob("*.tmp"))
+    assert session.load_game(1).roster == expected_roster
+
+
+def test_save_store_reuses_cached_index_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = persistence.SaveStore(tmp_path)
+    store.update_slot(
+        persistence.SaveSlotInfo(
+            slot_index=1, name="Cached", exists=True, last_saved_show_index=0
+        )
+    )
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def counting_read_text(self: Path, *args, **kwargs) -> str:
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    assert store.list_slots()[0].name == "Cached"
+    assert store.slot_info(1).name == "Cached"
+    assert reads == []
+
+    other = persistence.SaveStore(tmp_path)
+    other.update_slot(
+        persistence.SaveSlotInfo(
+            slot_index=1, name="Renamed", exists=True, last_saved_show_index=2
+        )
+    )
+    reads.clear()
+    assert store.slot_info(1).name == "Renamed"
+    assert reads == [store.index_path]
+
+
+def test_save_store_batch_takes_slot_files_lock_first(tmp_path: Path) -> None:
+    store = persistence.SaveStore(tmp_path)
+    acquired: list[bool] = []
+
+    def try_slot_files_lock() -> None:
+        got = persistence.SLOT_FILES_LOCK.acquire(blocking=False)
+        if got:
+            persistence.SLOT_FILES_LOCK.release()
+        acquired.append(got)
+
+    with store.batch():
+        # backup_slot takes SLOT_FILES_LOCK then the store lock; batch must too.
+        thread = threading.Thread(target=try_slot_files_lock)
+        thread.start()
+        thread.join()
+        assert store.backup_slot(1, 1, keep=1) is None
+    assert acquired == [False]
+
+
+def test_save_store_batch_writes_index_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = persistence.SaveStore(tmp_path)
+    writes: list[Path] = []
+    original_write = persistence.atomic_write_bytes
+
+    def counting_write(path: Path, data: bytes) -> None:
+        writes.append(path)
+        original_write(path, data)
+
+    monkeypatch.setattr(persistence, "atomic_write_bytes", counting_write)
+    with store.batch():
+        for slot_index in (1, 2, 3):
+            store.update_slot(
+                persistence.SaveSlotInfo(
+                    slot_index=slot_index,
+                    name=f"Slot {slot_index}",
+                    exists=True,
+                    last_saved_show_index=0,
+                )
+            )
+        assert writes == []
+        assert store.slot_info(2).name == "Slot 2"
+    assert writes == [store.index_path]
+
+    store.update_slot(store.slot_info(1))
+    assert writes == [store.index_path]
+    assert [slot.name for slot in persistence.SaveStore(tmp_path).list_slots()] == [
+        "Slot 1",
+        "Slot 2",
+        "Slot 3",
+    ]
+
+
+@pytest.mark.parametrize("save_format", ["json", "binary-zlib"])
+def test_save_metadata_reads_header_without_decoding_body(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, save_format: str
+) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(
+        wrestlers, match_types, save_dir=tmp_path, save_format=save_format
+    )
+    state = session.new_game(1, "Meta")
+    seed_show_card(state)
+    state.run_show()
+    session.save_current_slot(state)
+
+    def fail_decode(data: bytes) -> dict:
+        raise AssertionError("metadata read decoded the save body")
+
+    monkeypatch.setattr(persistence, "decode_save_bytes", fail_decode)
+    meta = persistence.read_save_metadata(1, tmp_path)
+
+    assert meta == persistence.SaveMetadata(
+        roster_size=len(state.roster),
+        show_count=1,
+        last_show_rating=state.last_show_rating,
+    )
+    assert session.slot_metadata(2) is None
+
+
+def test_save_metadata_follows_journal_and_legacy_saves(tmp_path: Path) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(wrestlers, match_types, save_dir=tmp_path, journal_mode=True)
+    state = session.new_game(1, "Journal")
+    session.save_current_slot(state)
+    seed_show_card(state)
+    state.run_show()
+    session.save_current_slot(state)
+
+    meta = persistence.read_save_metadata(1, tmp_path)
+    assert meta.show_count == 1
+    assert meta.last_show_rating == state.last_show_rating
+
+    payload = persistence.save_payload(state, 2, "Legacy")
+    del payload["meta"]
+    persistence.slot_path(2, tmp_path).write_text(json.dumps(payload), encoding="utf-8")
+    assert persistence.read_save_metadata(2, tmp_path) == persistence.SaveMetadata(
+        roster_size=len(state.roster),
+        show_count=1,
+        last_show_rating=state.last_show_rating,
+    )
+
+
+def test_sqlite_backend_round_trip_and_diff_saves(tmp_path: Path) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(
+        wrestlers, match_types, save_dir=tmp_path, save_backend="sqlite"
+    )
+    assert [slot.exists for slot in session.list_slots()] == [False]
+
+    state = session.new_game(1, "League")
+    session.save_current_slot(state)
+    seed_show_card(state)
+    state.run_show()
+    session.save_current_slot(state)
+    second = session.new_game(5, "Checkpoint")
+    session.save_current_slot(second)
+
+    slots = session.list_slots()
+    assert [(slot.slot_index, slot.exists) for slot in slots] == [
+        (1, True),
+        (5, True),
+        (6, False),
+    ]
+    assert slots[0].last_saved_show_index == 1
+    assert session.slot_metadata(1) == persistence.SaveMetadata(
+        roster_size=len(state.roster),
+        show_count=1,
+        last_show_rating=state.last_show_rating,
+    )
+    assert session._database.show_ratings(1) == [(1, state.last_show_rating)]
+
+    loaded = session.load_game(1)
+    assert list(loaded.roster) == list(state.roster)
+    assert loaded.roster == state.roster
+    assert loaded.rivalry_manager.rivalry_states == state.rivalry_manager.rivalry_states
+    assert loaded.rivalry_manager.cooldown_states == state.rivalry_manager.cooldown_states
+    assert loaded.engine.rng.getstate() == state.engine.rng.getstate()
+
+    session.clear_save_slot(1)
+    assert [slot.slot_index for slot in session.list_slots()] == [5, 6]
+    with pytest.raises(ValueError, match="empty_slot"):
+        session.load_game(1)
+
+
+def test_rng_state_is_packed_and_legacy_lists_still_load(tmp_path: Path) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(wrestlers, match_types, save_dir=tmp_path)
+    state = session.new_game(1, "Rng")
+    seed_show_card(state)
+    state.run_show()
+    session.save_current_slot(state)
+
+    payload = json.loads(persistence.slot_path(1, tmp_path).read_text(encoding="utf-8"))
+    packed = payload["state"]["rng_state"]
+    assert set(packed) == {"version", "words", "gauss_next"}
+    assert persistence.unpack_rng_state(packed) == state.engine.rng.getstate()
+
+    version, internal, gauss_next = state.engine.rng.getstate()
+    payload["state"]["rng_state"] = [version, list(internal), gauss_next]
+    del payload["meta"]
+    persistence.slot_path(1, tmp_path).write_text(json.dumps(payload), encoding="utf-8")
+    assert session.load_game(1).engine.rng.getstate() == state.engine.rng.getstate()
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda packed: packed.pop("words"),
+        lambda packed: packed.update(words=packed["words"][:-8]),
+        lambda packed: packed.update(words=packed["words"][:100]),
+        lambda packed: packed.update(words="not base64!"),
+        lambda packed: packed.update(words=42),
+    ],
+    ids=["missing", "truncated", "short", "garbage", "wrong-type"],
+)
+def test_malformed_rng_blob_is_a_corrupt_save(tmp_path: Path, damage) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(wrestlers, match_types, save_dir=tmp_path)
+    state = session.new_game(1, "Rng")
+    session.save_current_slot(state)
+
+    path = persistence.slot_path(1, tmp_path)
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    damage(payload["state"]["rng_state"])
+    del payload["meta"]
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    with pytest.raises(ValueError, match="corrupt_save_file"):
+        session.load_game(1)
+
+
+def test_json_stream_reader_walks_values_across_chunk_boundaries() -> None:
+    document = {
+        "alpha": [1, 23456, {"nested": ["x", None, True]}, -7.5e3],
+        "beta": "a long string value with \"escapes\" and unicode ★",
+        "gamma": {},
+        "delta": [],
+    }
+    reader = JsonStreamReader(io.StringIO(json.dumps(document, indent=2)), chunk_size=3)
+    seen: dict[str, object] = {}
+    for key in reader.iter_object():
+        if key == "alpha":
+            seen[key] = list(reader.iter_array())
+        elif key == "gamma":
+            reader.skip()
+        else:
+            seen[key] = reader.value()
+
+    assert seen == {key: document[key] for key in ("alpha", "beta", "delta")}
+    assert reader.peek() == ""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 5, 7])
+def test_json_stream_reader_keeps_numbers_split_across_chunks(chunk_size: int) -> None:
+    text = "[1.5,2,-12.75,3e10,-4.25E-3,6e+2,-7,123456789,0.5]"
+    reader = JsonStreamReader(io.StringIO(text), chunk_size=chunk_size)
+
+    assert list(reader.iter_array()) == json.loads(text)
+
+
+def test_json_stream_reader_keeps_number_split_at_default_chunk_edge() -> None:
+    padding = " " * (65536 - len("[") - len("12."))
+    reader = JsonStreamReader(io.StringIO("[" + padding + "12.75, 3]"))
+
+    assert list(reader.iter_array()) == [12.75, 3]
+
+
+def test_older_json_saves_migrate_in_place_once(tmp_path: Path) -> None:
+    wrestlers = load_wrestlers()
+    match_types = load_match_types()
+    session = SessionManager(wrestlers, match_types, save_dir=tmp_path)
+    state = session.new_game(1, "Legacy")
+    seed_show_card(state)
+    state.run_show()
+    session.save_current_slot(state)
+
+    path = persistence.slot_path(1, tmp_path)
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    del payload["meta"]
+    del payload["state"]["last_show_rating"]
+    version, internal, gauss_next = state.engine.rng.getstate()
+    payload["state"]["rng_state"] = [version, list(internal), gauss_next]
+    payload["version"] = 2
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+    loaded = session.load_game(1)
+
+    upgraded = json.loads(path.read_text(encoding="utf-8"))
+    assert upgraded["version"] == persistence.SAVE_VERSION
+    assert next(iter(upgraded)) == "meta"
+    assert upgraded["state"]["roster"] == payload["state"]["roster"]
+    assert loaded.roster == state.roster
+    assert loaded.engine.rng.getstate() == state.engine.rng.getstate()
+    assert persistence.read_save_metadata(1, tmp_path).roster_size == len(state.roster)
+
+    stamp = path.stat().st_mtime_ns
+    session.load_game(1)
+    assert path.stat().st_mtime_ns == stamp
+
+
+def test_version_one_payload_migrates_in_memory() -> None:
+    payload = {
+        "version": 1,
+        "slot": {"slot_index": 1, "name": "Old"},
+        "state": {"show_index": 4, "show_card": [], "rng_seed": 1337},
+    }
+
+    migrated = migrations.migrate_payload(payload)
+
+    assert migrated["version"] == persistence.SAVE_VERSION
+    assert migrated["state"]["rivalry_states"] == []
+    assert migrated["meta"]["show_count"] == 3
+    with pytest.raises(ValueError, match="unsupported_save_version"):
+        migrations.migrate_payload({"version": persistence.SAVE_VERSION + 1})
+
+
+def test_checksums_catch_tampered_saves_before_load(tmp_path: Path) -> None:
+    session = SessionManager(load_wrestlers(), load_match_types(), save_dir=tmp_path)
+    state = session.new_game(1, "Json")
+    seed_show_card(state)
+    state.run_show()
+    session.save_current_slot(state)
+    session.new_game(2, "Binary", save_format="binary")
+    session.save_current_slot(state)
+
+    assert all(result.ok and result.checked for result in persistence.verify_all_slots(tmp_path))
+
+    json_path = persistence.slot_path(1, tmp_path)
+    data = json_path.read_bytes()
+    name = next(iter(state.roster.values())).name.encode("utf-8")
+    json_path.write_bytes(data.replace(name, name[:-1] + b"#", 1))
+    binary_path = persistence.slot_path(2, tmp_path, "binary")
+    data = bytearray(binary_path.read_bytes())
+    data[-5] ^= 0xFF
+    binary_path.write_bytes(bytes(data))
+
+    results = {result.slot_index: result for result in persistence.verify_all_slots(tmp_path)}
+    assert results[1].bad_sections == ("roster", "body")
+    assert results[2].bad_sections == ("body",)
+    for slot_index in (1, 2):
+        with pytest.raises(ValueError, match="corrupt_save_file"):
+            session.load_game(slot_index)
+
+
+def test_json_meta_past_the_header_prefix_fails_verification(tmp_path: Path) -> None:
+    session = SessionManager(load_wrestlers(), load_match_types(), save_dir=tmp_path)
+    state = session.new_game(1, "Padded")
+    session.save_current_slot(state)
+
+    path = persistence.slot_path(1, tmp_path)
+    payload = persistence.decode_save_bytes(path.read_bytes())
+    payload["meta"]["note"] = "x" * persistence.METADATA_PREFIX_BYTES
+    path.write_bytes(persistence.encode_save_bytes(payload))
+
+    result = persistence.verify_save_file(path, 1)
+    assert result.checked
+    assert result.bad_sections == ("header",)
+    with pytest.raises(ValueError, match="corrupt_save_file"):
+        session.load_game(1)
+
+
+def test_verify_covers_journals_and_malformed_checksums(tmp_path: Path) -> None:
+    session = SessionManager(
+        load_wrestlers(), load_match_types(), save_dir=tmp_path, journal_mode=True
+    )
+    state = session.new_game(1, "Journal")
+    session.save_current_slot(state)
+    for _ in range(2):
+        seed_show_card(state)
+        state.run_show()
+        session.save_current_slot(state)
+    journal = persistence.journal_path(1, tmp_path)
+    rotated = persistence.compacting_journal_path(1, tmp_path)
+    rotated.write_bytes(journal.read_bytes() + b"0badc0de {")
+
+    results = persistence.verify_all_slots(tmp_path)
+    assert [result.path for result in results] == sorted(
+        [persistence.slot_path(1, tmp_path), journal, rotated]
+    )
+    assert all(result.ok and result.checked for result in results)
+
+    lines = journal.read_bytes().split(b"\n")
+    lines[1] = lines[1].replace(b'"show_index":', b'"show_index":9', 1)
+    journal.write_bytes(b"\n".join(lines))
+    results = {result.path: result for result in persistence.verify_all_slots(tmp_path)}
+    assert results[journal].bad_sections == ("record 2",)
+    assert results[rotated].ok
+
+    path = persistence.slot_path(1, tmp_path)
+    payload = persistence.decode_save_bytes(path.read_bytes())
+    malformed = (
+        {"body": 1, "sections": []},
+        {"body": 1, "sections": {"roster": [0, "x", 1]}},
+        "crc",
+    )
+    for checksum in malformed:
+        payload["meta"]["checksum"] = checksum
+        path.write_bytes(
+            persistence.json_save_head(payload["meta"])
+            + json.dumps({key: payload[key] for key in ("slot", "state", "version")}).encode()
+        )
+        result = persistence.verify_save_file(path, 1)
+        assert result.checked
+        assert result.bad_sections == ("header",)
+
+
+def test_verify_runs_sqlite_integrity_check(tmp_path: Path) -> None:
+    session = SessionManager(
+        load_wrestlers(), load_match_types(), save_dir=tmp_path, save_backend="sqlite"
+    )
+    state = session.new_game(1, "Sqlite")
+    session.save_current_slot(state)
+    database = tmp_path / persistence.DATABASE_NAME
+
+    assert [(result.path, result.ok) for result in persistence.verify_all_slots(tmp_path)] == [
+        (database, True)
+    ]
+
+    session._store.close()
+    data = bytearray(database.read_bytes())
+    data[:16] = b"not a database!!"
+    database.write_bytes(bytes(data))
+    (result,) = persistence.verify_all_slots(tmp_path)
+    assert result.slot_index == 0
+    assert result.bad_sections == ("integrity",)
+
+
+def test_autosave_runs_every_n_shows_and_rotates_backups(tmp_path: Path) -> None:
+    now = [0.0]
+    session = SessionManager(
+        load_wrestlers(),
+        load_match_types(),
+        save_dir=tmp_path,
+        autosave_every=2,
+        autosave_interval=60.0,
+        backup_count=1,
+        clock=lambda: now[0],
+    )
+    state = session.new_game(1, "Auto")
+    store = persistence.get_save_store(tmp_path)
+    session.save_current_slot(state)
+    assert [path.name for path in store.list_backups(1)] == ["show_000001"]
+    marker = store.list_backups(1)[0] / "marker"
+    marker.touch()
+    session.save_current_slot(state)
+    assert marker.exists()
+
+    saved = []
+    for _ in range(2):
+        seed_show_card(state)
+        state.run_show()
+        saved.append(session.show_completed(state))
+    assert saved == [False, True]
+    assert session.flush_saves(timeout=5)
+    assert session.load_game(1).show_index == state.show_index
+    assert [path.name for path in store.list_backups(1)] == ["show_000003"]
+
+    assert not session.show_completed(state)
+    now[0] = 61.0
+    assert session.show_completed(state)
+    assert session.flush_saves(timeout=5)
+    assert (store.list_backups(1)[0] / "slot_1.json").exists()
+
+    session.clear_save_slot(1)
+    assert store.list_backups(1) == []
+
+
+def test_autosave_saves_a_new_slot_first_and_unsaved_shows_on_leave(tmp_path: Path) -> None:
+    session = SessionManager(
+        load_wrestlers(), load_match_types(), save_dir=tmp_path, autosave_every=3
+    )
+    state = session.new_game(1, "First")
+    saved = []
+    for _ in range(2):
+        seed_show_card(state)
+        state.run_show()
+        saved.append(session.show_completed(state))
+    assert saved == [True, False]
+    assert session.flush_saves(timeout=5)
+    assert persistence.load_slot_index(tmp_path)[0].last_saved_show_index == 1
+
+    assert session.save_unsaved_shows(state)
+    loaded = session.load_game(1)
+    assert loaded.show_index == state.show_index
+    assert not session.save_unsaved_shows(loaded)
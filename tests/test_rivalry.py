@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import pytest
+
 from wrestlegm import constants
 from wrestlegm.models import (
     Match,
     MatchTypeDefinition,
     MatchTypeModifiers,
     Promo,
+    PairKey,
     RivalryState,
     CooldownState,
+    Show,
     WrestlerDefinition,
 )
 from wrestlegm.models import normalize_pair
+from wrestlegm.rivalries import RIVALRY_ORDERS, RivalryIndex, RivalryManager
 from wrestlegm.state import GameState
 
 
@@ -107,3 +112,63 @@ def test_rivalry_emojis_for_match_ordering() -> None:
 
     emojis = state.rivalry_emojis_for_match(["a", "b", "c"])
     assert emojis == "⚡🧊💥"
+
+
+def seed_large_rivalries(manager: RivalryManager, pair_count: int) -> list[PairKey]:
+    keys = [normalize_pair(f"w{n:06d}", f"w{n + 1:06d}") for n in range(pair_count)]
+    for n, key in enumerate(keys):
+        if n % 3:
+            manager.rivalry_states[key] = RivalryState(
+                *key, rivalry_value=1 + n % constants.RIVALRY_LEVEL_CAP
+            )
+        else:
+            manager.cooldown_states[key] = CooldownState(
+                *key, remaining_shows=1 + n % constants.COOLDOWN_SHOWS
+            )
+    return keys
+
+
+def expected_page(manager: RivalryManager, order: str) -> list[PairKey]:
+    if order == "heat":
+        return sorted(
+            manager.rivalry_states,
+            key=lambda key: (-manager.rivalry_states[key].rivalry_value, key),
+        )
+    return sorted(
+        manager.cooldown_states,
+        key=lambda key: (manager.cooldown_states[key].remaining_shows, key),
+    )
+
+
+def test_rivalry_index_pages_follow_advance_incrementally(monkeypatch) -> None:
+    manager = RivalryManager()
+    keys = seed_large_rivalries(manager, 120_000)
+    index = RivalryIndex(manager)
+
+    assert index.count("heat") == len(manager.rivalry_states)
+    assert index.page("heat", 0, 20) == expected_page(manager, "heat")[:20]
+    assert index.page("expiry", 500, 20) == expected_page(manager, "expiry")[500:520]
+    with pytest.raises(ValueError, match="unknown_rivalry_order"):
+        index.page("name", 0, 20)
+
+    rebuilds: list[int] = []
+    build = RivalryIndex._build
+    monkeypatch.setattr(
+        RivalryIndex, "_build", lambda self: rebuilds.append(1) or build(self)
+    )
+    for show_index in range(constants.COOLDOWN_SHOWS + 1):
+        matches = [
+            Match(
+                wrestler_ids=list(keys[n]),
+                match_category_id="singles",
+                match_type_id="standard",
+            )
+            for n in (0, 1, 4, 8 + show_index)
+        ]
+        manager.advance(Show(show_index, matches, [], 0.0))
+        index.sync()
+        for order in RIVALRY_ORDERS:
+            assert index.count(order) == len(expected_page(manager, order))
+            assert index.page(order, 0, 50) == expected_page(manager, order)[:50]
+    assert rebuilds == []
+    assert index.page("expiry", 0, 1000) == expected_page(manager, "expiry")[:1000]
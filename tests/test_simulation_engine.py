@@ -15,6 +15,7 @@ from wrestlegm.models import (
     WrestlerDefinition,
     WrestlerState,
 )
+from wrestlegm.preview import preview_match, preview_promo, projected_show_rating
 from wrestlegm.sim import (
     AlignmentModifier,
     MatchContext,
@@ -369,6 +370,42 @@ class TestShowSimulation:
         assert engine.aggregate_show_rating([]) == 0.0
 
 
+class TestPreview:
+    def test_match_preview_matches_simulated_odds_and_mean_rating(self) -> None:
+        roster_state = build_roster_state()
+        match_type_map = {m.id: m for m in build_match_types()}
+        match = Match(wrestler_ids=["a", "b", "c"], match_category_id="triple-threat", match_type_id="singles")
+        rivalry = RivalryRatingContext(active_pairs=1)
+
+        preview = preview_match(match, roster_state, match_type_map, rivalry)
+
+        engine = SimulationEngine(seed=7)
+        wrestlers = [roster_state[wrestler_id] for wrestler_id in match.wrestler_ids]
+        _, _, debug = engine.simulate_outcome(wrestlers, match_type_map["singles"].modifiers)
+        assert list(preview.win_odds.values()) == debug.p_final
+        assert abs(sum(preview.win_odds.values()) - 1.0) < 1e-9
+
+        samples = 4000
+        total = 0.0
+        for _ in range(samples):
+            total += engine.simulate_match(match, roster_state, match_type_map, rivalry).rating
+        assert abs(total / samples - preview.expected_rating) < 0.02
+
+    def test_promo_preview_and_projection(self) -> None:
+        roster_state = build_roster_state()
+        engine = SimulationEngine(seed=11)
+        samples = 4000
+        total = 0.0
+        for _ in range(samples):
+            total += engine.simulate_promo(Promo(wrestler_id="c"), roster_state).rating
+        preview = preview_promo(Promo(wrestler_id="c"), roster_state)
+
+        assert preview.win_odds == {}
+        assert abs(total / samples - preview.expected_rating) < 0.02
+        assert projected_show_rating([None, preview, None]) == preview.expected_rating
+        assert projected_show_rating([None, None]) is None
+
+
 class TestMutation:
     def test_clamp_and_recovery(self) -> None:
         roster = [
@@ -430,10 +467,17 @@ class TestMutation:
         )
 
         applier = ShowApplier()
-        applier.apply(show, roster_state)
+        changed = applier.apply(show, roster_state)
 
         assert roster_state["a"].popularity == 100
         assert roster_state["a"].stamina == 15
         assert roster_state["b"].popularity == 0
         assert roster_state["b"].stamina == 0
         assert roster_state["c"].stamina == 100
+        # Recovery is implied for non-participants, so only the card is reported.
+        assert changed == {"a", "b"}
+
+        rested = Show(show_index=2, scheduled_slots=[], results=[], show_rating=0.0)
+        assert applier.apply(rested, roster_state) == set()
+        assert roster_state["a"].stamina == 15 + constants.STAMINA_RECOVERY_PER_SHOW
+        assert roster_state["b"].stamina == constants.STAMINA_RECOVERY_PER_SHOW
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-from wrestlegm import constants
+import pytest
+
+from wrestlegm import constants, search
+from wrestlegm.data import load_wrestlers
 from wrestlegm.models import Match, MatchTypeDefinition, MatchTypeModifiers, WrestlerDefinition
+from wrestlegm.preview import PreviewCache
 from wrestlegm.state import GameState
 
+from tests.state_test_utils import build_large_roster, seed_show_card
+
 
 def build_match_type(allowed_categories: list[str] | None = None) -> MatchTypeDefinition:
     modifiers = MatchTypeModifiers(
@@ -81,3 +87,201 @@ def test_validate_match_type_category_restriction() -> None:
         match_type_id="multi",
     )
     assert "invalid_match_type_category" in state.validate_match(match, slot_index=0)
+
+
+def test_roster_changes_are_tracked_per_show() -> None:
+    state = GameState(build_large_roster(40), [build_match_type()])
+    assert state.roster_changes_since(0) == set()
+
+    seed_show_card(state)
+    before = {wrestler_id: (w.popularity, w.stamina) for wrestler_id, w in state.roster.items()}
+    state.run_show()
+
+    changed = state.roster_changes_since(0)
+    booked = {
+        wrestler_id
+        for result in state.last_show.results
+        for wrestler_id in result.stat_deltas
+    }
+    assert changed == booked
+    for wrestler_id, wrestler in state.roster.items():
+        popularity, stamina = before[wrestler_id]
+        if wrestler_id not in changed:
+            # Everyone off the card only recovered stamina.
+            assert wrestler.popularity == popularity
+            assert wrestler.stamina == min(
+                100, stamina + constants.STAMINA_RECOVERY_PER_SHOW
+            )
+    assert state.roster_changes_since(state.roster_version) == set()
+    state._roster_changes.clear()
+    assert state.roster_changes_since(0) is None
+
+
+def test_roster_index_matches_word_prefixes_and_facets() -> None:
+    state = GameState(build_large_roster(100_000), [build_match_type()])
+    tired = [f"w{n:06d}" for n in range(0, 100_000, 1000)]
+    for wrestler_id in tired:
+        state.roster[wrestler_id].stamina = constants.STAMINA_MIN_BOOKABLE
+    index = state.roster_index
+
+    tens = [f"w{n:06d}" for n in range(42420, 42430)]
+    assert index.search("wrestler 4242") == ["w004242", *tens]
+    assert index.search("W04242") == tens
+    assert index.search("4242 wrest", alignment="Face") == tens[1::2]
+    assert index.search("nobody") == []
+    assert len(index.search(alignment="Face")) == 50_000
+    assert index.search(stamina="fatigued") == tired
+    assert index.search("wrestler 1000", stamina="bookable") == [
+        f"w{n:06d}" for n in range(10001, 10010)
+    ]
+    assert len(index.search(stamina="bookable")) == 100_000 - len(tired)
+    assert state.roster_index is index
+
+
+def test_roster_index_tolerates_one_typo_per_word() -> None:
+    state = GameState(load_wrestlers(), [build_match_type()])
+    index = state.roster_index
+
+    assert index.search("kenyy meag") == ["kenny-o-mega"]
+    assert index.search("shidazle") == ["hikaru-shidazzle"]
+    assert index.search("gnochi") == ["claudio-castagnocchi"]
+    # Exact prefixes win, and short or far-off words do not widen the match.
+    assert index.search("ha") == ["hammock-page"]
+    assert index.search("kexxy") == []
+    assert index.search("nobody") == []
+
+    large = GameState(build_large_roster(100_000), [build_match_type()]).roster_index
+    assert large.search("wrestelr 4242") == large.search("wrestler 4242")
+
+
+def test_roster_index_follows_stat_changes() -> None:
+    state = GameState(build_large_roster(40), [build_match_type()])
+    for wrestler in state.roster.values():
+        wrestler.stamina = constants.STAMINA_MIN_BOOKABLE + 2
+    index = state.roster_index
+    assert index.search(stamina="fatigued") == []
+    seed_show_card(state)
+    state.run_show()
+
+    assert state.roster_index is index
+    assert index.search(stamina="fatigued")
+    assert set(index.search(stamina="fatigued")) == {
+        wrestler_id
+        for wrestler_id, wrestler in state.roster.items()
+        if wrestler.stamina <= constants.STAMINA_MIN_BOOKABLE
+    }
+
+
+def test_roster_sort_orders_follow_stat_changes() -> None:
+    state = GameState(build_large_roster(40), [build_match_type()])
+    index = state.roster_index
+    position = {wrestler_id: n for n, wrestler_id in enumerate(state.roster)}
+
+    def expected(key: str) -> list[str]:
+        return sorted(
+            state.roster,
+            key=lambda wrestler_id: (
+                -getattr(state.roster[wrestler_id], key),
+                position[wrestler_id],
+            ),
+        )
+
+    for key in ("popularity", "stamina", "mic_skill"):
+        assert index.search(sort=key) == expected(key)
+    entries = index._sort_entries["popularity"]
+
+    seed_show_card(state)
+    state.run_show()
+
+    assert state.roster_index is index
+    assert index._sort_entries["popularity"] is entries
+    for key in ("popularity", "stamina", "mic_skill"):
+        assert index.search(sort=key) == expected(key)
+    matches = set(index.search("wrestler 1"))
+    assert index.search("wrestler 1", sort="stamina") == [
+        wrestler_id for wrestler_id in expected("stamina") if wrestler_id in matches
+    ]
+
+
+def test_roster_sorts_refile_only_the_keys_a_show_changed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    state = GameState(build_large_roster(5_000), [build_match_type()])
+    rested_id = list(state.roster)[-1]
+    state.roster[rested_id].stamina = constants.STAMINA_MIN_BOOKABLE
+    index = state.roster_index
+    assert index.search(stamina="fatigued") == [rested_id]
+    for key in ("popularity", "stamina", "mic_skill"):
+        index.sort_order(key)
+    filed = {key: set(entries) for key, entries in index._sort_entries.items()}
+    sorts = []
+    build = search._sort_entries
+    monkeypatch.setattr(
+        search, "_sort_entries", lambda values: sorts.append(1) or build(values)
+    )
+
+    seed_show_card(state)
+    state.run_show()
+    changed = state.roster_changes_since(0)
+    assert state.roster_index is index
+    assert 0 < len(changed) < 20
+
+    # Only the card's new popularity values are re-filed, with no full sort;
+    # recovery drops the stamina sort until it is next used.
+    assert sorts == []
+    refiled = set(index._sort_entries["popularity"]) - filed["popularity"]
+    assert len(refiled) <= len(changed)
+    assert set(index._sort_entries["mic_skill"]) == filed["mic_skill"]
+    assert "stamina" not in index._sort_entries
+    assert rested_id not in index.search(stamina="fatigued")
+    position = {wrestler_id: n for n, wrestler_id in enumerate(state.roster)}
+    for key in ("popularity", "stamina", "mic_skill"):
+        assert index.sort_order(key) == sorted(
+            state.roster,
+            key=lambda wrestler_id: (
+                -getattr(state.roster[wrestler_id], key),
+                position[wrestler_id],
+            ),
+        )
+    assert sorts == [1]
+
+
+def test_streamed_show_matches_run_show() -> None:
+    eager = GameState(build_large_roster(20), [build_match_type()])
+    streamed = GameState(build_large_roster(20), [build_match_type()])
+    seed_show_card(eager)
+    seed_show_card(streamed)
+    expected = eager.run_show()
+
+    show = streamed.begin_show()
+    revealed = [len(show.results) for _ in streamed.iter_show_results(show)]
+    assert revealed == list(range(1, constants.SHOW_SLOT_COUNT + 1))
+    assert show.show_rating is None
+    assert streamed.show_index == 1
+
+    streamed.finish_show(show)
+    assert show.results == expected.results
+    assert show.show_rating == expected.show_rating
+    assert streamed.last_show is show
+    assert streamed.roster == eager.roster
+
+
+def test_preview_cache_reuses_slots_until_roster_changes() -> None:
+    state = GameState(build_large_roster(20), [build_match_type()])
+    seed_show_card(state)
+    cache = PreviewCache()
+    card = list(state.show_card)
+    assert cache.cached(state, card) is None
+
+    previews = cache.previews(state, card)
+    assert cache.cached(state, card) == previews
+    assert cache.cached(state, [None, card[0]]) == [None, previews[0]]
+    moved = Match(
+        wrestler_ids=list(card[0].wrestler_ids),
+        match_category_id=card[0].match_category_id,
+        match_type_id=card[0].match_type_id,
+    )
+    assert cache.get(state, moved) is previews[0]
+
+    state.run_show()
+    assert cache.get(state, moved) is None
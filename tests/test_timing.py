@@ -0,0 +1,88 @@
+"""Handler timing tests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+from wrestlegm.timing import HandlerTimings, percentile
+
+
+class Panel:
+    def compose(self):
+        yield "title"
+        yield "body"
+
+    def on_mount(self) -> str:
+        return "mounted"
+
+    async def action_save(self, name: str) -> str:
+        return f"saved {name}"
+
+    def helper(self) -> str:
+        return "untimed"
+
+    def paint(self) -> str:
+        return "painted"
+
+    async def _dispatch_message(self, message: Message) -> str:
+        return getattr(self, message.handler_name)()
+
+
+class Message:
+    def __init__(self, handler_name: str) -> None:
+        self.handler_name = handler_name
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    samples = [float(value) for value in range(1, 101)]
+    assert percentile(samples, 0.5) == 50.0
+    assert percentile(samples, 0.95) == 95.0
+    assert percentile([3.0], 0.95) == 3.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_rolling_window_keeps_recent_samples_and_lifetime_count() -> None:
+    timings = HandlerTimings(window=4)
+    for seconds in (1.0, 1.0, 1.0, 0.001, 0.002, 0.003, 0.004):
+        timings.record("Screen.refresh_view", seconds)
+
+    row = timings.summary()["Screen.refresh_view"]
+    assert row["count"] == 7
+    assert row["max_ms"] == 4.0
+    assert row["p50_ms"] == 2.0
+
+
+def test_instrument_times_one_instance_and_restores_it(tmp_path: Path) -> None:
+    timings = HandlerTimings()
+    panel = Panel()
+    other = Panel()
+    timings.instrument(panel, {"paint": "frame"})
+    timings.instrument(panel, {"paint": "frame"})
+
+    assert list(panel.compose()) == ["title", "body"]
+    assert asyncio.run(panel._dispatch_message(Message("on_mount"))) == "mounted"
+    assert asyncio.run(panel._dispatch_message(Message("helper"))) == "untimed"
+    assert asyncio.run(panel.action_save("slot")) == "saved slot"
+    assert panel.paint() == "painted"
+    assert list(other.compose()) == ["title", "body"]
+    assert other.paint() == "painted"
+    assert set(timings.summary()) == {
+        "Panel.compose",
+        "Panel.on_mount",
+        "Panel.action_save",
+        "Panel.frame",
+    }
+    assert timings.summary()["Panel.compose"]["count"] == 1
+    assert not hasattr(Panel.compose, "__wrapped__")
+
+    timings.restore()
+    assert vars(panel) == {}
+    panel.paint()
+    assert timings.summary()["Panel.frame"]["count"] == 1
+
+    path = tmp_path / "timings.json"
+    timings.dump(path)
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    assert payload["handlers"]["Panel.on_mount"]["count"] == 1
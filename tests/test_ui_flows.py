@@ -2,20 +2,37 @@
 
 from __future__ import annotations
 
-from wrestlegm import constants
+import json
+import threading
+
+import main
+from wrestlegm import constants, persistence
 from wrestlegm.ui import (
     BookingHubScreen,
+    CellCache,
+    ErrorModal,
     GameHubScreen,
     MainMenuScreen,
     MatchBookingScreen,
+    MatchCategorySelectionScreen,
     NameSaveSlotModal,
     OverwriteSaveSlotModal,
     ResultsScreen,
+    RIVALRY_PAGE_SIZE,
+    RivalryScreen,
     RosterScreen,
     SaveSlotSelectionScreen,
+    TimingsModal,
     WrestleGMApp,
+    WrestlerSelectionScreen,
 )
+from wrestlegm.state import GameState
 
+from tests.state_test_utils import (
+    build_large_roster,
+    seed_rivalry_pairs,
+    seed_show_card,
+)
 from tests.ui_test_utils import (
     TestWrestleGMApp,
     VIEWPORT_SIZE,
@@ -24,13 +41,14 @@ from tests.ui_test_utils import (
     open_booking_hub,
     open_match_booking,
     open_promo_booking,
+    open_rivalries,
     open_roster,
     run_async,
-    seed_show_card,
     select_match_category,
     select_wrestler,
     start_new_game,
     wait_for_condition,
+    wait_for_previews,
     wait_for_screen,
 )
 
@@ -85,11 +103,23 @@ def test_core_flow_new_game_booking_results_roster() -> None:
 
             booking_hub = app.screen
             assert not booking_hub.run_button.disabled
+            saves = []
+            save_async = app.session.save_current_slot_async
+            app.session.save_current_slot_async = lambda state, on_complete=None: (
+                saves.append(state.show_index) or save_async(state, on_complete)
+            )
             await pilot.press("r")
             await wait_for_screen(pilot, ResultsScreen)
+            results = app.screen
+            await wait_for_condition(pilot, lambda: not results.is_simulating)
+            assert app.state.last_show is results.show
+            assert results.show_rating.content.startswith("Show Rating")
 
             await pilot.press("enter")
             await wait_for_screen(pilot, GameHubScreen)
+            assert app.session.flush_saves(timeout=5)
+            assert saves == [2]
+            assert app.session.list_slots()[0].exists
 
     run_async(run_flow())
 
@@ -99,7 +129,116 @@ def test_app_bootstraps_without_errors() -> None:
 
     app = WrestleGMApp()
     assert app.session is not None
+    assert app._state is None
     assert app.state is not None
+    assert app.state is app.state
+
+
+def test_save_format_option_applies_to_new_slots(tmp_path) -> None:
+    """Ensure the --save-format switch picks the format new slots are written in."""
+
+    async def run_flow() -> None:
+        app = main.build_app(["--save-dir", str(tmp_path), "--save-format", "binary-zlib"])
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            await start_new_game(pilot)
+            app.save_current_slot()
+            assert app.session.flush_saves(timeout=5)
+            slot = app.session.list_slots()[0]
+            assert slot.exists
+            assert slot.save_format == "binary-zlib"
+            assert (tmp_path / "slot_1.sav").exists()
+            assert not (tmp_path / "slot_1.json").exists()
+
+    run_async(run_flow())
+
+
+def test_journal_option_appends_later_saves(tmp_path) -> None:
+    """Ensure the --journal switch turns saves after the first into journal records."""
+
+    async def run_flow() -> None:
+        app = main.build_app(["--save-dir", str(tmp_path), "--journal"])
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            await start_new_game(pilot)
+            app.save_current_slot()
+            assert app.session.flush_saves(timeout=5)
+            assert not (tmp_path / "slot_1.journal").exists()
+            seed_show_card(app.state)
+            app.state.run_show()
+            app.save_current_slot()
+            assert app.session.flush_saves(timeout=5)
+            assert (tmp_path / "slot_1.journal").exists()
+            assert app.session.list_slots()[0].last_saved_show_index == 1
+
+    run_async(run_flow())
+
+
+def test_sqlite_backend_option_lists_unlimited_slots(tmp_path) -> None:
+    """Ensure --save-backend sqlite saves into the database and offers a new slot."""
+
+    async def run_flow() -> None:
+        app = main.build_app(["--save-dir", str(tmp_path), "--save-backend", "sqlite"])
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            await start_new_game(pilot)
+            app.save_current_slot()
+            assert app.session.flush_saves(timeout=5)
+            assert (tmp_path / "saves.sqlite3").exists()
+            assert not (tmp_path / "slot_1.json").exists()
+            slots = app.session.list_slots()
+            assert [(slot.slot_index, slot.exists) for slot in slots] == [
+                (1, True),
+                (2, False),
+            ]
+
+    run_async(run_flow())
+
+
+async def play_seeded_show(pilot) -> None:
+    """Book a deterministic card from the hub and play it through to the game hub."""
+
+    await open_booking_hub(pilot)
+    seed_show_card(pilot.app.state)
+    await pilot.press("r")
+    await wait_for_screen(pilot, ResultsScreen)
+    results = pilot.app.screen
+    await wait_for_condition(pilot, lambda: not results.is_simulating)
+    await pilot.press("enter")
+    await wait_for_screen(pilot, GameHubScreen)
+
+
+def test_scheduled_autosave_keeps_shows_when_leaving_early(tmp_path) -> None:
+    """Ensure the shipped every-N-shows autosave never loses a short session."""
+
+    def saved_show(save_dir) -> int | None:
+        return persistence.load_slot_index(save_dir)[0].last_saved_show_index
+
+    async def run_flow() -> None:
+        menu_dir = tmp_path / "menu"
+        app = main.build_app(["--save-dir", str(menu_dir)])
+        assert app.session.autosave_enabled
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            await start_new_game(pilot)
+            await play_seeded_show(pilot)
+            assert app.session.flush_saves(timeout=5)
+            assert saved_show(menu_dir) == 1
+            await play_seeded_show(pilot)
+            assert app.session.flush_saves(timeout=5)
+            assert saved_show(menu_dir) == 1
+
+            await pilot.press("down", "down", "down", "enter")
+            await wait_for_screen(pilot, MainMenuScreen)
+            assert app.session.flush_saves(timeout=5)
+            assert saved_show(menu_dir) == 2
+
+        quit_dir = tmp_path / "quit"
+        app = main.build_app(["--save-dir", str(quit_dir)])
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            await start_new_game(pilot)
+            await play_seeded_show(pilot)
+            await play_seeded_show(pilot)
+            await pilot.press("q")
+        assert saved_show(quit_dir) == 2
+
+    run_async(run_flow())
 
 
 def test_load_game_flow() -> None:
@@ -234,3 +373,379 @@ def test_stipulation_dropdown_opens_on_enter() -> None:
             assert screen.match_type_select.value != initial_value
 
     run_async(run_flow())
+
+
+def test_wrestler_picker_renders_only_visible_rows() -> None:
+    """Ensure the picker builds rows on demand for huge rosters."""
+
+    async def run_flow() -> None:
+        app = TestWrestleGMApp()
+        app.state = GameState(build_large_roster(50_000), app.state.match_types.values())
+        rendered: list[str] = []
+        selected: list[str] = []
+
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            screen = WrestlerSelectionScreen(
+                slot_index=0,
+                title="Pick",
+                current_ids=set(),
+                booked_ids=set(),
+                on_select=selected.append,
+            )
+            render = screen.row_cells
+            screen.row_cells = lambda wrestler_id: rendered.append(wrestler_id) or render(
+                wrestler_id
+            )
+            app.push_screen(screen)
+            await wait_for_screen(pilot, WrestlerSelectionScreen)
+            await pilot.pause()
+            assert 0 < len(rendered) < VIEWPORT_SIZE[1]
+
+            await pilot.press("end")
+            await pilot.pause()
+            assert screen.table.cursor_id == "w049999"
+            assert len(rendered) < 2 * VIEWPORT_SIZE[1]
+            await pilot.press("pageup", "enter")
+            await wait_for_condition(pilot, lambda: bool(selected))
+            assert selected[0] < "w049999"
+
+    run_async(run_flow())
+
+
+def test_roster_refresh_redraws_only_changed_rows() -> None:
+    """Ensure the roster screen keeps its cursor and re-renders only changed rows."""
+
+    async def run_flow() -> None:
+        app = TestWrestleGMApp()
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            app.push_screen(RosterScreen())
+            await wait_for_screen(pilot, RosterScreen)
+            screen = app.screen
+            await pilot.press("down", "down")
+            await pilot.pause()
+            cursor_id = screen.table.cursor_id
+            drawn = dict(screen.table._cells)
+            stamina = {
+                wrestler_id: app.state.roster[wrestler_id].stamina for wrestler_id in drawn
+            }
+
+            seed_show_card(app.state)
+            app.state.run_show()
+            changed = app.state.roster_changes_since(0)
+            screen.refresh_view()
+
+            assert screen.table.cursor_id == cursor_id
+            assert screen.table._cells == {}
+            await pilot.pause()
+            assert set(screen.table._cells) == set(drawn)
+            for wrestler_id, cells in screen.table._cells.items():
+                wrestler = app.state.roster[wrestler_id]
+                assert cells[1] == f"{wrestler.stamina:>3}"
+                if wrestler_id not in changed and wrestler.stamina == stamina[wrestler_id]:
+                    assert cells is drawn[wrestler_id]
+                else:
+                    assert cells is not drawn[wrestler_id]
+
+    run_async(run_flow())
+
+
+def test_typing_in_picker_narrows_roster() -> None:
+    """Ensure typing on the picker table searches and facets narrow the rows."""
+
+    async def run_flow() -> None:
+        app = TestWrestleGMApp()
+        app.state = GameState(build_large_roster(5_000), app.state.match_types.values())
+        selected: list[str] = []
+
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            screen = WrestlerSelectionScreen(
+                slot_index=0,
+                title="Pick",
+                current_ids=set(),
+                booked_ids=set(),
+                on_select=selected.append,
+            )
+            app.push_screen(screen)
+            await wait_for_screen(pilot, WrestlerSelectionScreen)
+            await pilot.press("4", "2", "1")
+            await pilot.pause()
+            assert app.focused is screen.filter_bar.search_input
+            assert list(screen.table.row_ids) == [
+                "w000421",
+                *(f"w{n:06d}" for n in range(4210, 4220)),
+            ]
+
+            screen.filter_bar.alignment_select.value = "Heel"
+            await pilot.pause()
+            heels = [f"w{n:06d}" for n in range(4210, 4220, 2)]
+            assert list(screen.table.row_ids) == heels
+
+            screen.table.focus()
+            await pilot.pause()
+            screen.action_focus_next()
+            await pilot.pause()
+            assert app.focused is screen.select_button
+            screen.action_focus_prev()
+            await pilot.pause()
+            assert app.focused is screen.table
+            screen.filter_bar.search_input.focus()
+            await pilot.pause()
+
+            await pilot.press("enter", "down", "enter")
+            await wait_for_condition(pilot, lambda: bool(selected))
+            assert selected == [heels[1]]
+
+    run_async(run_flow())
+
+
+def test_roster_header_click_sorts_by_column() -> None:
+    """Ensure clicking a stat header sorts the roster and marks the column."""
+
+    async def run_flow() -> None:
+        app = TestWrestleGMApp()
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            app.push_screen(RosterScreen())
+            await wait_for_screen(pilot, RosterScreen)
+            await pilot.pause()
+            screen = app.screen
+            roster = app.state.roster
+
+            # Columns are padded by one cell each side: Name spans 0-22, Sta 23-27.
+            await pilot.click(screen.table, offset=(30, 0))
+            await wait_for_condition(pilot, lambda: screen.table.sorted_column == "Mic")
+            mic = [roster[wrestler_id].mic_skill for wrestler_id in screen.table.row_ids]
+            assert mic == sorted(mic, reverse=True)
+            assert screen.filter_bar.sort_select.value == "mic_skill"
+
+            await pilot.click(screen.table, offset=(5, 0))
+            await wait_for_condition(pilot, lambda: screen.table.sorted_column is None)
+            assert list(screen.table.row_ids) == list(roster)
+
+    run_async(run_flow())
+
+
+def test_cell_cache_rerenders_only_changed_wrestlers() -> None:
+    """Ensure cached cells are reused until a wrestler's stats change."""
+
+    match_types = TestWrestleGMApp().state.match_types.values()
+    state = GameState(build_large_roster(20), match_types)
+    rested_id = list(state.roster)[-1]
+    state.roster[rested_id].stamina = 100
+    cache = CellCache()
+    first = {wrestler_id: cache.row(state, wrestler_id) for wrestler_id in state.roster}
+
+    seed_show_card(state)
+    state.run_show()
+    changed = state.roster_changes_since(0)
+
+    assert changed and rested_id not in changed
+    for wrestler_id, wrestler in state.roster.items():
+        row = cache.row(state, wrestler_id)
+        assert row[1] == f"{wrestler.stamina:>3}"
+        if wrestler_id in changed or row[1] != first[wrestler_id][1]:
+            assert row is not first[wrestler_id]
+        else:
+            assert row is first[wrestler_id]
+    # A rested wrestler at full stamina keeps its cells.
+    assert cache.row(state, rested_id) is first[rested_id]
+
+
+def test_booking_previews_expected_rating_and_odds() -> None:
+    """Ensure the draft and the card preview ratings from background workers."""
+
+    cache_threads = set()
+
+    async def run_flow() -> None:
+        app = TestWrestleGMApp()
+        sync = app.previews._sync
+        app.previews._sync = lambda state: (
+            cache_threads.add(threading.current_thread()) or sync(state)
+        )
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            await start_new_game(pilot)
+            await open_booking_hub(pilot)
+            await open_match_booking(pilot, 0)
+            await select_match_category(pilot, 0)
+            await pilot.press("enter")
+            await select_wrestler(pilot, 0)
+            await pilot.press("down", "enter")
+            await select_wrestler(pilot, 1)
+
+            screen = app.screen
+            assert isinstance(screen, MatchBookingScreen)
+            await wait_for_previews(pilot)
+            match = screen.draft_match()
+            preview = app.previews.get(app.state, match)
+            assert preview is not None
+            text = str(screen.rating_preview.render())
+            assert text.startswith("Expected ")
+            for wrestler_id in match.wrestler_ids:
+                assert f"{preview.win_odds[wrestler_id]:.0%}" in text
+
+            await confirm_booking(pilot)
+            hub = app.screen
+            assert isinstance(hub, BookingHubScreen)
+            await wait_for_previews(pilot)
+            assert hub.rating_preview.previews[0] is preview
+            assert str(hub.rating_preview.render()).startswith("Projected show rating")
+            assert "Expected" in str(hub.slot_items[0].render())
+
+    run_async(run_flow())
+    # Workers only compute; every cache access stays on the UI thread.
+    assert cache_threads == {threading.main_thread()}
+
+
+def test_pooled_screens_are_reused_across_visits() -> None:
+    """Ensure revisited screens keep their widgets and reload data from state."""
+
+    async def run_flow() -> None:
+        app = TestWrestleGMApp()
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            await start_new_game(pilot)
+            hub = app.screen
+            await open_match_booking(pilot, 0)
+            await select_match_category(pilot, 0)
+            await pilot.pause()
+            booking = app.screen
+            assert isinstance(booking, MatchBookingScreen)
+            fields = booking.fields
+            await pilot.press("enter")
+            await select_wrestler(pilot, 0)
+            picker = app.get_screen("wrestler_selection", WrestlerSelectionScreen)
+            await pilot.press("down", "enter")
+            await select_wrestler(pilot, 1)
+            await confirm_booking(pilot)
+            assert app.screen is hub
+            booked_ids = app.state.show_card[0].wrestler_ids
+
+            await open_match_booking(pilot, 2)
+            await select_match_category(pilot, 0)
+            await pilot.pause()
+            assert app.screen is booking
+            assert booking.fields is fields
+            assert booking.slot_index == 2
+            assert booking.draft.wrestler_ids == [None, None]
+            assert str(booking.rating_preview.render()) == ""
+
+            await pilot.press("enter")
+            await wait_for_screen(pilot, WrestlerSelectionScreen)
+            await pilot.pause()
+            assert app.screen is picker
+            assert picker.table.cursor_row == 0
+            assert picker.row_cells(booked_ids[0])[3].endswith("📅")
+            assert picker.validate_selection(booked_ids[0]) == "Already booked in another slot"
+
+            await pilot.press("escape")
+            await wait_for_screen(pilot, MatchBookingScreen)
+            await pilot.press("escape")
+            await wait_for_screen(pilot, MatchCategorySelectionScreen)
+            await pilot.press("escape")
+            await wait_for_screen(pilot, BookingHubScreen)
+            await pilot.press("escape")
+            await wait_for_screen(pilot, GameHubScreen)
+            await pilot.press("enter")
+            await wait_for_screen(pilot, BookingHubScreen)
+            assert app.screen is hub
+
+    run_async(run_flow())
+
+
+def test_handler_timings_overlay_and_dump(tmp_path) -> None:
+    """Ensure opt-in timing records screen handlers, shows them, and dumps JSON."""
+
+    path = tmp_path / "timings.json"
+
+    async def run_flow() -> None:
+        app = TestWrestleGMApp()
+        timings = app.enable_timings(path)
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            await start_new_game(pilot)
+            await pilot.pause()
+            assert "BookingHubScreen.refresh_view" in timings.summary()
+            assert "BookingHubScreen.frame" in timings.summary()
+            assert not hasattr(BookingHubScreen.refresh_view, "__wrapped__")
+
+            await pilot.press("f9")
+            await wait_for_screen(pilot, TimingsModal)
+            await pilot.pause()
+            assert "BookingHubScreen.compose" in str(app.screen.table.render())
+            await pilot.press("f9")
+            await wait_for_screen(pilot, BookingHubScreen)
+            await pilot.press("escape")
+            await wait_for_screen(pilot, GameHubScreen)
+        assert app.timings is None
+
+    run_async(run_flow())
+    handlers = json.loads(path.read_text(encoding="utf-8"))["handlers"]
+    assert {
+        "MainMenuScreen.compose",
+        "BookingHubScreen.on_mount",
+        "BookingHubScreen.action_back",
+        "GameHubScreen.refresh_view",
+        "GameHubScreen.frame",
+    } <= set(handlers)
+    assert "TimingsModal.refresh_view" not in handlers
+    assert BookingHubScreen.refresh_view.__name__ == "refresh_view"
+    assert not hasattr(BookingHubScreen.refresh_view, "__wrapped__")
+
+
+def test_rivalry_browser_pages_by_heat_and_expiry() -> None:
+    """Ensure the rivalry browser shows one index page at a time in either order."""
+
+    async def run_flow() -> None:
+        app = TestWrestleGMApp()
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            await start_new_game(pilot)
+            await pilot.press("escape")
+            await wait_for_screen(pilot, GameHubScreen)
+            seed_rivalry_pairs(app.state)
+            await open_rivalries(pilot)
+            screen = app.screen
+            assert isinstance(screen, RivalryScreen)
+            index = app.state.rivalry_index
+
+            def shown_rows() -> list[str]:
+                return str(screen.rows.render()).splitlines()
+
+            first = index.page("heat", 0, RIVALRY_PAGE_SIZE)
+            assert shown_rows() == [screen.row_text(key) for key in first]
+            assert shown_rows()[0].endswith(f"Heat {constants.RIVALRY_LEVEL_CAP}")
+            assert str(screen.page_label.render()) == "Page 1/2 · 21 pairs"
+
+            await pilot.press("right")
+            second = index.page("heat", RIVALRY_PAGE_SIZE, RIVALRY_PAGE_SIZE)
+            assert shown_rows() == [screen.row_text(key) for key in second]
+            await pilot.press("right")
+            assert screen.page == 1
+
+            await pilot.press("o")
+            assert screen.order == "expiry"
+            assert screen.page == 0
+            soonest = index.page("expiry", 0, RIVALRY_PAGE_SIZE)
+            assert len(shown_rows()) == 7
+            assert shown_rows()[0].endswith("1 show left")
+            assert shown_rows() == [screen.row_text(key) for key in soonest]
+
+            await pilot.press("escape")
+            await wait_for_screen(pilot, GameHubScreen)
+            app.state.rivalry_manager.rivalry_states.clear()
+            await open_rivalries(pilot)
+            assert screen.order == "heat"
+            assert shown_rows() == ["No active rivalries."]
+
+    run_async(run_flow())
+
+
+def test_background_save_failures_reach_the_app_thread() -> None:
+    """Ensure a save callback fired on the saver thread is handled by the app."""
+
+    async def run_flow() -> None:
+        app = TestWrestleGMApp()
+        async with app.run_test(size=VIEWPORT_SIZE) as pilot:
+            await start_new_game(pilot)
+            saver = threading.Thread(target=app._save_finished, args=(OSError("disk full"),))
+            saver.start()
+            saver.join()
+            await wait_for_screen(pilot, ErrorModal)
+
+    run_async(run_flow())
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+from tests.state_test_utils import seed_rivalry_pairs, seed_show_card
 from tests.ui_test_utils import (
     TestWrestleGMApp,
     VIEWPORT_SIZE,
     open_booking_hub,
     open_match_booking,
+    open_rivalries,
     open_roster,
-    seed_show_card,
     select_match_category,
     select_wrestler,
     start_new_game,
+    wait_for_previews,
     wait_for_screen,
 )
 from wrestlegm import constants
@@ -52,6 +54,7 @@ def test_snapshot_s3_booking_hub_empty(snap_compare) -> None:
         await start_new_game(pilot)
         await open_booking_hub(pilot)
         await wait_for_screen(pilot, BookingHubScreen)
+        await wait_for_previews(pilot)
 
     assert snap_compare(app, terminal_size=VIEWPORT_SIZE, run_before=run_before)
 
@@ -66,6 +69,7 @@ def test_snapshot_s4_booking_hub_filled(snap_compare) -> None:
         if isinstance(pilot.app.screen, BookingHubScreen):
             pilot.app.screen.refresh_view()
         await wait_for_screen(pilot, BookingHubScreen)
+        await wait_for_previews(pilot)
 
     assert snap_compare(app, terminal_size=VIEWPORT_SIZE, run_before=run_before)
 
@@ -78,6 +82,7 @@ def test_snapshot_s5_match_booking_empty(snap_compare) -> None:
         await open_booking_hub(pilot)
         await open_match_booking(pilot, 0)
         await select_match_category(pilot, 0)
+        await wait_for_previews(pilot)
 
     assert snap_compare(app, terminal_size=VIEWPORT_SIZE, run_before=run_before)
 
@@ -93,6 +98,7 @@ def test_snapshot_s6_match_booking_filled(snap_compare) -> None:
             pilot.app.screen.refresh_view()
         await open_match_booking(pilot, 0)
         await select_match_category(pilot, 0)
+        await wait_for_previews(pilot)
 
     assert snap_compare(app, terminal_size=VIEWPORT_SIZE, run_before=run_before)
 
@@ -146,6 +152,7 @@ def test_snapshot_s9_match_booking_confirmation_modal(snap_compare) -> None:
         if isinstance(modal, ConfirmBookingModal):
             modal.confirm_button.focus()
             await pilot.pause(0.05)
+        await wait_for_previews(pilot)
 
     assert snap_compare(app, terminal_size=VIEWPORT_SIZE, run_before=run_before)
 
@@ -191,6 +198,7 @@ def test_snapshot_s12_booking_hub_rivalry_emojis(snap_compare) -> None:
         if isinstance(pilot.app.screen, BookingHubScreen):
             pilot.app.screen.refresh_view()
         await wait_for_screen(pilot, BookingHubScreen)
+        await wait_for_previews(pilot)
 
     assert snap_compare(app, terminal_size=VIEWPORT_SIZE, run_before=run_before)
 
@@ -211,6 +219,7 @@ def test_snapshot_s13_booking_hub_cooldown_emojis(snap_compare) -> None:
         if isinstance(pilot.app.screen, BookingHubScreen):
             pilot.app.screen.refresh_view()
         await wait_for_screen(pilot, BookingHubScreen)
+        await wait_for_previews(pilot)
 
     assert snap_compare(app, terminal_size=VIEWPORT_SIZE, run_before=run_before)
 
@@ -233,6 +242,7 @@ def test_snapshot_s14_match_booking_rivalry_emojis(snap_compare) -> None:
         await select_wrestler(pilot, 0)
         await pilot.press("down", "enter")
         await select_wrestler(pilot, 1)
+        await wait_for_previews(pilot)
 
     assert snap_compare(app, terminal_size=VIEWPORT_SIZE, run_before=run_before)
 
@@ -289,3 +299,16 @@ def test_snapshot_s18_overwrite_save_slot_modal(snap_compare) -> None:
         await wait_for_screen(pilot, OverwriteSaveSlotModal)
 
     assert snap_compare(app, terminal_size=VIEWPORT_SIZE, run_before=run_before)
+
+
+def test_snapshot_s19_rivalry_browser_by_heat(snap_compare) -> None:
+    app = TestWrestleGMApp()
+
+    async def run_before(pilot):
+        await start_new_game(pilot)
+        await pilot.press("escape")
+        await wait_for_screen(pilot, GameHubScreen)
+        seed_rivalry_pairs(pilot.app.state)
+        await open_rivalries(pilot)
+
+    assert snap_compare(app, terminal_size=VIEWPORT_SIZE, run_before=run_before)
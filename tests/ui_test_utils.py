@@ -10,13 +10,13 @@ from typing import Awaitable, Callable
 from textual.app import App
 from textual.pilot import Pilot
 
-from wrestlegm import constants
 from wrestlegm.data import load_match_types, load_wrestlers
-from wrestlegm.models import Match, Promo
+from wrestlegm.preview import PreviewCache
 from wrestlegm.state import GameState
 from wrestlegm.session import SessionManager
 from wrestlegm.ui import (
     BookingHubScreen,
+    CellCache,
     ConfirmBookingModal,
     GameHubScreen,
     MainMenuScreen,
@@ -25,6 +25,7 @@ from wrestlegm.ui import (
     NameSaveSlotModal,
     PromoBookingScreen,
     ResultsScreen,
+    RivalryScreen,
     RosterScreen,
     SaveSlotSelectionScreen,
     WrestleGMApp,
@@ -53,12 +54,14 @@ class TestWrestleGMApp(WrestleGMApp):
             save_dir=Path(self._save_dir.name),
         )
         self.state = GameState(self._wrestlers, self._match_types, seed=SEED)
+        self.cells = CellCache()
+        self.previews = PreviewCache()
 
     def new_game(self, slot_index: int, slot_name: str) -> None:
         """Start a fresh test session with the fixed seed."""
 
         self.state = self.session.new_game(slot_index, slot_name)
-        self.switch_screen(BookingHubScreen())
+        self.switch_screen(self.get_screen("booking_hub", BookingHubScreen).prepare())
 
 
 def run_async(coro: Awaitable[None]) -> None:
@@ -67,39 +70,6 @@ def run_async(coro: Awaitable[None]) -> None:
     asyncio.run(coro)
 
 
-def build_test_slots(state: GameState) -> list[Match | Promo]:
-    """Build a full show card from the fixture roster."""
-
-    wrestler_ids = list(state.roster.keys())
-    match_type_id = next(iter(state.match_types))
-    match_category_id = "singles"
-    slots: list[Match | Promo] = []
-    cursor = 0
-    for slot_type in constants.SHOW_SLOT_TYPES:
-        if slot_type == "match":
-            wrestler_count = constants.MATCH_CATEGORIES[match_category_id]["size"]
-            slots.append(
-                Match(
-                    wrestler_ids=wrestler_ids[cursor : cursor + wrestler_count],
-                    match_category_id=match_category_id,
-                    match_type_id=match_type_id,
-                )
-            )
-            cursor += wrestler_count
-        else:
-            slots.append(Promo(wrestler_id=wrestler_ids[cursor]))
-            cursor += 1
-    return slots
-
-
-def seed_show_card(state: GameState) -> None:
-    """Populate the show card with deterministic matches."""
-
-    slots = build_test_slots(state)
-    for index, slot in enumerate(slots):
-        state.set_slot(index, slot)
-
-
 def assert_screen(app: WrestleGMApp, screen_type: type[object]) -> None:
     """Assert the current screen matches the expected type."""
 
@@ -136,6 +106,19 @@ async def wait_for_condition(
     raise AssertionError("Expected condition was not met.")
 
 
+async def wait_for_previews(pilot: Pilot) -> None:
+    """Wait for every screen in the stack to render its rating previews."""
+
+    await pilot.pause()
+    await wait_for_condition(
+        pilot,
+        lambda: not any(
+            getattr(screen, "preview_pending", False)
+            for screen in pilot.app.screen_stack
+        ),
+    )
+
+
 async def start_new_game(pilot: Pilot) -> None:
     """Start a new game from the main menu."""
 
@@ -169,6 +152,14 @@ async def open_roster(pilot: Pilot) -> None:
     await wait_for_screen(pilot, RosterScreen)
 
 
+async def open_rivalries(pilot: Pilot) -> None:
+    """Open the rivalry browser from the game hub."""
+
+    await pilot.press("down", "down", "enter")
+    await wait_for_screen(pilot, RivalryScreen)
+    await pilot.pause()
+
+
 async def back_to_game_hub(pilot: Pilot) -> None:
     """Return to the game hub from a child screen."""
 
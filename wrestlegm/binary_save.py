@@ -0,0 +1,466 @@
+"""Compact binary encoding for save payloads.
+
+The binary format stores the same payload as the JSON save files, but packs
+roster stats into typed columns and interns every string once. Layout::
+
+    header   <4sBBHI   magic, format version, compression, save version,
+                       stored body length
+    meta     <HI + JSON meta length, CRC32 of meta + stored body, then the
+                       uncompressed save metadata
+    body     (optionally zlib/lzma compressed) sections, each <II length +
+             CRC32: string table, scalars (slot info, show index, seed, last
+             show rating), roster columns, rivalry/cooldown pair tables,
+             show card, RNG state
+
+The metadata block sits before the body so slot browsers can read it without
+decompressing anything. The whole-file CRC lets a verifier check a save at
+disk speed without decoding it; the per-section CRCs are checked as each
+section is read, before it is parsed.
+
+The RNG state is decoded to the packed blob form used by JSON saves. Decoding
+returns a payload dict shaped exactly like the JSON save payload so
+hydration code does not care which format produced it.
+"""
+
+from __future__ import annotations
+
+from array import array
+import base64
+import json
+import lzma
+import struct
+import sys
+import zlib
+from typing import Any, NamedTuple
+
+MAGIC = b"WGMS"
+FORMAT_VERSION = 3
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZMA = 2
+COMPRESSION_IDS = {
+    None: COMPRESSION_NONE,
+    "zlib": COMPRESSION_ZLIB,
+    "lzma": COMPRESSION_LZMA,
+}
+
+_HEADER = struct.Struct("<4sBBHI")
+_META = struct.Struct("<HI")
+# Bytes needed by read_header: the fixed header plus the meta framing.
+HEADER_SIZE = _HEADER.size + _META.size
+_SECTION = struct.Struct("<II")
+_COUNT = struct.Struct("<I")
+_INT = struct.Struct("<i")
+_SLOT = struct.Struct("<ii")
+_SCALARS = struct.Struct("<iq")
+_RNG_HEADER = struct.Struct("<iI")
+_GAUSS = struct.Struct("<Bd")
+_RATING = struct.Struct("<Bd")
+
+_ALIGNMENTS = ("Face", "Heel")
+_SLOT_EMPTY = 0
+_SLOT_MATCH = 1
+_SLOT_PROMO = 2
+_NO_STRING = -1
+
+
+class BinaryHeader(NamedTuple):
+    """Fixed-position fields read from the start of a binary save."""
+
+    format_version: int
+    compression_id: int
+    save_version: int
+    body_length: int
+    body_offset: int
+    meta_offset: int
+    meta_length: int
+    checksum: int
+
+
+def is_binary_save(data: bytes) -> bool:
+    """Return True when raw save bytes use the binary format."""
+
+    return data[: len(MAGIC)] == MAGIC
+
+
+def encode_payload(payload: dict[str, Any], compression: str | None = None) -> bytes:
+    """Encode a save payload into the compact binary format."""
+
+    if compression not in COMPRESSION_IDS:
+        raise ValueError("unknown_save_compression")
+    writer = _Writer()
+    state = payload.get("state", {})
+    slot = payload.get("slot", {})
+
+    writer.section()
+    writer.pack(_SLOT, slot.get("slot_index", 0), writer.ref(slot.get("name")))
+    writer.pack(_SCALARS, state.get("show_index", 1), state.get("rng_seed", 0))
+    rating = state.get("last_show_rating")
+    writer.pack(_RATING, rating is not None, rating or 0.0)
+    writer.section()
+    writer.roster(state.get("roster", []))
+    writer.section()
+    writer.pairs(state.get("rivalry_states", []), "rivalry_value")
+    writer.section()
+    writer.pairs(state.get("cooldown_states", []), "remaining_shows")
+    writer.section()
+    writer.show_card(state.get("show_card", []))
+    writer.section()
+    writer.rng_state(state.get("rng_state"))
+
+    body = writer.finish()
+    compression_id = COMPRESSION_IDS[compression]
+    if compression_id == COMPRESSION_ZLIB:
+        body = zlib.compress(body, 6)
+    elif compression_id == COMPRESSION_LZMA:
+        body = lzma.compress(body)
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        compression_id,
+        payload.get("version", 0),
+        len(body),
+    )
+    meta = json.dumps(
+        payload.get("meta", {}), separators=(",", ":"), sort_keys=True
+    ).encode("utf-8")
+    checksum = zlib.crc32(body, zlib.crc32(meta))
+    return header + _META.pack(len(meta), checksum) + meta + body
+
+
+def read_header(data: bytes) -> BinaryHeader:
+    """Parse the header and metadata framing from the start of a binary save."""
+
+    try:
+        magic, format_version, compression_id, save_version, length = _HEADER.unpack_from(
+            data
+        )
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError("corrupt_save_file")
+        meta_length, checksum = _META.unpack_from(data, _HEADER.size)
+    except struct.error as exc:
+        raise ValueError("corrupt_save_file") from exc
+    meta_offset = HEADER_SIZE
+    return BinaryHeader(
+        format_version=format_version,
+        compression_id=compression_id,
+        save_version=save_version,
+        body_length=length,
+        body_offset=meta_offset + meta_length,
+        meta_offset=meta_offset,
+        meta_length=meta_length,
+        checksum=checksum,
+    )
+
+
+def read_metadata(data: bytes) -> dict[str, Any]:
+    """Return the metadata block from the start of a binary save.
+
+    Only the header and metadata bytes are needed, so callers can pass a short
+    prefix of the file. Raises ValueError when the prefix is too short or
+    corrupt.
+    """
+
+    header = read_header(data)
+    meta_bytes = data[header.meta_offset : header.body_offset]
+    if len(meta_bytes) != header.meta_length:
+        raise ValueError("corrupt_save_file")
+    try:
+        meta = json.loads(meta_bytes.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("corrupt_save_file") from exc
+    if not isinstance(meta, dict):
+        raise ValueError("corrupt_save_file")
+    return meta
+
+
+def decode_payload(data: bytes) -> dict[str, Any]:
+    """Decode binary save bytes into a JSON-shaped save payload."""
+
+    header = read_header(data)
+    compression_id = header.compression_id
+    body = data[header.body_offset : header.body_offset + header.body_length]
+    if len(body) != header.body_length:
+        raise ValueError("corrupt_save_file")
+    if header.checksum != zlib.crc32(
+        body, zlib.crc32(data[header.meta_offset : header.body_offset])
+    ):
+        raise ValueError("corrupt_save_file")
+    meta = read_metadata(data)
+    try:
+        if compression_id == COMPRESSION_ZLIB:
+            body = zlib.decompress(body)
+        elif compression_id == COMPRESSION_LZMA:
+            body = lzma.decompress(body)
+        elif compression_id != COMPRESSION_NONE:
+            raise ValueError("corrupt_save_file")
+        payload = _Reader(body).payload(header.save_version)
+    except (struct.error, IndexError, UnicodeDecodeError, zlib.error, lzma.LZMAError) as exc:
+        raise ValueError("corrupt_save_file") from exc
+    payload["meta"] = meta
+    return payload
+
+
+def _int_array(values: Any) -> array:
+    column = array("i", values)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+class _Writer:
+    """Accumulate packed sections and the interned string table."""
+
+    def __init__(self) -> None:
+        self._strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+        self._sections: list[list[bytes]] = []
+        self._chunks: list[bytes] = []
+
+    def section(self) -> None:
+        """Start a new checksummed section; later packs append to it."""
+
+        self._chunks = []
+        self._sections.append(self._chunks)
+
+    def ref(self, value: Any) -> int:
+        """Return the string table index for a value, interning it if needed."""
+
+        if not isinstance(value, str):
+            return _NO_STRING
+        index = self._string_ids.get(value)
+        if index is None:
+            index = len(self._strings)
+            self._strings.append(value)
+            self._string_ids[value] = index
+        return index
+
+    def pack(self, packer: struct.Struct, *values: Any) -> None:
+        self._chunks.append(packer.pack(*values))
+
+    def column(self, values: Any) -> None:
+        self._chunks.append(_int_array(values).tobytes())
+
+    def roster(self, entries: list[dict[str, Any]]) -> None:
+        self.pack(_COUNT, len(entries))
+        ref = self.ref
+        self.column([ref(entry.get("id")) for entry in entries])
+        self.column([ref(entry.get("name")) for entry in entries])
+        self._chunks.append(
+            bytes(1 if entry.get("alignment") == "Heel" else 0 for entry in entries)
+        )
+        for key in ("popularity", "stamina", "mic_skill"):
+            self.column([entry.get(key, 0) for entry in entries])
+
+    def pairs(self, entries: list[dict[str, Any]], value_key: str) -> None:
+        self.pack(_COUNT, len(entries))
+        ref = self.ref
+        self.column([ref(entry.get("wrestler_a_id")) for entry in entries])
+        self.column([ref(entry.get("wrestler_b_id")) for entry in entries])
+        self.column([entry.get(value_key, 0) for entry in entries])
+
+    def show_card(self, slots: list[dict[str, Any] | None]) -> None:
+        self.pack(_COUNT, len(slots))
+        for slot in slots:
+            if slot is None:
+                self._chunks.append(bytes((_SLOT_EMPTY,)))
+            elif slot.get("type") == "match":
+                wrestler_ids = slot.get("wrestler_ids", [])
+                self._chunks.append(bytes((_SLOT_MATCH, len(wrestler_ids))))
+                self.column(
+                    [self.ref(wrestler_id) for wrestler_id in wrestler_ids]
+                    + [self.ref(slot.get("match_category_id")), self.ref(slot.get("match_type_id"))]
+                )
+            else:
+                self._chunks.append(bytes((_SLOT_PROMO,)))
+                self.pack(_INT, self.ref(slot.get("wrestler_id")))
+
+    def rng_state(self, rng_state: Any) -> None:
+        if rng_state is None:
+            self._chunks.append(b"\x00")
+            return
+        if isinstance(rng_state, dict):
+            # Packed blob: the words are already little-endian uint32 bytes.
+            version, gauss_next = rng_state["version"], rng_state.get("gauss_next")
+            words = base64.b64decode(rng_state["words"])
+        else:
+            version, internal, gauss_next = rng_state
+            column = array("I", internal)
+            if sys.byteorder == "big":
+                column.byteswap()
+            words = column.tobytes()
+        self._chunks.append(b"\x01")
+        self.pack(_RNG_HEADER, version, len(words) // 4)
+        self._chunks.append(words)
+        self.pack(_GAUSS, gauss_next is not None, gauss_next or 0.0)
+
+    def finish(self) -> bytes:
+        table = "\x00".join(self._strings).encode("utf-8")
+        sections = [
+            b"".join([_COUNT.pack(len(self._strings)), _COUNT.pack(len(table)), table]),
+            *(b"".join(chunks) for chunks in self._sections),
+        ]
+        framed: list[bytes] = []
+        for section in sections:
+            framed.append(_SECTION.pack(len(section), zlib.crc32(section)))
+            framed.append(section)
+        return b"".join(framed)
+
+
+class _Reader:
+    """Read packed sections back into JSON-shaped payload data."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = memoryview(body)
+        self._offset = 0
+        self._section_end: int | None = None
+        self.section()
+        count = self.unpack(_COUNT)[0]
+        table_length = self.unpack(_COUNT)[0]
+        table = bytes(self.take(table_length)).decode("utf-8")
+        self._strings = table.split("\x00") if count else []
+        if len(self._strings) != count:
+            raise ValueError("corrupt_save_file")
+
+    def take(self, length: int) -> memoryview:
+        end = self._offset + length
+        if end > len(self._body):
+            raise ValueError("corrupt_save_file")
+        chunk = self._body[self._offset : end]
+        self._offset = end
+        return chunk
+
+    def section(self) -> None:
+        """Check the next section's CRC before parsing it."""
+
+        self.end_section()
+        length, checksum = self.unpack(_SECTION)
+        end = self._offset + length
+        if end > len(self._body) or zlib.crc32(self._body[self._offset : end]) != checksum:
+            raise ValueError("corrupt_save_file")
+        self._section_end = end
+
+    def end_section(self) -> None:
+        """Ensure the current section was consumed exactly."""
+
+        if self._section_end is not None and self._offset != self._section_end:
+            raise ValueError("corrupt_save_file")
+
+    def unpack(self, packer: struct.Struct) -> tuple[Any, ...]:
+        return packer.unpack(self.take(packer.size))
+
+    def column(self, count: int, typecode: str = "i") -> array:
+        column = array(typecode)
+        column.frombytes(self.take(count * column.itemsize))
+        if sys.byteorder == "big":
+            column.byteswap()
+        return column
+
+    def string(self, index: int) -> str | None:
+        return None if index == _NO_STRING else self._strings[index]
+
+    def strings(self, indexes: array) -> list[str | None]:
+        strings = self._strings
+        return [None if index == _NO_STRING else strings[index] for index in indexes]
+
+    def payload(self, save_version: int) -> dict[str, Any]:
+        self.section()
+        slot_index, slot_name = self.unpack(_SLOT)
+        show_index, rng_seed = self.unpack(_SCALARS)
+        has_rating, rating = self.unpack(_RATING)
+        last_show_rating = rating if has_rating else None
+        state = {
+            "roster": self.roster(),
+            "rivalry_states": self.pairs("rivalry_value"),
+            "cooldown_states": self.pairs("remaining_shows"),
+            "show_index": show_index,
+            "show_card": self.show_card(),
+            "rng_seed": rng_seed,
+            "rng_state": self.rng_state(),
+            "last_show_rating": last_show_rating,
+        }
+        self.end_section()
+        if self._offset != len(self._body):
+            raise ValueError("corrupt_save_file")
+        return {
+            "version": save_version,
+            "slot": {"slot_index": slot_index, "name": self.string(slot_name)},
+            "state": state,
+        }
+
+    def roster(self) -> list[dict[str, Any]]:
+        self.section()
+        count = self.unpack(_COUNT)[0]
+        ids = self.strings(self.column(count))
+        names = self.strings(self.column(count))
+        alignments = [_ALIGNMENTS[flag] for flag in self.take(count)]
+        popularity = self.column(count)
+        stamina = self.column(count)
+        mic_skill = self.column(count)
+        return [
+            {
+                "id": ids[index],
+                "name": names[index],
+                "alignment": alignments[index],
+                "popularity": popularity[index],
+                "stamina": stamina[index],
+                "mic_skill": mic_skill[index],
+            }
+            for index in range(count)
+        ]
+
+    def pairs(self, value_key: str) -> list[dict[str, Any]]:
+        self.section()
+        count = self.unpack(_COUNT)[0]
+        a_ids = self.strings(self.column(count))
+        b_ids = self.strings(self.column(count))
+        values = self.column(count)
+        return [
+            {
+                "wrestler_a_id": a_ids[index],
+                "wrestler_b_id": b_ids[index],
+                value_key: values[index],
+            }
+            for index in range(count)
+        ]
+
+    def show_card(self) -> list[dict[str, Any] | None]:
+        self.section()
+        count = self.unpack(_COUNT)[0]
+        slots: list[dict[str, Any] | None] = []
+        for _ in range(count):
+            kind = self.take(1)[0]
+            if kind == _SLOT_EMPTY:
+                slots.append(None)
+            elif kind == _SLOT_MATCH:
+                size = self.take(1)[0]
+                refs = self.strings(self.column(size + 2))
+                slots.append(
+                    {
+                        "type": "match",
+                        "wrestler_ids": refs[:size],
+                        "match_category_id": refs[size],
+                        "match_type_id": refs[size + 1],
+                    }
+                )
+            elif kind == _SLOT_PROMO:
+                slots.append(
+                    {"type": "promo", "wrestler_id": self.string(self.unpack(_INT)[0])}
+                )
+            else:
+                raise ValueError("corrupt_save_file")
+        return slots
+
+    def rng_state(self) -> dict[str, Any] | None:
+        self.section()
+        if self.take(1)[0] == 0:
+            return None
+        version, count = self.unpack(_RNG_HEADER)
+        words = base64.b64encode(self.take(count * 4)).decode("ascii")
+        has_gauss, gauss_next = self.unpack(_GAUSS)
+        return {
+            "version": version,
+            "words": words,
+            "gauss_next": gauss_next if has_gauss else None,
+        }
@@ -2,30 +2,109 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
+import logging
+import os
+from dataclasses import MISSING, dataclass, fields
 from pathlib import Path
-from typing import List
+import pickle
+import tempfile
+from typing import Any, Callable, Iterable, Iterator, List, Sequence, TextIO, TypeVar
 
+from wrestlegm.jsonstream import JsonStreamReader
 from wrestlegm.models import MatchTypeDefinition, MatchTypeModifiers, WrestlerDefinition
 
+LOGGER = logging.getLogger(__name__)
+
 DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[1] / "dist" / "data" / "cache"
+CACHE_FORMAT_VERSION = 1
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+PACK_KINDS = ("wrestlers", "match_types")
+PACK_MODELS = {"wrestlers": WrestlerDefinition, "match_types": MatchTypeDefinition}
+
+T = TypeVar("T")
+
+
+def load_wrestlers(
+    path: Path | None = None,
+    *,
+    cache_dir: Path | None = None,
+) -> List[WrestlerDefinition]:
+    """Load wrestler definitions from a JSON array or JSON-lines file.
+
+    With `cache_dir`, compiled definitions are reused until the source changes.
+    """
+
+    file_path = path or DATA_DIR / "wrestlers.json"
+    if cache_dir is None:
+        return list(iter_wrestlers(file_path))
+    json_lines = file_path.suffix in JSON_LINES_SUFFIXES
+    return _load_cached(
+        [file_path],
+        "wrestlers",
+        lambda raws: _parse_wrestlers(raws[0], json_lines),
+        cache_dir,
+    )
+
 
+def iter_wrestlers(path: Path | None = None) -> Iterator[WrestlerDefinition]:
+    """Yield wrestler definitions one at a time from a JSON array or JSON-lines file.
 
-def load_wrestlers(path: Path | None = None) -> List[WrestlerDefinition]:
-    """Load wrestler definitions from JSON."""
+    Only one entry is decoded at a time, so memory stays flat for huge rosters;
+    pass the iterator straight to :class:`GameState` to build the roster.
+    """
 
     file_path = path or DATA_DIR / "wrestlers.json"
-    data = json.loads(file_path.read_text(encoding="utf-8"))
-    return [WrestlerDefinition(**entry) for entry in data]
+    with file_path.open(encoding="utf-8") as handle:
+        yield from _iter_wrestler_entries(handle, file_path.suffix in JSON_LINES_SUFFIXES)
+
+
+def _iter_wrestler_entries(handle: TextIO, json_lines: bool) -> Iterator[WrestlerDefinition]:
+    for entry in _iter_entries(handle, json_lines):
+        yield WrestlerDefinition(**entry)
+
+
+def _iter_entries(handle: TextIO, json_lines: bool) -> Iterator[Any]:
+    """Yield raw entries from a JSON array or JSON-lines stream."""
+
+    if json_lines:
+        return (json.loads(line) for line in handle if line.strip())
+    return JsonStreamReader(handle).iter_array()
+
+
+def _parse_wrestlers(raw: bytes, json_lines: bool = False) -> List[WrestlerDefinition]:
+    return list(_iter_wrestler_entries(io.StringIO(raw.decode("utf-8")), json_lines))
 
 
-def load_match_types(path: Path | None = None) -> List[MatchTypeDefinition]:
-    """Load match type definitions from JSON."""
+def load_match_types(
+    path: Path | None = None,
+    *,
+    cache_dir: Path | None = None,
+) -> List[MatchTypeDefinition]:
+    """Load match type definitions from JSON.
+
+    With `cache_dir`, compiled definitions are reused until the source changes.
+    """
 
     file_path = path or DATA_DIR / "match_types.json"
-    data = json.loads(file_path.read_text(encoding="utf-8"))
+    return _load_cached(
+        [file_path],
+        "match_types",
+        lambda raws: _parse_match_types(raws[0]),
+        cache_dir,
+    )
+
+
+def _parse_match_types(raw: bytes) -> List[MatchTypeDefinition]:
+    return _build_match_types(json.loads(raw))
+
+
+def _build_match_types(entries: Iterable[dict[str, Any]]) -> List[MatchTypeDefinition]:
     match_types: List[MatchTypeDefinition] = []
-    for entry in data:
+    for entry in entries:
         modifiers = MatchTypeModifiers(**entry["modifiers"])
         match_types.append(
             MatchTypeDefinition(
@@ -37,3 +116,231 @@ def load_match_types(path: Path | None = None) -> List[MatchTypeDefinition]:
             )
         )
     return match_types
+
+
+@dataclass(frozen=True)
+class DataConflict:
+    """A definition id supplied by more than one data pack."""
+
+    kind: str
+    id: str
+    previous_pack: str
+    pack: str
+    fields: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class MergedData:
+    """Definitions merged from an ordered list of data packs."""
+
+    wrestlers: List[WrestlerDefinition]
+    match_types: List[MatchTypeDefinition]
+    conflicts: tuple[DataConflict, ...] = ()
+
+
+def _model_fingerprint() -> str:
+    """Hash the field layout of every dataclass a compiled cache pickles."""
+
+    layout = [
+        (cls.__qualname__, [(field.name, str(field.type)) for field in fields(cls)])
+        for cls in (
+            WrestlerDefinition,
+            MatchTypeModifiers,
+            MatchTypeDefinition,
+            DataConflict,
+            MergedData,
+        )
+    ]
+    return hashlib.sha256(repr(layout).encode("utf-8")).hexdigest()[:16]
+
+
+MODEL_FINGERPRINT = _model_fingerprint()
+
+
+def pack_file(pack_dir: Path, kind: str) -> Path | None:
+    """Return a pack's JSON or JSON-lines file for `kind`, if it has one."""
+
+    for suffix in (".json", *JSON_LINES_SUFFIXES):
+        path = pack_dir / f"{kind}{suffix}"
+        if path.is_file():
+            return path
+    return None
+
+
+def load_data_packs(
+    pack_dirs: Sequence[Path],
+    *,
+    cache_dir: Path | None = None,
+) -> MergedData:
+    """Merge wrestler and match type definitions from ordered data packs.
+
+    Each pack directory may hold `wrestlers` and `match_types` files. Entries
+    are merged by id in pack order: a later entry's fields override the
+    earlier ones, so an override pack only needs the fields it changes.
+    Overrides that change a value are reported as conflicts. The merge is a
+    single pass over every entry, and with `cache_dir` the merged result is
+    reused until any pack file changes.
+    """
+
+    sources = [
+        (pack_dir.name, kind, path)
+        for pack_dir in pack_dirs
+        for kind in PACK_KINDS
+        if (path := pack_file(pack_dir, kind)) is not None
+    ]
+    merged = _load_cached(
+        [path for _, _, path in sources],
+        "packs",
+        lambda raws: _merge_packs(sources, raws),
+        cache_dir,
+    )
+    for conflict in merged.conflicts:
+        LOGGER.info(
+            "Data pack %s overrides %s %s from %s (%s).",
+            conflict.pack,
+            conflict.kind,
+            conflict.id,
+            conflict.previous_pack,
+            ", ".join(conflict.fields),
+        )
+    return merged
+
+
+def _merge_packs(
+    sources: Sequence[tuple[str, str, Path]],
+    raws: Sequence[bytes],
+) -> MergedData:
+    """Merge raw pack entries through per-kind id indexes.
+
+    An id first seen in a pack must end up with every required field once
+    later packs are applied; otherwise a ValueError names that pack file.
+    """
+
+    indexes: dict[str, dict[str, tuple[dict[str, Any], str]]] = {
+        kind: {} for kind in PACK_KINDS
+    }
+    origins: dict[str, dict[str, Path]] = {kind: {} for kind in PACK_KINDS}
+    conflicts: list[DataConflict] = []
+    for (pack, kind, path), raw in zip(sources, raws):
+        index = indexes[kind]
+        handle = io.StringIO(raw.decode("utf-8"))
+        for entry in _iter_entries(handle, path.suffix in JSON_LINES_SUFFIXES):
+            if not isinstance(entry, dict) or not isinstance(entry.get("id"), str):
+                raise ValueError(f"invalid_pack_entry: {path}")
+            entry_id = entry["id"]
+            previous = index.get(entry_id)
+            if previous is None:
+                index[entry_id] = (entry, pack)
+                origins[kind][entry_id] = path
+                continue
+            base, previous_pack = previous
+            changed = tuple(
+                sorted(key for key, value in entry.items() if base.get(key) != value)
+            )
+            if changed:
+                conflicts.append(
+                    DataConflict(kind, entry_id, previous_pack, pack, changed)
+                )
+            index[entry_id] = ({**base, **entry}, pack)
+    for kind, index in indexes.items():
+        required = [
+            field.name
+            for field in fields(PACK_MODELS[kind])
+            if field.default is MISSING and field.default_factory is MISSING
+        ]
+        for entry_id, (entry, _) in index.items():
+            missing = [name for name in required if name not in entry]
+            if missing:
+                raise ValueError(
+                    f"incomplete_pack_entry: {origins[kind][entry_id]} "
+                    f"{entry_id} missing {', '.join(missing)}"
+                )
+    return MergedData(
+        wrestlers=[
+            WrestlerDefinition(**entry) for entry, _ in indexes["wrestlers"].values()
+        ],
+        match_types=_build_match_types(
+            entry for entry, _ in indexes["match_types"].values()
+        ),
+        conflicts=tuple(conflicts),
+    )
+
+
+def cache_path(file_paths: Sequence[Path], kind: str, cache_dir: Path) -> Path:
+    """Return the compiled cache file for a set of source data files.
+
+    The name also covers the cache format and the model field layout, so a
+    model change never unpickles objects built for the old layout.
+    """
+
+    key = "\0".join(
+        [
+            str(CACHE_FORMAT_VERSION),
+            MODEL_FINGERPRINT,
+            *(str(path.resolve()) for path in file_paths),
+        ]
+    )
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{kind}-{digest}.pickle"
+
+
+def _load_cached(
+    file_paths: Sequence[Path],
+    kind: str,
+    build: Callable[[list[bytes]], T],
+    cache_dir: Path | None,
+) -> T:
+    """Return definitions built from source files, via a compiled cache if given.
+
+    The cache records each source's size, mtime and SHA-256. Matching stats
+    load the cache in one read without touching the sources; otherwise the
+    sources are hashed, and only a content change triggers a rebuild.
+    """
+
+    if cache_dir is None:
+        return build([path.read_bytes() for path in file_paths])
+    stamp = []
+    for path in file_paths:
+        stat = path.stat()
+        stamp.append((stat.st_size, stat.st_mtime_ns))
+    compiled = cache_path(file_paths, kind, cache_dir)
+    cached = _read_cache(compiled)
+    if cached is not None and cached["stamp"] == stamp:
+        return cached["value"]
+    raws = [path.read_bytes() for path in file_paths]
+    digest = [hashlib.sha256(raw).hexdigest() for raw in raws]
+    if cached is not None and cached["sha256"] == digest:
+        value = cached["value"]
+    else:
+        value = build(raws)
+    _write_cache(compiled, {"stamp": stamp, "sha256": digest, "value": value})
+    return value
+
+
+def _read_cache(path: Path) -> dict[str, Any] | None:
+    """Load a compiled cache file, or None when it is missing or unusable."""
+
+    try:
+        data = pickle.loads(path.read_bytes())
+    except Exception:  # Missing, stale or damaged caches are rebuilt from source.
+        return None
+    if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT_VERSION:
+        return None
+    return data
+
+
+def _write_cache(path: Path, entry: dict[str, Any]) -> None:
+    """Replace a compiled cache file; failures only cost the next startup."""
+
+    entry = {"format": CACHE_FORMAT_VERSION, **entry}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(entry, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_name, path)
+    except OSError:
+        Path(temp_name).unlink(missing_ok=True)
@@ -0,0 +1,148 @@
+"""Incremental JSON reading for documents too large to parse in one go."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator, TextIO
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+class JsonStreamReader:
+    """Walk a JSON document from a text stream while holding one value at a time.
+
+    Objects and arrays can be entered with :meth:`iter_object` and
+    :meth:`iter_array`; anything else is decoded whole with :meth:`value`.
+    Only the unread tail of the current chunk is kept in memory, so peak memory
+    is bounded by the largest single value decoded, not the document size.
+    """
+
+    def __init__(self, handle: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._handle = handle
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or "" at end of input."""
+
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer) or not self._fill():
+                return buffer[pos] if pos < len(buffer) else ""
+
+    def value(self) -> Any:
+        """Decode and return the next complete JSON value."""
+
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number followed only by number characters up to the buffer edge
+            # may continue in the next chunk ("12." | "75"), so only accept it
+            # once more input proves it ended.
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                buffer = self._buffer
+                tail = end
+                while tail < len(buffer) and buffer[tail] in _NUMBER_CHARS:
+                    tail += 1
+                if tail == len(buffer) and self._fill():
+                    continue
+            self._pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """Enter an object and yield its keys.
+
+        The caller must consume each key's value (with :meth:`value`,
+        :meth:`iter_object` or :meth:`iter_array`) before asking for the next key.
+        """
+
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise self._error("Expecting property name")
+            self._expect(":")
+            yield key
+            if not self._separator("}"):
+                return
+
+    def iter_array(self) -> Iterator[Any]:
+        """Enter an array and yield each item fully decoded."""
+
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if not self._separator("]"):
+                return
+
+    def skip(self) -> None:
+        """Consume the next value without keeping containers in memory."""
+
+        char = self.peek()
+        if char == "{":
+            for _ in self.iter_object():
+                self.skip()
+        elif char == "[":
+            self._expect("[")
+            if self.peek() == "]":
+                self._pos += 1
+                return
+            while True:
+                self.skip()
+                if not self._separator("]"):
+                    return
+        else:
+            self.value()
+
+    def _separator(self, closing: str) -> bool:
+        """Consume "," (return True) or the closing bracket (return False)."""
+
+        char = self.peek()
+        self._pos += 1
+        if char == ",":
+            return True
+        if char == closing:
+            return False
+        raise self._error(f"Expecting ',' or '{closing}'")
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping consumed text; False at end of input."""
+
+        if self._eof:
+            return False
+        chunk = self._handle.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
@@ -0,0 +1,246 @@
+"""Step-by-step save version migrations.
+
+Each registered :class:`Migration` upgrades a save from one version to the
+next. Migrations work per record: roster entries and rivalry/cooldown pairs
+each pass through the chain on their own, and the remaining scalar state
+fields are upgraded together. JSON save files are upgraded by streaming:
+records are spooled to temp files while the old save is read, then migrated
+and written one at a time into the checksummed replacement, so memory stays
+bounded by the largest single record rather than the save size. The upgraded
+file replaces the original, so later loads skip the migration entirely.
+
+Binary saves and SQLite rows are migrated in memory; the columnar binary
+body cannot be read record by record.
+"""
+
+from __future__ import annotations
+
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import shutil
+import tempfile
+from typing import Any, Callable, Iterable, Iterator, Mapping
+
+from wrestlegm import binary_save, persistence
+from wrestlegm.jsonstream import JsonStreamReader
+
+StateHook = Callable[[dict[str, Any]], None]
+RecordHook = Callable[[dict[str, Any]], dict[str, Any]]
+
+STREAMED_KEYS = ("roster", "rivalry_states", "cooldown_states")
+
+
+@dataclass(frozen=True)
+class Migration:
+    """Upgrade step from `from_version` to `from_version + 1`.
+
+    `state` mutates the scalar state fields (everything except the streamed
+    record lists) in place. `records` maps a streamed key to a hook that
+    returns the upgraded record.
+    """
+
+    from_version: int
+    state: StateHook | None = None
+    records: Mapping[str, RecordHook] = field(default_factory=dict)
+
+
+MIGRATIONS: dict[int, Migration] = {}
+
+
+def register_migration(migration: Migration) -> Migration:
+    """Add a migration step to the registry."""
+
+    if migration.from_version in MIGRATIONS:
+        raise ValueError("duplicate_migration")
+    MIGRATIONS[migration.from_version] = migration
+    return migration
+
+
+def migration_chain(version: Any) -> list[Migration]:
+    """Return the steps that upgrade `version` to the current save version."""
+
+    if not isinstance(version, int) or version > persistence.SAVE_VERSION:
+        raise ValueError("unsupported_save_version")
+    chain = []
+    for from_version in range(version, persistence.SAVE_VERSION):
+        migration = MIGRATIONS.get(from_version)
+        if migration is None:
+            raise ValueError("unsupported_save_version")
+        chain.append(migration)
+    return chain
+
+
+def migrate_record(chain: Iterable[Migration], key: str, record: dict[str, Any]) -> dict[str, Any]:
+    """Upgrade one streamed record through a migration chain."""
+
+    for migration in chain:
+        hook = migration.records.get(key)
+        if hook is not None:
+            record = hook(record)
+    return record
+
+
+def migrate_state(chain: Iterable[Migration], scalars: dict[str, Any]) -> None:
+    """Upgrade scalar state fields through a migration chain in place."""
+
+    for migration in chain:
+        if migration.state is not None:
+            migration.state(scalars)
+
+
+def migrate_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """Upgrade an in-memory save payload to the current save version."""
+
+    chain = migration_chain(payload.get("version", 0))
+    if not chain:
+        return payload
+    state = payload.get("state")
+    state = state if isinstance(state, dict) else {}
+    records = {key: state.pop(key, []) for key in STREAMED_KEYS}
+    migrate_state(chain, state)
+    for key, entries in records.items():
+        state[key] = [
+            migrate_record(chain, key, entry)
+            for entry in (entries if isinstance(entries, list) else [])
+            if isinstance(entry, dict)
+        ]
+    payload["state"] = state
+    payload["version"] = persistence.SAVE_VERSION
+    payload["meta"] = persistence.payload_metadata(state)
+    return payload
+
+
+def upgrade_slot(store: persistence.SaveStore, slot_index: int) -> None:
+    """Upgrade a slot's save file to the current version in place.
+
+    Does nothing for missing slots or saves already at the current version;
+    for binary saves that check only reads the fixed header. Journals are left
+    alone: they were introduced with the current version, so their records
+    never need upgrading.
+    """
+
+    with persistence.SLOT_FILES_LOCK:
+        path = next((path for path in store.candidate_slot_paths(slot_index) if path.exists()), None)
+        if path is None:
+            return
+        with path.open("rb") as handle:
+            prefix = handle.read(binary_save.HEADER_SIZE)
+        if binary_save.is_binary_save(prefix):
+            if binary_save.read_header(prefix).save_version == persistence.SAVE_VERSION:
+                return
+            _upgrade_binary_save(store, slot_index, path)
+        else:
+            upgrade_json_save(path)
+
+
+def upgrade_json_save(path: Path) -> int | None:
+    """Stream an older JSON save into the current version, replacing it.
+
+    Returns the version the file was upgraded from, or None when it was
+    already current.
+    """
+
+    top: dict[str, Any] = {}
+    scalars: dict[str, Any] = {}
+    counts = dict.fromkeys(STREAMED_KEYS, 0)
+    with ExitStack() as stack:
+        spools = {
+            key: stack.enter_context(tempfile.TemporaryFile("w+", encoding="utf-8"))
+            for key in STREAMED_KEYS
+        }
+        try:
+            with path.open(encoding="utf-8") as handle:
+                reader = JsonStreamReader(handle)
+                for key in reader.iter_object():
+                    if key == "meta":
+                        meta = reader.value()
+                        if isinstance(meta, dict) and meta.get("version") == persistence.SAVE_VERSION:
+                            return None
+                    elif key == "state" and reader.peek() == "{":
+                        _spool_state(reader, scalars, spools, counts)
+                    else:
+                        top[key] = reader.value()
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise ValueError("corrupt_save_file") from exc
+
+        version = top.get("version", 0)
+        if version == persistence.SAVE_VERSION:
+            return None
+        chain = migration_chain(version)
+        migrate_state(chain, scalars)
+        meta = persistence.payload_metadata(scalars)
+        meta["roster_size"] = counts["roster"]
+        top["version"] = persistence.SAVE_VERSION
+        # The checksum goes in the meta entry at the top of the file, so the
+        # body is staged in a temp file before the replacement is written.
+        body = stack.enter_context(tempfile.TemporaryFile())
+        meta["checksum"] = persistence.write_json_save_body(
+            body.write,
+            top,
+            scalars,
+            {key: _migrated_records(chain, key, spool) for key, spool in spools.items()},
+        )
+        body.seek(0)
+        with persistence.atomic_writer(path) as out:
+            out.write(persistence.json_save_head(meta))
+            shutil.copyfileobj(body, out)
+    return version
+
+
+def _migrated_records(chain: list[Migration], key: str, spool: Any) -> Iterator[dict[str, Any]]:
+    spool.seek(0)
+    for line in spool:
+        yield migrate_record(chain, key, json.loads(line))
+
+
+def _spool_state(
+    reader: JsonStreamReader,
+    scalars: dict[str, Any],
+    spools: dict[str, Any],
+    counts: dict[str, int],
+) -> None:
+    """Read the state object, spooling streamed records one per line."""
+
+    for key in reader.iter_object():
+        if key in spools and reader.peek() == "[":
+            spool = spools[key]
+            for entry in reader.iter_array():
+                if isinstance(entry, dict):
+                    spool.write(json.dumps(entry, separators=(",", ":")) + "\n")
+                    counts[key] += 1
+        else:
+            scalars[key] = reader.value()
+
+
+def _upgrade_binary_save(
+    store: persistence.SaveStore,
+    slot_index: int,
+    path: Path,
+) -> int | None:
+    """Upgrade an older binary save in memory and rewrite it."""
+
+    payload = binary_save.decode_payload(path.read_bytes())
+    version = payload.get("version", 0)
+    if version == persistence.SAVE_VERSION:
+        return None
+    migrate_payload(payload)
+    slot = store.slot_info(slot_index)
+    save_format = slot.save_format if slot is not None and slot.save_format != "json" else "binary"
+    store.write_file(path, persistence.encode_save_bytes(payload, save_format))
+    return version
+
+
+def _upgrade_rng_state(scalars: dict[str, Any]) -> None:
+    rng_state = scalars.get("rng_state")
+    if isinstance(rng_state, list):
+        scalars["rng_state"] = persistence.pack_rng_state(rng_state)
+    scalars.setdefault("last_show_rating", None)
+
+
+# Version 1 and 2 share the state layout; version 2 guarantees the rivalry and
+# cooldown tables, which upgrades always write (empty when absent).
+register_migration(Migration(from_version=1))
+# Version 3 packs the RNG state and records the last show rating.
+register_migration(Migration(from_version=2, state=_upgrade_rng_state))
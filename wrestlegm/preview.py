@@ -0,0 +1,195 @@
+"""Expected-rating and win-odds previews for booked slots."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    TYPE_CHECKING,
+)
+
+from wrestlegm import constants
+from wrestlegm.models import Match, MatchTypeDefinition, Promo, ShowSlot, WrestlerState
+from wrestlegm.sim import (
+    MatchContext,
+    RivalryRatingContext,
+    match_rating_modifiers,
+    match_rating_score,
+    match_rating_stars,
+    outcome_probabilities,
+    promo_rating_score,
+    promo_rating_stars,
+)
+
+if TYPE_CHECKING:
+    from wrestlegm.state import GameState
+
+
+@dataclass(frozen=True)
+class SlotPreview:
+    """Expected star rating and per-wrestler win chances for one slot."""
+
+    expected_rating: float
+    win_odds: Mapping[str, float]
+
+
+def expected_stars(
+    score_100: float,
+    variance: int,
+    to_stars: Callable[[float], float],
+) -> float:
+    """Return the mean star rating over every equally likely integer swing."""
+
+    swings = range(-variance, variance + 1)
+    return sum(to_stars(score_100 + swing) for swing in swings) / len(swings)
+
+
+def preview_match(
+    match: Match,
+    roster: Mapping[str, WrestlerState],
+    match_types: Mapping[str, MatchTypeDefinition],
+    rivalry_context: RivalryRatingContext | None = None,
+) -> SlotPreview:
+    """Preview a match with the same math the simulation engine samples from."""
+
+    match_type = match_types[match.match_type_id]
+    wrestlers = [roster[wrestler_id] for wrestler_id in match.wrestler_ids]
+    context = MatchContext(
+        wrestlers=wrestlers,
+        match_type=match_type,
+        rivalry_context=rivalry_context,
+    )
+    _, _, p_final = outcome_probabilities(wrestlers, match_type.modifiers)
+    score_100 = match_rating_score(context, match_rating_modifiers())
+    return SlotPreview(
+        expected_rating=expected_stars(
+            score_100,
+            match_type.modifiers.rating_variance,
+            match_rating_stars,
+        ),
+        win_odds=dict(zip(match.wrestler_ids, p_final)),
+    )
+
+
+def preview_promo(promo: Promo, roster: Mapping[str, WrestlerState]) -> SlotPreview:
+    """Preview a promo's expected star rating."""
+
+    return SlotPreview(
+        expected_rating=expected_stars(
+            promo_rating_score(roster[promo.wrestler_id]),
+            constants.PROMO_VARIANCE,
+            promo_rating_stars,
+        ),
+        win_odds={},
+    )
+
+
+def projected_show_rating(previews: Iterable[SlotPreview | None]) -> float | None:
+    """Return the mean expected rating of the previewed slots, or None if none."""
+
+    ratings = [preview.expected_rating for preview in previews if preview is not None]
+    if not ratings:
+        return None
+    return sum(ratings) / len(ratings)
+
+
+def preview_slot(state: GameState, slot: ShowSlot) -> SlotPreview:
+    """Compute one slot's preview from game state without touching any cache."""
+
+    if isinstance(slot, Match):
+        return preview_match(
+            slot,
+            state.roster,
+            state.match_types,
+            state.rivalry_manager.rivalry_context_for_match(slot),
+        )
+    return preview_promo(slot, state.roster)
+
+
+def _slot_key(slot: ShowSlot) -> Hashable:
+    """Return a cache key describing a slot's contents."""
+
+    if isinstance(slot, Match):
+        return (
+            "match",
+            tuple(slot.wrestler_ids),
+            slot.match_category_id,
+            slot.match_type_id,
+        )
+    return ("promo", slot.wrestler_id)
+
+
+class PreviewCache:
+    """Slot previews keyed by slot contents, valid until the roster changes.
+
+    Previews depend on wrestler stats and rivalry state, which only move when
+    a show finishes (bumping the roster version) or a different game is
+    loaded (replacing the roster), so either one drops every entry. Entries
+    survive re-booking, so moving a match between slots or reopening it
+    reuses the earlier result.
+
+    The cache is not locked and belongs to the UI thread. Workers compute
+    with :func:`preview_slot` and hand results back for :meth:`store`.
+    """
+
+    def __init__(self) -> None:
+        self._roster: Mapping[str, WrestlerState] | None = None
+        self._version = -1
+        self._entries: Dict[Hashable, SlotPreview] = {}
+
+    def _sync(self, state: GameState) -> None:
+        if state.roster is not self._roster or state.roster_version != self._version:
+            self._roster = state.roster
+            self._version = state.roster_version
+            self._entries = {}
+
+    def get(self, state: GameState, slot: ShowSlot | None) -> SlotPreview | None:
+        """Return the cached preview for a slot without computing it."""
+
+        if slot is None:
+            return None
+        self._sync(state)
+        return self._entries.get(_slot_key(slot))
+
+    def cached(
+        self,
+        state: GameState,
+        slots: Sequence[ShowSlot | None],
+    ) -> List[SlotPreview | None] | None:
+        """Return previews for all slots if every booked slot is cached."""
+
+        previews = [self.get(state, slot) for slot in slots]
+        for slot, preview in zip(slots, previews):
+            if slot is not None and preview is None:
+                return None
+        return previews
+
+    def store(self, state: GameState, slot: ShowSlot, preview: SlotPreview) -> None:
+        """Cache a preview computed elsewhere for the current roster."""
+
+        self._sync(state)
+        self._entries[_slot_key(slot)] = preview
+
+    def preview(self, state: GameState, slot: ShowSlot) -> SlotPreview:
+        """Return a slot's preview, computing and caching it when missing."""
+
+        preview = self.get(state, slot)
+        if preview is None:
+            preview = preview_slot(state, slot)
+            self.store(state, slot, preview)
+        return preview
+
+    def previews(
+        self,
+        state: GameState,
+        slots: Sequence[ShowSlot | None],
+    ) -> List[SlotPreview | None]:
+        """Return previews for each slot, None for empty slots."""
+
+        return [None if slot is None else self.preview(state, slot) for slot in slots]
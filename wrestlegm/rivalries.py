@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, insort
+from collections import deque
 from itertools import combinations
 from typing import Iterable
 
@@ -16,6 +18,9 @@ from wrestlegm.models import (
 )
 from wrestlegm.sim import RivalryRatingContext
 
+RIVALRY_ORDERS = ("heat", "expiry")
+RIVALRY_CHANGE_HISTORY = 32
+
 
 def ordered_pairs(wrestler_ids: Iterable[str]) -> list[tuple[str, str]]:
     """Return ordered unique pairs based on the wrestler list order."""
@@ -30,6 +35,28 @@ class RivalryManager:
     def __init__(self) -> None:
         self.rivalry_states: dict[PairKey, RivalryState] = {}
         self.cooldown_states: dict[PairKey, CooldownState] = {}
+        self.shows_advanced = 0
+        self._changes: deque[tuple[int, frozenset[PairKey]]] = deque(
+            maxlen=RIVALRY_CHANGE_HISTORY
+        )
+
+    def changes_since(self, shows_advanced: int) -> set[PairKey] | None:
+        """Return pairs whose rivalry or cooldown was set or cleared since then.
+
+        Cooldowns counting down or expiring are not listed: every cooldown
+        ticks once per show. Returns None when the history no longer reaches
+        back that far.
+        """
+
+        if shows_advanced == self.shows_advanced:
+            return set()
+        if not self._changes or self._changes[0][0] > shows_advanced + 1:
+            return None
+        changed: set[PairKey] = set()
+        for advanced, keys in self._changes:
+            if advanced > shows_advanced:
+                changed.update(keys)
+        return changed
 
     def rivalry_value_for_pair(self, wrestler_a_id: str, wrestler_b_id: str) -> int:
         """Return the current rivalry value for a pair, or 0 if none."""
@@ -96,12 +123,14 @@ class RivalryManager:
 
         cooldown_keys = set(self.cooldown_states.keys())
         blowoff_keys: set[PairKey] = set()
+        changed: set[PairKey] = set()
 
         for slot in show.scheduled_slots:
             if not isinstance(slot, Match):
                 continue
             for wrestler_a_id, wrestler_b_id in ordered_pairs(slot.wrestler_ids):
                 key = normalize_pair(wrestler_a_id, wrestler_b_id)
+                changed.add(key)
                 if key in cooldown_keys:
                     self.rivalry_states.pop(key, None)
                     continue
@@ -136,6 +165,9 @@ class RivalryManager:
                 remaining_shows=constants.COOLDOWN_SHOWS,
             )
 
+        self.shows_advanced += 1
+        self._changes.append((self.shows_advanced, frozenset(changed)))
+
     def _rivalry_emoji(self, rivalry_value: int) -> str:
         """Return the emoji for a rivalry value."""
 
@@ -158,3 +190,103 @@ class RivalryManager:
         if remaining_shows >= 1:
             return "💧"
         return ""
+
+
+class RivalryIndex:
+    """Rivalries ordered by heat and cooldowns ordered by expiry, for paging.
+
+    Rivalries are kept as sorted (-value, pair) entries and cooldowns as
+    sorted (expiry, pair) entries, where expiry is the manager's
+    ``shows_advanced`` count at which the cooldown ends. Every cooldown ticks
+    down together, so their order never changes between shows: after
+    :meth:`RivalryManager.advance` only expired entries are cut from the
+    front and the pairs the show touched are re-filed, instead of re-sorting
+    every tracked pair.
+    """
+
+    def __init__(self, manager: RivalryManager) -> None:
+        self.manager = manager
+        self._build()
+
+    def _build(self) -> None:
+        """Index every tracked pair from scratch."""
+
+        manager = self.manager
+        advanced = manager.shows_advanced
+        self._heat = {
+            key: rivalry.rivalry_value for key, rivalry in manager.rivalry_states.items()
+        }
+        self._heat_entries = sorted((-value, key) for key, value in self._heat.items())
+        self._expiry = {
+            key: advanced + cooldown.remaining_shows
+            for key, cooldown in manager.cooldown_states.items()
+        }
+        self._expiry_entries = sorted(
+            (expiry, key) for key, expiry in self._expiry.items()
+        )
+        self._synced = advanced
+
+    def sync(self) -> None:
+        """Catch up with the manager, re-filing only pairs changed since last sync."""
+
+        manager = self.manager
+        changed = manager.changes_since(self._synced)
+        if changed is None:
+            self._build()
+            return
+        advanced = manager.shows_advanced
+        if advanced != self._synced:
+            end = bisect_left(self._expiry_entries, (advanced + 1,))
+            for _, key in self._expiry_entries[:end]:
+                del self._expiry[key]
+            del self._expiry_entries[:end]
+        for key in changed:
+            self._refile(key, advanced)
+        self._synced = advanced
+        if len(self._heat) != len(manager.rivalry_states) or len(self._expiry) != len(
+            manager.cooldown_states
+        ):
+            # The dictionaries were edited outside advance(); start over.
+            self._build()
+
+    def _refile(self, key: PairKey, advanced: int) -> None:
+        """Move one pair to its current place in both orders."""
+
+        manager = self.manager
+        value = self._heat.pop(key, None)
+        if value is not None:
+            del self._heat_entries[bisect_left(self._heat_entries, (-value, key))]
+        rivalry = manager.rivalry_states.get(key)
+        if rivalry is not None:
+            self._heat[key] = rivalry.rivalry_value
+            insort(self._heat_entries, (-rivalry.rivalry_value, key))
+
+        expiry = self._expiry.pop(key, None)
+        if expiry is not None:
+            del self._expiry_entries[bisect_left(self._expiry_entries, (expiry, key))]
+        cooldown = manager.cooldown_states.get(key)
+        if cooldown is not None:
+            expiry = advanced + cooldown.remaining_shows
+            self._expiry[key] = expiry
+            insort(self._expiry_entries, (expiry, key))
+
+    def _entries(self, order: str) -> list[tuple[int, PairKey]]:
+        if order == "heat":
+            return self._heat_entries
+        if order == "expiry":
+            return self._expiry_entries
+        raise ValueError("unknown_rivalry_order")
+
+    def count(self, order: str) -> int:
+        """Return how many pairs the order lists."""
+
+        return len(self._entries(order))
+
+    def page(self, order: str, start: int, size: int) -> list[PairKey]:
+        """Return up to `size` pairs from position `start` of the order.
+
+        Heat lists the hottest rivalries first; expiry lists the cooldowns
+        ending soonest first. Ties are ordered by pair.
+        """
+
+        return [key for _, key in self._entries(order)[start : start + size]]
@@ -0,0 +1,269 @@
+"""Roster search index for type-ahead filtering."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+import re
+from typing import Iterable, Mapping
+
+from wrestlegm import constants
+from wrestlegm.models import WrestlerState
+
+STAMINA_FACETS = ("any", "bookable", "fatigued")
+SORT_KEYS = ("popularity", "stamina", "mic_skill")
+# Shorter query words with no exact prefix match stay unmatched.
+FUZZY_MIN_LENGTH = 4
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+_TOKEN_END = "\U0010ffff"
+
+
+def search_tokens(text: str) -> list[str]:
+    """Split text into case-folded word tokens."""
+
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+def _sort_entries(values: list[int]) -> list[tuple[int, int]]:
+    """Return (-value, position) entries ordering positions by descending value."""
+
+    return sorted((-value, position) for position, value in enumerate(values))
+
+
+def _edit_variants(word: str, alphabet: str) -> set[str]:
+    """Return the strings one deletion, swap, substitution or insertion from `word`.
+
+    Insertions after the last character are left out: as prefixes they only
+    narrow what `word` itself matches.
+    """
+
+    variants: set[str] = set()
+    for split in range(len(word)):
+        head, tail = word[:split], word[split:]
+        variants.add(head + tail[1:])
+        if len(tail) > 1:
+            variants.add(head + tail[1] + tail[0] + tail[2:])
+        for character in alphabet:
+            variants.add(head + character + tail[1:])
+            variants.add(head + character + tail)
+    variants.discard(word)
+    return variants
+
+
+class RosterIndex:
+    """Prefix index over wrestler names and IDs with alignment/stamina facets.
+
+    Every name and ID token is kept in one sorted list, so each query word is
+    a bisect plus a slice over the matching tokens. A query matches wrestlers
+    that have a token starting with every query word ("ken meg" finds
+    "Kenny O-Mega"). A word of FUZZY_MIN_LENGTH or more characters that no
+    token starts with falls back to tokens starting within one typo of it
+    ("kenyy meag" still finds him). Names and IDs are fixed for a roster, so only the stamina
+    facet needs :meth:`update` after a show. The token list is built on the
+    first text query, so facet-only filtering never pays for it.
+
+    Sorting by a stat uses a permutation built on first use and then patched
+    in place: :meth:`update` re-files only the wrestlers whose sort key
+    changed, so a show re-sorts neither popularity nor mic skill. Stamina
+    recovery moves most of the roster at once, so that sort is rebuilt
+    lazily the next time it is used.
+    """
+
+    def __init__(self, roster: Mapping[str, WrestlerState]) -> None:
+        self.roster = roster
+        self._order = list(roster)
+        self._position = {
+            wrestler_id: index for index, wrestler_id in enumerate(self._order)
+        }
+        self._tokens: list[str] | None = None
+        self._token_ids: list[str] = []
+        self._alphabet = ""
+        self._alignments: dict[str, set[str]] = {}
+        for wrestler_id, wrestler in roster.items():
+            self._alignments.setdefault(wrestler.alignment, set()).add(wrestler_id)
+        self._fatigued = {
+            wrestler_id
+            for wrestler_id, wrestler in roster.items()
+            if wrestler.stamina <= constants.STAMINA_MIN_BOOKABLE
+        }
+        # Per sort key: (-value, roster position) entries kept sorted, the value
+        # each entry was filed under, and the ID list derived from the entries.
+        self._sort_entries: dict[str, list[tuple[int, int]]] = {}
+        self._sort_values: dict[str, list[int]] = {}
+        self._sort_ids: dict[str, list[str]] = {}
+
+    def update(self, wrestler_ids: Iterable[str], *, recovered: bool = False) -> None:
+        """Refresh the facets and sort orders for wrestlers whose stats changed.
+
+        With `recovered`, every other wrestler may also have regained stamina.
+        """
+
+        limit = constants.STAMINA_MIN_BOOKABLE
+        if recovered:
+            # Recovery only raises stamina: it can take wrestlers out of the
+            # fatigued facet but never into it, and it reorders the stamina
+            # sort wholesale, which is rebuilt on its next use.
+            roster = self.roster
+            self._fatigued = {
+                wrestler_id
+                for wrestler_id in self._fatigued
+                if wrestler_id in roster and roster[wrestler_id].stamina <= limit
+            }
+            self._sort_entries.pop("stamina", None)
+            self._sort_values.pop("stamina", None)
+            self._sort_ids.pop("stamina", None)
+        changed = []
+        for wrestler_id in wrestler_ids:
+            wrestler = self.roster.get(wrestler_id)
+            if wrestler is not None and wrestler.stamina <= limit:
+                self._fatigued.add(wrestler_id)
+            else:
+                self._fatigued.discard(wrestler_id)
+            position = self._position.get(wrestler_id)
+            if wrestler is not None and position is not None:
+                changed.append((position, wrestler))
+        for key, entries in self._sort_entries.items():
+            values = self._sort_values[key]
+            moves = [
+                (position, value)
+                for position, wrestler in changed
+                if (value := getattr(wrestler, key)) != values[position]
+            ]
+            if not moves:
+                continue
+            if len(moves) * 32 > len(entries):
+                # Re-filing most of the roster one entry at a time costs more
+                # than one sort.
+                for position, value in moves:
+                    values[position] = value
+                entries[:] = _sort_entries(values)
+            else:
+                for position, value in moves:
+                    del entries[bisect_left(entries, (-values[position], position))]
+                    insort(entries, (-value, position))
+                    values[position] = value
+            self._sort_ids.pop(key, None)
+
+    def sort_order(self, key: str) -> list[str]:
+        """Return wrestler IDs by descending `key`, ties in roster order."""
+
+        if key not in SORT_KEYS:
+            raise ValueError("unknown_sort_key")
+        ids = self._sort_ids.get(key)
+        if ids is None:
+            entries = self._sort_entries.get(key)
+            if entries is None:
+                values = [
+                    getattr(self.roster[wrestler_id], key) for wrestler_id in self._order
+                ]
+                entries = self._sort_entries[key] = _sort_entries(values)
+                self._sort_values[key] = values
+            order = self._order
+            ids = self._sort_ids[key] = [order[position] for _, position in entries]
+        return ids
+
+    def prefix_matches(self, prefix: str) -> set[str]:
+        """Return IDs of wrestlers with a name or ID token starting with `prefix`."""
+
+        start, end = self._prefix_range(prefix)
+        return set(self._token_ids[start:end])
+
+    def fuzzy_matches(self, word: str) -> set[str]:
+        """Return IDs with a token starting within one edit of `word`.
+
+        One dropped, extra, wrong or swapped character is allowed ("meag"
+        finds "Mega"). Each variant of the word is one prefix lookup, so a
+        five-letter word costs a few hundred bisects instead of a scan.
+        """
+
+        if self._tokens is None:
+            self._build_tokens()
+        ranges = sorted(
+            span
+            for variant in _edit_variants(word, self._alphabet)
+            if (span := self._prefix_range(variant))[0] < span[1]
+        )
+        matches: set[str] = set()
+        covered = 0
+        for start, end in ranges:
+            # Variants sharing a prefix overlap; each token is read once.
+            if end > covered:
+                matches.update(self._token_ids[max(start, covered) : end])
+                covered = end
+        return matches
+
+    def _prefix_range(self, prefix: str) -> tuple[int, int]:
+        """Return the slice of the token list holding tokens starting with `prefix`."""
+
+        tokens = self._tokens
+        if tokens is None:
+            tokens = self._build_tokens()
+        start = bisect_left(tokens, prefix)
+        return start, bisect_left(tokens, prefix + _TOKEN_END, start)
+
+    def _build_tokens(self) -> list[str]:
+        """Build the sorted token list on the first text query."""
+
+        entries = [
+            (token, wrestler_id)
+            for wrestler_id, wrestler in self.roster.items()
+            for token in (*search_tokens(wrestler.name), *search_tokens(wrestler_id))
+        ]
+        entries.sort()
+        self._tokens = [token for token, _ in entries]
+        self._token_ids = [wrestler_id for _, wrestler_id in entries]
+        self._alphabet = "".join(sorted(set("".join(dict.fromkeys(self._tokens)))))
+        return self._tokens
+
+    def search(
+        self,
+        query: str = "",
+        *,
+        alignment: str | None = None,
+        stamina: str = "any",
+        sort: str | None = None,
+    ) -> list[str]:
+        """Return IDs matching the query and facets, in roster or `sort` order."""
+
+        if stamina not in STAMINA_FACETS:
+            raise ValueError("unknown_stamina_facet")
+        candidates: set[str] | None = None
+        for token in search_tokens(query):
+            matches = self.prefix_matches(token)
+            if not matches and len(token) >= FUZZY_MIN_LENGTH:
+                matches = self.fuzzy_matches(token)
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return []
+        keep = self._facet_filter(alignment, stamina)
+        if keep is not None:
+            candidates = keep if candidates is None else candidates & keep
+        order = self._order if sort is None else self.sort_order(sort)
+        if candidates is None:
+            return list(order)
+        if len(candidates) * 8 > len(order):
+            # A linear pass over the precomputed order beats sorting a large
+            # match set.
+            return [wrestler_id for wrestler_id in order if wrestler_id in candidates]
+        if sort is None:
+            return sorted(candidates, key=self._position.__getitem__)
+        roster, position = self.roster, self._position
+        return sorted(
+            candidates,
+            key=lambda wrestler_id: (
+                -getattr(roster[wrestler_id], sort),
+                position[wrestler_id],
+            ),
+        )
+
+    def _facet_filter(self, alignment: str | None, stamina: str) -> set[str] | None:
+        """Return the IDs allowed by the facets, or None when unfiltered."""
+
+        keep = self._alignments.get(alignment, set()) if alignment else None
+        if stamina == "fatigued":
+            return self._fatigued if keep is None else keep & self._fatigued
+        if stamina == "bookable":
+            if keep is None:
+                return set(self._order).difference(self._fatigued)
+            return keep - self._fatigued
+        return keep
@@ -2,95 +2,412 @@
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
-from typing import Iterable
+import threading
+import time
+from typing import Callable, Iterable, Iterator, TYPE_CHECKING
 
-from wrestlegm import persistence
+from wrestlegm import migrations, persistence
 from wrestlegm.models import MatchTypeDefinition, WrestlerDefinition
 from wrestlegm.state import GameState
 
+if TYPE_CHECKING:
+    from wrestlegm.sqlite_save import SqliteSaveStore
+
+LOGGER = logging.getLogger(__name__)
+
+SAVE_BACKENDS = ("files", "sqlite")
+
 
 class SessionManager:
     """Own save/load flows and slot metadata state."""
 
     def __init__(
         self,
-        wrestlers: Iterable[WrestlerDefinition],
+        wrestlers: Iterable[WrestlerDefinition]
+        | Callable[[], Iterable[WrestlerDefinition]],
         match_types: Iterable[MatchTypeDefinition],
         *,
         seed: int = 1337,
         save_dir: Path | None = None,
+        save_format: str = persistence.DEFAULT_SAVE_FORMAT,
+        journal_mode: bool = False,
+        save_backend: str = "files",
+        autosave_every: int | None = None,
+        autosave_interval: float | None = None,
+        backup_count: int = 0,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
-        self._wrestler_defs = list(wrestlers)
+        """Create a session manager.
+
+        `wrestlers` is a reusable collection of definitions or a factory such
+        as ``lambda: iter_wrestlers(path)``; a factory is called on every
+        :meth:`new_game`, so the session never holds the definitions. Autosave is off unless `autosave_every` (shows) or `autosave_interval`
+        (seconds) is set; see :meth:`show_completed`. With `backup_count`, each
+        save also snapshots the slot into a ring of that many rolling backups
+        (file backend only).
+        """
+
+        if save_format not in persistence.SAVE_FORMATS:
+            raise ValueError("unknown_save_format")
+        if save_backend not in SAVE_BACKENDS:
+            raise ValueError("unknown_save_backend")
+        if backup_count and save_backend != "files":
+            raise ValueError("backups_require_file_backend")
+        if isinstance(wrestlers, Iterator):
+            raise ValueError("wrestler_iterator_not_reusable")
+        self._wrestler_source: Callable[[], Iterable[WrestlerDefinition]] = (
+            wrestlers if callable(wrestlers) else lambda: wrestlers
+        )
         self._match_type_defs = list(match_types)
         self._default_seed = seed
         self._save_dir = save_dir
+        self._database: SqliteSaveStore | None = None
+        if save_backend == "sqlite":
+            # Imported here so file-backed sessions never load sqlite3.
+            from wrestlegm.sqlite_save import DATABASE_NAME, SqliteSaveStore
+
+            self._database = SqliteSaveStore(
+                (save_dir or persistence.DEFAULT_SAVE_DIR) / DATABASE_NAME
+            )
+            self._store: persistence.SaveStore | SqliteSaveStore = self._database
+        else:
+            self._store = persistence.get_save_store(save_dir)
+        self._default_save_format = save_format
+        self._journal_mode = journal_mode
+        self._journal: persistence.SlotJournal | None = None
+        self._saver = BackgroundSaver()
+        self._autosave_every = autosave_every
+        self._autosave_interval = autosave_interval
+        self._backup_count = backup_count
+        self._clock = clock
+        self._shows_since_save = 0
+        self._last_save_time = clock()
+        self._active_slot_name: str | None = None
+        self._active_save_format: str | None = None
         self.current_slot_index: int | None = None
         self.pending_slot_name: str | None = None
+        self.pending_save_format: str | None = None
 
     def list_slots(self) -> list[persistence.SaveSlotInfo]:
         """Return slot metadata for selection screens."""
 
-        return persistence.load_slot_index(self._save_dir)
+        return self._store.list_slots()
 
-    def new_game(self, slot_index: int, slot_name: str) -> GameState:
-        """Start a new session and assign the active slot."""
+    def slot_metadata(self, slot_index: int) -> persistence.SaveMetadata | None:
+        """Return header metadata for a saved slot, or None if unreadable."""
 
+        try:
+            return self._store.read_metadata(slot_index)
+        except (OSError, ValueError):
+            LOGGER.warning("Unable to read save metadata for slot %s.", slot_index)
+            return None
+
+    def new_game(
+        self,
+        slot_index: int,
+        slot_name: str,
+        *,
+        save_format: str | None = None,
+    ) -> GameState:
+        """Start a new session and assign the active slot and its save format."""
+
+        if save_format is not None and save_format not in persistence.SAVE_FORMATS:
+            raise ValueError("unknown_save_format")
         state = GameState(
-            self._wrestler_defs,
+            self._wrestler_source(),
             self._match_type_defs,
             seed=self._default_seed,
         )
         self.current_slot_index = slot_index
         self.pending_slot_name = slot_name
+        self.pending_save_format = save_format
+        self._active_slot_name = None
+        self._active_save_format = None
+        self._journal = None
+        self._reset_autosave()
+        if self._database is not None:
+            self._database.forget_baseline(slot_index)
         return state
 
     def load_game(self, slot_index: int) -> GameState:
         """Load a saved slot and return a hydrated GameState."""
 
-        slots = persistence.load_slot_index(self._save_dir)
-        slot_info = next((slot for slot in slots if slot.slot_index == slot_index), None)
+        # A save queued when the player left the last session may still be
+        # writing this slot.
+        self._saver.flush()
+        slot_info = self._store.slot_info(slot_index)
         if slot_info is None or not slot_info.exists:
             raise ValueError("empty_slot")
         try:
-            payload = persistence.load_save_payload(slot_index, self._save_dir)
+            if self._database is None:
+                # Rewrites older save files in place so later loads skip this.
+                migrations.upgrade_slot(self._store, slot_index)
+            payload = self._store.load_payload(slot_index)
         except FileNotFoundError as exc:
             raise ValueError("missing_save_file") from exc
-        version = payload.get("version", 0)
-        if version != persistence.SAVE_VERSION:
-            raise ValueError("unsupported_save_version")
+        if payload.get("version", 0) != persistence.SAVE_VERSION:
+            payload = migrations.migrate_payload(payload)
         state_payload = payload.get("state", {})
-        state = GameState(
-            self._wrestler_defs,
+        state = GameState.from_payload(
+            state_payload,
             self._match_type_defs,
-            seed=state_payload.get("rng_seed", self._default_seed),
+            seed=self._default_seed,
         )
-        persistence.deserialize_game_state(state, state_payload)
         self.current_slot_index = slot_index
         self.pending_slot_name = None
+        self.pending_save_format = None
+        self._active_slot_name = slot_info.name
+        self._active_save_format = slot_info.save_format
+        self._journal = None
+        self._reset_autosave()
+        if self._database is not None:
+            self._database.reset_baseline(slot_index, state)
+        elif self._journal_mode:
+            self._journal = persistence.SlotJournal(
+                slot_index,
+                self._save_dir,
+                save_format=slot_info.save_format,
+            )
+            self._journal.reset_baseline(state)
         return state
 
     def save_current_slot(self, state: GameState) -> None:
         """Persist the current slot if one is active."""
 
-        if self.current_slot_index is None:
+        job = self._prepare_save(state)
+        if job is None:
             return
-        slots = persistence.load_slot_index(self._save_dir)
-        slot_info = next(
-            (slot for slot in slots if slot.slot_index == self.current_slot_index),
-            None,
+        self._saver.flush()
+        job()
+
+    def save_current_slot_async(
+        self,
+        state: GameState,
+        on_complete: Callable[[BaseException | None], None] | None = None,
+    ) -> bool:
+        """Snapshot the current slot now and write it on a background thread.
+
+        Returns False when no slot is active. Requests that arrive while an
+        earlier one is still queued replace it; every caller's `on_complete`
+        still fires once the newest snapshot lands.
+
+        `on_complete` runs on the saver thread, not the caller's. UI callers
+        must hand the result back to the app thread, for example with
+        Textual's thread-safe ``post_message``. A blocking
+        ``call_from_thread`` can deadlock against :meth:`save_current_slot`
+        or :meth:`clear_save_slot`, which wait for the saver on the UI thread.
+        """
+
+        job = self._prepare_save(state)
+        if job is None:
+            return False
+        self._saver.submit(job, on_complete)
+        return True
+
+    def show_completed(
+        self,
+        state: GameState,
+        on_complete: Callable[[BaseException | None], None] | None = None,
+    ) -> bool:
+        """Note a finished show and autosave in the background when one is due.
+
+        An autosave is due after the first show of a new slot (so the slot
+        exists on disk), then every `autosave_every` shows, or on the first
+        show at least `autosave_interval` seconds after the last save. Bursts
+        are coalesced by the background saver. Returns True when a save was
+        queued. Shows left unsaved by the schedule are written by
+        :meth:`save_unsaved_shows` when the player leaves the session.
+
+        As with :meth:`save_current_slot_async`, `on_complete` runs on the
+        saver thread and UI callers must marshal it back to the app thread.
+        """
+
+        if self.current_slot_index is None:
+            return False
+        if not self.autosave_enabled:
+            return False
+        self._shows_since_save += 1
+        due = (
+            # A new slot is not on disk until its first save.
+            self.pending_slot_name is not None
+            or (
+                self._autosave_every is not None
+                and self._shows_since_save >= self._autosave_every
+            )
+            or (
+                self._autosave_interval is not None
+                and self._clock() - self._last_save_time >= self._autosave_interval
+            )
         )
-        slot_name = None
-        if slot_info and slot_info.exists:
-            slot_name = slot_info.name
-        if slot_name is None:
-            slot_name = self.pending_slot_name
+        if not due:
+            return False
+        return self.save_current_slot_async(state, on_complete)
+
+    def save_unsaved_shows(
+        self,
+        state: GameState,
+        on_complete: Callable[[BaseException | None], None] | None = None,
+    ) -> bool:
+        """Queue a save if shows have finished since the last one.
+
+        Call when the player leaves the session (main menu or quit) so an
+        autosave schedule never drops finished shows. Returns True when a save
+        was queued; `on_complete` runs on the saver thread.
+        """
+
+        if self.current_slot_index is None or self._shows_since_save == 0:
+            return False
+        return self.save_current_slot_async(state, on_complete)
+
+    @property
+    def autosave_enabled(self) -> bool:
+        """Return True when a show-count or interval autosave schedule is set."""
+
+        return self._autosave_every is not None or self._autosave_interval is not None
+
+    def flush_saves(self, timeout: float | None = None) -> bool:
+        """Wait for queued background saves; return False on timeout."""
+
+        return self._saver.flush(timeout)
+
+    def _prepare_save(self, state: GameState) -> Callable[[], None] | None:
+        """Resolve slot metadata, snapshot state, and return the write job."""
+
+        if self.current_slot_index is None:
+            return None
+        slot_name = self.pending_slot_name or self._active_slot_name
+        save_format = self.pending_save_format or self._active_save_format
+        if slot_name is None or save_format is None:
+            slot_info = self._store.slot_info(self.current_slot_index)
+            if slot_info and slot_info.exists:
+                slot_name = slot_name or slot_info.name
+                save_format = save_format or slot_info.save_format
         if slot_name is None:
             raise ValueError("save_slot_name_required")
-        persistence.save_game_state(state, self.current_slot_index, slot_name, self._save_dir)
+        save_format = save_format or self._default_save_format
+        if self._database is not None:
+            job = self._database.prepare(state, self.current_slot_index, slot_name)
+        elif self._journal_mode:
+            if self._journal is None or self._journal.save_format != save_format:
+                self._journal = persistence.SlotJournal(
+                    self.current_slot_index,
+                    self._save_dir,
+                    save_format=save_format,
+                )
+            job = self._journal.prepare(state, slot_name)
+        else:
+            payload = persistence.save_payload(state, self.current_slot_index, slot_name)
+            save_dir = self._save_dir
+
+            def job() -> None:
+                persistence.write_save_payload(payload, save_dir, save_format)
+
+        if self._backup_count:
+            job = self._with_backup(job, self.current_slot_index, state.show_index)
+        self._reset_autosave()
+        self._active_slot_name = slot_name
+        self._active_save_format = save_format
         self.pending_slot_name = None
+        self.pending_save_format = None
+        return job
+
+    def _reset_autosave(self) -> None:
+        self._shows_since_save = 0
+        self._last_save_time = self._clock()
+
+    def _with_backup(
+        self,
+        job: Callable[[], None],
+        slot_index: int,
+        show_index: int,
+    ) -> Callable[[], None]:
+        """Wrap a save job so the written slot is copied into the backup ring."""
+
+        store = self._store
+        keep = self._backup_count
+
+        def write_and_backup() -> None:
+            job()
+            store.backup_slot(slot_index, show_index, keep)
+
+        return write_and_backup
 
     def clear_save_slot(self, slot_index: int) -> None:
         """Clear a persisted save slot and its metadata."""
 
-        persistence.clear_save_slot(slot_index, self._save_dir)
+        self._saver.flush()
+        if self._journal is not None and self._journal.slot_index == slot_index:
+            self._journal.wait_for_compaction()
+            self._journal = None
+        if slot_index == self.current_slot_index:
+            self._active_slot_name = None
+            self._active_save_format = None
+        self._store.clear_slot(slot_index)
+
+
+class BackgroundSaver:
+    """Run save jobs on a single worker thread, coalescing queued requests.
+
+    At most one job waits behind the one being written. Submitting while a job
+    is queued replaces it, since the newer snapshot supersedes the older one.
+    Completion callbacks run on the worker thread.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._pending: Callable[[], None] | None = None
+        self._callbacks: list[Callable[[BaseException | None], None]] = []
+        self._busy = False
+        self._thread: threading.Thread | None = None
+
+    def submit(
+        self,
+        job: Callable[[], None],
+        on_complete: Callable[[BaseException | None], None] | None = None,
+    ) -> None:
+        """Queue a job, replacing any job that has not started yet."""
+
+        with self._condition:
+            self._pending = job
+            if on_complete is not None:
+                self._callbacks.append(on_complete)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="wrestlegm-saver",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until no job is queued or running; return False on timeout."""
+
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is None and not self._busy,
+                timeout,
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None)
+                job, self._pending = self._pending, None
+                callbacks, self._callbacks = self._callbacks, []
+                self._busy = True
+            error: BaseException | None = None
+            try:
+                job()
+            except Exception as exc:  # Reported to callers via on_complete.
+                error = exc
+            for callback in callbacks:
+                try:
+                    callback(error)
+                except Exception:
+                    LOGGER.exception("Save completion callback failed.")
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import random
-from typing import Callable, Dict, Iterable, List, Protocol
+from typing import Callable, Dict, Iterable, Iterator, List, Protocol
 
 from wrestlegm import constants
 from wrestlegm.models import (
@@ -133,6 +133,70 @@ def lerp(start: float, end: float, amount: float) -> float:
     return start + (end - start) * amount
 
 
+def match_rating_modifiers() -> List[RatingModifier]:
+    """Return the rating modifiers applied to every match, in order."""
+
+    return [
+        AlignmentModifier(),
+        MatchTypeBonusModifier(),
+        RivalryModifier(),
+        CooldownModifier(),
+    ]
+
+
+def outcome_probabilities(
+    wrestlers: List[WrestlerState],
+    modifiers: MatchTypeModifiers,
+) -> tuple[List[float], List[float], List[float]]:
+    """Return each wrestler's power, base win chance, and final win chance."""
+
+    powers = [
+        wrestler.popularity * constants.P_WEIGHT + wrestler.stamina * constants.S_WEIGHT
+        for wrestler in wrestlers
+    ]
+    total_power = sum(powers)
+    if total_power <= 0:
+        p_base = [1 / len(wrestlers)] * len(wrestlers)
+    else:
+        p_base = [power / total_power for power in powers]
+
+    uniform = 1 / len(wrestlers)
+    p_final = [lerp(p, uniform, modifiers.outcome_chaos) for p in p_base]
+    final_total = sum(p_final)
+    if final_total <= 0:
+        p_final = [uniform] * len(wrestlers)
+    else:
+        p_final = [p / final_total for p in p_final]
+    return powers, p_base, p_final
+
+
+def match_rating_score(context: MatchContext, modifiers: List[RatingModifier]) -> float:
+    """Return a match's rating in 0-100 space before the random swing."""
+
+    pop_avg = sum(w.popularity for w in context.wrestlers) / len(context.wrestlers)
+    sta_avg = sum(w.stamina for w in context.wrestlers) / len(context.wrestlers)
+    base_100 = pop_avg * constants.POP_W + sta_avg * constants.STA_W
+    return base_100 + sum(modifier.calculate_modifier(context) for modifier in modifiers)
+
+
+def match_rating_stars(rating_100: float) -> float:
+    """Convert a swung 0-100 match rating to stars."""
+
+    return round(clamp(rating_100, 0, 100) / 20, 1)
+
+
+def promo_rating_score(wrestler: WrestlerState) -> float:
+    """Return a promo's quality in 0-100 space before the random swing."""
+
+    return wrestler.mic_skill * 0.7 + wrestler.popularity * 0.3
+
+
+def promo_rating_stars(rating_100: float) -> float:
+    """Convert a swung 0-100 promo quality to stars."""
+
+    return round((clamp(rating_100, 0, 100) / 100) * 5, 1)
+
+
 class SimulationEngine:
     """Deterministic simulation engine owning RNG and pipeline steps."""
 
@@ -152,23 +216,7 @@ class SimulationEngine:
         if not wrestlers:
             raise ValueError("Cannot simulate outcome without wrestlers.")
 
-        powers = [
-            wrestler.popularity * constants.P_WEIGHT + wrestler.stamina * constants.S_WEIGHT
-            for wrestler in wrestlers
-        ]
-        total_power = sum(powers)
-        if total_power <= 0:
-            p_base = [1 / len(wrestlers)] * len(wrestlers)
-        else:
-            p_base = [power / total_power for power in powers]
-
-        uniform = 1 / len(wrestlers)
-        p_final = [lerp(p, uniform, modifiers.outcome_chaos) for p in p_base]
-        final_total = sum(p_final)
-        if final_total <= 0:
-            p_final = [uniform] * len(wrestlers)
-        else:
-            p_final = [p / final_total for p in p_final]
+        powers, p_base, p_final = outcome_probabilities(wrestlers, modifiers)
 
         r = self.rng.random()
         cumulative = 0.0
@@ -203,26 +251,12 @@ class SimulationEngine:
         if not context.wrestlers:
             raise ValueError("Cannot simulate rating without wrestlers.")
 
-        pop_avg = sum(w.popularity for w in context.wrestlers) / len(context.wrestlers)
-        sta_avg = sum(w.stamina for w in context.wrestlers) / len(context.wrestlers)
-        base_100 = pop_avg * constants.POP_W + sta_avg * constants.STA_W
-
-        alignment_mod = 0.0
-        total_modifier = 0.0
-        for modifier in modifiers:
-            modifier_value = modifier.calculate_modifier(context)
-            total_modifier += modifier_value
-            if isinstance(modifier, AlignmentModifier):
-                alignment_mod = modifier_value
-
+        score_100 = match_rating_score(context, modifiers)
         swing = self.rng.randint(
             -context.match_type.modifiers.rating_variance,
             context.match_type.modifiers.rating_variance,
         )
-        rating_100 = clamp(base_100 + total_modifier + swing, 0, 100)
-        rating_stars = round(rating_100 / 20, 1)
-
-        return rating_stars
+        return match_rating_stars(score_100 + swing)
 
     def simulate_stat_deltas(
         self,
@@ -251,10 +285,10 @@ class SimulationEngine:
     ) -> tuple[float, float, PromoRatingDebug]:
         """Simulate a promo rating in stars and return quality in 0-100 space."""
 
-        base_100 = wrestler.mic_skill * 0.7 + wrestler.popularity * 0.3
+        base_100 = promo_rating_score(wrestler)
         swing = self.rng.randint(-constants.PROMO_VARIANCE, constants.PROMO_VARIANCE)
         rating_100 = clamp(base_100 + swing, 0, 100)
-        rating_stars = round((rating_100 / 100) * 5, 1)
+        rating_stars = promo_rating_stars(rating_100)
         debug = PromoRatingDebug(
             base_100=base_100,
             swing=swing,
@@ -294,15 +328,7 @@ class SimulationEngine:
             wrestlers,
             match_type.modifiers,
         )
-        rating = self.simulate_rating(
-            context,
-            [
-                AlignmentModifier(),
-                MatchTypeBonusModifier(),
-                RivalryModifier(),
-                CooldownModifier(),
-            ],
-        )
+        rating = self.simulate_rating(context, match_rating_modifiers())
         deltas = self.simulate_stat_deltas(
             winner_id,
             non_winner_ids,
@@ -345,16 +371,27 @@ class SimulationEngine:
     ) -> List[ShowResult]:
         """Simulate all slots in a show in card order."""
 
-        results: List[ShowResult] = []
+        return list(
+            self.iter_show(slots, roster, match_types, rivalry_context_provider)
+        )
+
+    def iter_show(
+        self,
+        slots: Iterable[ShowSlot],
+        roster: Dict[str, WrestlerState],
+        match_types: Dict[str, MatchTypeDefinition],
+        rivalry_context_provider: Callable[[Match], RivalryRatingContext] | None = None,
+    ) -> Iterator[ShowResult]:
+        """Simulate a show in card order, yielding each slot's result as it finishes."""
+
         for slot in slots:
             if isinstance(slot, Match):
                 context = None
                 if rivalry_context_provider is not None:
                     context = rivalry_context_provider(slot)
-                results.append(self.simulate_match(slot, roster, match_types, context))
+                yield self.simulate_match(slot, roster, match_types, context)
             else:
-                results.append(self.simulate_promo(slot, roster))
-        return results
+                yield self.simulate_promo(slot, roster)
 
     def aggregate_show_rating(self, results: Iterable[ShowResult]) -> float:
         """Compute the arithmetic mean of slot ratings."""
@@ -0,0 +1,493 @@
+"""SQLite save backend with unlimited slots.
+
+All slots live in one database file opened in WAL mode. Each slot is a row in
+``saves`` holding the scalar state; roster entries, rivalry/cooldown pairs and
+simulated show results live in their own tables keyed by slot, so listing
+slots never touches roster data and loading a slot is a handful of indexed
+range scans. The first save of a slot in a session writes every row; later
+saves advance the stored rows by the shows played in SQL and then only upsert
+or delete the rows those shows changed, all inside one transaction.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+import json
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Iterable, TYPE_CHECKING
+
+from wrestlegm.constants import STAMINA_RECOVERY_PER_SHOW
+from wrestlegm.persistence import (
+    DATABASE_NAME,
+    DEFAULT_SAVE_DIR,
+    SAVE_VERSION,
+    SaveBaseline,
+    SaveMetadata,
+    SaveSlotInfo,
+    SaveVerification,
+    save_payload,
+)
+
+if TYPE_CHECKING:
+    from wrestlegm.state import GameState
+
+_PAIR_KINDS = {
+    "rivalry_states": ("rivalry", "rivalry_value"),
+    "cooldown_states": ("cooldown", "remaining_shows"),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    slot_index INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    show_index INTEGER NOT NULL,
+    show_card TEXT NOT NULL,
+    rng_seed INTEGER NOT NULL,
+    rng_state TEXT,
+    last_show_rating REAL,
+    roster_size INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS roster (
+    slot_index INTEGER NOT NULL REFERENCES saves ON DELETE CASCADE,
+    wrestler_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    alignment TEXT NOT NULL,
+    popularity INTEGER NOT NULL,
+    stamina INTEGER NOT NULL,
+    mic_skill INTEGER NOT NULL,
+    PRIMARY KEY (slot_index, wrestler_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS pairs (
+    slot_index INTEGER NOT NULL REFERENCES saves ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    wrestler_a_id TEXT NOT NULL,
+    wrestler_b_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (slot_index, kind, wrestler_a_id, wrestler_b_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS shows (
+    slot_index INTEGER NOT NULL REFERENCES saves ON DELETE CASCADE,
+    show_index INTEGER NOT NULL,
+    show_rating REAL,
+    PRIMARY KEY (slot_index, show_index)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS show_results (
+    slot_index INTEGER NOT NULL,
+    show_index INTEGER NOT NULL,
+    card_position INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    rating REAL NOT NULL,
+    wrestler_id TEXT NOT NULL,
+    detail TEXT NOT NULL,
+    PRIMARY KEY (slot_index, show_index, card_position),
+    FOREIGN KEY (slot_index, show_index) REFERENCES shows ON DELETE CASCADE
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS roster_position ON roster (slot_index, position);
+CREATE INDEX IF NOT EXISTS pairs_position ON pairs (slot_index, kind, position);
+"""
+
+
+class SqliteSaveStore:
+    """Save slots stored in a single SQLite database.
+
+    Exposes the same slot browsing, loading and clearing calls as
+    :class:`wrestlegm.persistence.SaveStore`, plus :meth:`prepare` which
+    snapshots state and returns a write job for the background saver.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or DEFAULT_SAVE_DIR / DATABASE_NAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+        self._baselines: dict[int, SaveBaseline] = {}
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        with self._lock:
+            self._connection.close()
+
+    def list_slots(self) -> list[SaveSlotInfo]:
+        """Return every saved slot plus one empty slot for a new save."""
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT slot_index, name, show_index FROM saves ORDER BY slot_index"
+            ).fetchall()
+        slots = [_slot_info(*row) for row in rows]
+        next_index = rows[-1][0] + 1 if rows else 1
+        slots.append(
+            SaveSlotInfo(
+                slot_index=next_index,
+                name=None,
+                exists=False,
+                last_saved_show_index=None,
+            )
+        )
+        return slots
+
+    def slot_info(self, slot_index: int) -> SaveSlotInfo | None:
+        """Return metadata for a saved slot, or None if it is empty."""
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT slot_index, name, show_index FROM saves WHERE slot_index = ?",
+                (slot_index,),
+            ).fetchone()
+        return _slot_info(*row) if row is not None else None
+
+    def read_metadata(self, slot_index: int) -> SaveMetadata | None:
+        """Return summary metadata for a saved slot from its ``saves`` row."""
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT roster_size, show_index, last_show_rating FROM saves"
+                " WHERE slot_index = ?",
+                (slot_index,),
+            ).fetchone()
+        if row is None:
+            return None
+        roster_size, show_index, last_show_rating = row
+        return SaveMetadata(
+            roster_size=roster_size,
+            show_count=max(show_index - 1, 0),
+            last_show_rating=last_show_rating,
+        )
+
+    def show_ratings(self, slot_index: int) -> list[tuple[int, float | None]]:
+        """Return (show index, show rating) for every saved show of a slot."""
+
+        with self._lock:
+            return self._connection.execute(
+                "SELECT show_index, show_rating FROM shows WHERE slot_index = ?"
+                " ORDER BY show_index",
+                (slot_index,),
+            ).fetchall()
+
+    def load_payload(self, slot_index: int) -> dict[str, Any]:
+        """Rebuild a JSON-shaped save payload for a slot."""
+
+        with self._lock:
+            connection = self._connection
+            row = connection.execute(
+                "SELECT name, version, show_index, show_card, rng_seed, rng_state,"
+                " last_show_rating FROM saves WHERE slot_index = ?",
+                (slot_index,),
+            ).fetchone()
+            if row is None:
+                raise FileNotFoundError(f"{self.path}#slot_{slot_index}")
+            roster = connection.execute(
+                "SELECT wrestler_id, name, alignment, popularity, stamina, mic_skill"
+                " FROM roster WHERE slot_index = ? ORDER BY position",
+                (slot_index,),
+            ).fetchall()
+            pairs = {
+                key: connection.execute(
+                    "SELECT wrestler_a_id, wrestler_b_id, value FROM pairs"
+                    " WHERE slot_index = ? AND kind = ? ORDER BY position",
+                    (slot_index, kind),
+                ).fetchall()
+                for key, (kind, _) in _PAIR_KINDS.items()
+            }
+        name, version, show_index, show_card, rng_seed, rng_state, last_show_rating = row
+        state: dict[str, Any] = {
+            "roster": [
+                {
+                    "id": wrestler_id,
+                    "name": wrestler_name,
+                    "alignment": alignment,
+                    "popularity": popularity,
+                    "stamina": stamina,
+                    "mic_skill": mic_skill,
+                }
+                for wrestler_id, wrestler_name, alignment, popularity, stamina, mic_skill in roster
+            ],
+            "show_index": show_index,
+            "show_card": json.loads(show_card),
+            "rng_seed": rng_seed,
+            "rng_state": json.loads(rng_state) if rng_state is not None else None,
+            "last_show_rating": last_show_rating,
+        }
+        for key, (_, value_key) in _PAIR_KINDS.items():
+            state[key] = [
+                {"wrestler_a_id": a_id, "wrestler_b_id": b_id, value_key: value}
+                for a_id, b_id, value in pairs[key]
+            ]
+        return {
+            "version": version,
+            "slot": {"slot_index": slot_index, "name": name},
+            "state": state,
+        }
+
+    def reset_baseline(self, slot_index: int, state: GameState) -> None:
+        """Treat the given state as already persisted (e.g. right after a load)."""
+
+        self._baselines[slot_index] = SaveBaseline.capture(state)
+
+    def forget_baseline(self, slot_index: int) -> None:
+        """Make the next save of a slot rewrite it in full."""
+
+        self._baselines.pop(slot_index, None)
+
+    def prepare(self, state: GameState, slot_index: int, slot_name: str) -> Callable[[], None]:
+        """Snapshot the state now and return a job that writes it.
+
+        Without a baseline every row of the slot is rewritten; otherwise the
+        stored rows are advanced by the shows played since the stored show
+        index and only the rows the shows changed are upserted or deleted.
+        """
+
+        baseline = SaveBaseline.capture(state)
+        previous = self._baselines.get(slot_index)
+        show = _show_rows(state)
+        if previous is None:
+            payload = save_payload(state, slot_index, slot_name)
+            record = payload["state"]
+        else:
+            record = previous.delta_record(state)
+        roster_size = len(state.roster)
+
+        def write() -> None:
+            with self._lock, self._connection as connection:
+                if previous is None:
+                    connection.execute("DELETE FROM saves WHERE slot_index = ?", (slot_index,))
+                else:
+                    _advance_shows(connection, slot_index, record)
+                _upsert_save(connection, slot_index, slot_name, roster_size, record)
+                _write_roster(connection, slot_index, record["roster"])
+                for key in _PAIR_KINDS:
+                    _write_pairs(
+                        connection,
+                        slot_index,
+                        key,
+                        record[key],
+                        record.get(f"{key}_removed", ()),
+                    )
+                connection.execute(
+                    "DELETE FROM pairs WHERE slot_index = ? AND kind = 'cooldown' AND value <= 0",
+                    (slot_index,),
+                )
+                if show is not None:
+                    _write_show(connection, slot_index, *show)
+            self._baselines[slot_index] = baseline
+
+        return write
+
+    def save(self, state: GameState, slot_index: int, slot_name: str) -> None:
+        """Persist the state for a slot immediately."""
+
+        self.prepare(state, slot_index, slot_name)()
+
+    def clear_slot(self, slot_index: int) -> None:
+        """Delete a slot and all of its rows."""
+
+        with self._lock, self._connection as connection:
+            connection.execute("DELETE FROM saves WHERE slot_index = ?", (slot_index,))
+        self._baselines.pop(slot_index, None)
+
+
+def verify_database(path: Path) -> SaveVerification:
+    """Run ``PRAGMA integrity_check`` on a save database, opened read-only.
+
+    The result is reported under slot 0 since one database holds every slot;
+    a file that is not a readable database fails as "integrity".
+    """
+
+    try:
+        connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            rows = connection.execute("PRAGMA integrity_check").fetchall()
+        finally:
+            connection.close()
+    except sqlite3.DatabaseError:
+        return SaveVerification(0, path, True, ("integrity",))
+    ok = rows == [("ok",)]
+    return SaveVerification(0, path, True, () if ok else ("integrity",))
+
+
+def _slot_info(slot_index: int, name: str, show_index: int) -> SaveSlotInfo:
+    return SaveSlotInfo(
+        slot_index=slot_index,
+        name=name,
+        exists=True,
+        last_saved_show_index=max(show_index - 1, 0),
+    )
+
+
+def _upsert_save(
+    connection: sqlite3.Connection,
+    slot_index: int,
+    slot_name: str,
+    roster_size: int,
+    record: dict[str, Any],
+) -> None:
+    rng_state = record.get("rng_state")
+    connection.execute(
+        "INSERT INTO saves (slot_index, name, version, show_index, show_card, rng_seed,"
+        " rng_state, last_show_rating, roster_size, updated_at)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        " ON CONFLICT (slot_index) DO UPDATE SET name = excluded.name,"
+        " version = excluded.version, show_index = excluded.show_index,"
+        " show_card = excluded.show_card, rng_seed = excluded.rng_seed,"
+        " rng_state = excluded.rng_state, last_show_rating = excluded.last_show_rating,"
+        " roster_size = excluded.roster_size, updated_at = excluded.updated_at",
+        (
+            slot_index,
+            slot_name,
+            SAVE_VERSION,
+            record["show_index"],
+            json.dumps(record["show_card"], separators=(",", ":")),
+            record["rng_seed"],
+            json.dumps(rng_state, separators=(",", ":")) if rng_state is not None else None,
+            record.get("last_show_rating"),
+            roster_size,
+            time.time(),
+        ),
+    )
+
+
+def _advance_shows(
+    connection: sqlite3.Connection,
+    slot_index: int,
+    record: dict[str, Any],
+) -> None:
+    """Apply a delta record's implied recovery and cooldown ticks in SQL.
+
+    Mirrors :func:`wrestlegm.persistence.apply_journal_records`: the shows
+    since the stored show index recover every wrestler's stamina and tick
+    every cooldown down, and the record's explicit rows then overwrite that.
+    """
+
+    if record.get("pairs_full"):
+        connection.execute("DELETE FROM pairs WHERE slot_index = ?", (slot_index,))
+    row = connection.execute(
+        "SELECT show_index FROM saves WHERE slot_index = ?", (slot_index,)
+    ).fetchone()
+    if row is None:
+        return
+    shows = record["show_index"] - row[0]
+    if shows <= 0:
+        return
+    connection.execute(
+        "UPDATE roster SET stamina = MIN(100, stamina + ?)"
+        " WHERE slot_index = ? AND stamina < 100",
+        (STAMINA_RECOVERY_PER_SHOW * shows, slot_index),
+    )
+    connection.execute(
+        "UPDATE pairs SET value = value - ? WHERE slot_index = ? AND kind = 'cooldown'",
+        (shows, slot_index),
+    )
+
+
+def _write_roster(
+    connection: sqlite3.Connection,
+    slot_index: int,
+    entries: Iterable[dict[str, Any]],
+) -> None:
+    # New rows are appended after the current last position so load order
+    # matches the in-memory roster order.
+    connection.executemany(
+        "INSERT INTO roster (slot_index, wrestler_id, position, name, alignment,"
+        " popularity, stamina, mic_skill)"
+        " VALUES (?1, ?2, (SELECT COALESCE(MAX(position), -1) + 1 FROM roster"
+        " WHERE slot_index = ?1), ?3, ?4, ?5, ?6, ?7)"
+        " ON CONFLICT (slot_index, wrestler_id) DO UPDATE SET name = excluded.name,"
+        " alignment = excluded.alignment, popularity = excluded.popularity,"
+        " stamina = excluded.stamina, mic_skill = excluded.mic_skill",
+        [
+            (
+                slot_index,
+                entry["id"],
+                entry["name"],
+                entry["alignment"],
+                entry["popularity"],
+                entry["stamina"],
+                entry["mic_skill"],
+            )
+            for entry in entries
+        ],
+    )
+
+
+def _write_pairs(
+    connection: sqlite3.Connection,
+    slot_index: int,
+    key: str,
+    entries: Iterable[dict[str, Any]],
+    removed: Iterable[Iterable[str]],
+) -> None:
+    kind, value_key = _PAIR_KINDS[key]
+    connection.executemany(
+        "DELETE FROM pairs WHERE slot_index = ? AND kind = ?"
+        " AND wrestler_a_id = ? AND wrestler_b_id = ?",
+        [(slot_index, kind, *pair_key) for pair_key in removed],
+    )
+    connection.executemany(
+        "INSERT INTO pairs (slot_index, kind, wrestler_a_id, wrestler_b_id, position, value)"
+        " VALUES (?1, ?2, ?3, ?4, (SELECT COALESCE(MAX(position), -1) + 1 FROM pairs"
+        " WHERE slot_index = ?1 AND kind = ?2), ?5)"
+        " ON CONFLICT (slot_index, kind, wrestler_a_id, wrestler_b_id)"
+        " DO UPDATE SET value = excluded.value",
+        [
+            (
+                slot_index,
+                kind,
+                entry["wrestler_a_id"],
+                entry["wrestler_b_id"],
+                entry[value_key],
+            )
+            for entry in entries
+        ],
+    )
+
+
+def _show_rows(state: GameState) -> tuple[int, float | None, list[tuple[Any, ...]]] | None:
+    """Snapshot the last simulated show as rows for the show tables."""
+
+    show = state.last_show
+    if show is None:
+        return None
+    rows = []
+    for position, result in enumerate(show.results):
+        detail = asdict(result)
+        if "winner_id" in detail:
+            kind, wrestler_id = "match", detail.pop("winner_id")
+        else:
+            kind, wrestler_id = "promo", detail.pop("wrestler_id")
+        rating = detail.pop("rating")
+        rows.append(
+            (position, kind, rating, wrestler_id, json.dumps(detail, separators=(",", ":")))
+        )
+    return show.show_index, show.show_rating, rows
+
+
+def _write_show(
+    connection: sqlite3.Connection,
+    slot_index: int,
+    show_index: int,
+    show_rating: float | None,
+    rows: list[tuple[Any, ...]],
+) -> None:
+    connection.execute(
+        "INSERT INTO shows (slot_index, show_index, show_rating) VALUES (?, ?, ?)"
+        " ON CONFLICT (slot_index, show_index) DO UPDATE SET show_rating = excluded.show_rating",
+        (slot_index, show_index, show_rating),
+    )
+    connection.executemany(
+        "INSERT OR REPLACE INTO show_results (slot_index, show_index, card_position, kind,"
+        " rating, wrestler_id, detail) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(slot_index, show_index, *row) for row in rows],
+    )
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List
 
-from wrestlegm import constants
+from wrestlegm import constants, persistence
 from wrestlegm.models import (
     Match,
     MatchTypeDefinition,
@@ -18,7 +19,11 @@ from wrestlegm.models import (
     WrestlerState,
 )
 from wrestlegm.sim import SimulationEngine
-from wrestlegm.rivalries import RivalryManager
+from wrestlegm.rivalries import RivalryIndex, RivalryManager
+from wrestlegm.search import RosterIndex
+
+# Number of roster changes kept for screens that refresh incrementally.
+ROSTER_CHANGE_HISTORY = 32
 
 
 class GameState:
@@ -30,10 +35,29 @@ class GameState:
         match_types: Iterable[MatchTypeDefinition],
         seed: int = 1337,
     ) -> None:
-        self._wrestler_defs = list(wrestlers)
+        # Wrestler definitions are consumed once, so a streaming loader can
+        # fill the roster without the full definition list in memory.
         self._match_type_defs = list(match_types)
         self._default_seed = seed
-        self._reset_game_state(self._wrestler_defs, self._match_type_defs, seed)
+        self._reset_game_state(wrestlers, self._match_type_defs, seed)
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: dict[str, Any],
+        match_types: Iterable[MatchTypeDefinition],
+        seed: int = 1337,
+    ) -> GameState:
+        """Build state straight from a serialized save payload.
+
+        The roster and rivalry state come from the payload alone, so no
+        definition-based roster is built only to be overwritten.
+        """
+
+        rng_seed = payload.get("rng_seed", seed)
+        state = cls((), match_types, seed=rng_seed if isinstance(rng_seed, int) else seed)
+        persistence.deserialize_game_state(state, payload)
+        return state
 
     def _reset_game_state(
         self,
@@ -58,9 +82,18 @@ class GameState:
         }
         self.match_types = {match_type.id: match_type for match_type in match_types}
         self.rivalry_manager = RivalryManager()
+        self._rivalry_index: RivalryIndex | None = None
         self.show_index = 1
         self.show_card = [None] * constants.SHOW_SLOT_COUNT
         self.last_show = None
+        self.last_show_rating: float | None = None
+        self.roster_version = 0
+        self._stat_versions: dict[str, int] = {}
+        self._roster_index: RosterIndex | None = None
+        self._roster_index_version = 0
+        self._roster_changes: deque[tuple[int, frozenset[str]]] = deque(
+            maxlen=ROSTER_CHANGE_HISTORY
+        )
 
     def clear_slot(self, slot_index: int) -> None:
         """Clear a show slot."""
@@ -185,23 +218,45 @@ class GameState:
     def run_show(self) -> Show:
         """Simulate the current show, apply deltas, and advance."""
 
+        show = self.begin_show()
+        for _ in self.iter_show_results(show):
+            pass
+        return self.finish_show(show)
+
+    def begin_show(self) -> Show:
+        """Validate the current card and start a show with no results yet."""
+
         errors = self.validate_show()
         if errors:
             raise ValueError("Show is invalid: " + ", ".join(errors))
 
         slots: List[ShowSlot] = [slot for slot in self.show_card if slot is not None]
-        show = Show(show_index=self.show_index, scheduled_slots=slots, results=[])
-        results = self.engine.simulate_show(
-            slots,
+        return Show(show_index=self.show_index, scheduled_slots=slots, results=[])
+
+    def iter_show_results(self, show: Show) -> Iterator[ShowResult]:
+        """Simulate a started show slot by slot, recording and yielding each result.
+
+        Only the engine RNG is advanced, so this can run off the UI thread;
+        the roster and rivalries change in :meth:`finish_show`.
+        """
+
+        for result in self.engine.iter_show(
+            show.scheduled_slots,
             self.roster,
             self.match_types,
             rivalry_context_provider=self.rivalry_manager.rivalry_context_for_match,
-        )
-        show.results = results
-        show.show_rating = self.engine.aggregate_show_rating(results)
-        self.applier.apply(show, self.roster)
+        ):
+            show.results.append(result)
+            yield result
+
+    def finish_show(self, show: Show) -> Show:
+        """Rate and apply a fully simulated show, then advance to the next one."""
+
+        show.show_rating = self.engine.aggregate_show_rating(show.results)
+        self._record_roster_change(self.applier.apply(show, self.roster))
         self.rivalry_manager.advance(show)
         self.last_show = show
+        self.last_show_rating = show.show_rating
         self.show_index += 1
         self.show_card = [None] * constants.SHOW_SLOT_COUNT
         return show
@@ -209,9 +264,66 @@ class GameState:
     def apply_show_results(self, show: Show) -> None:
         """Apply all stat deltas and recovery for a completed show."""
 
-        self.applier.apply(show, self.roster)
+        self._record_roster_change(self.applier.apply(show, self.roster))
         self.rivalry_manager.advance(show)
 
+    @property
+    def roster_index(self) -> RosterIndex:
+        """Return the roster search index, built once and kept current."""
+
+        index = self._roster_index
+        changed = self.roster_changes_since(self._roster_index_version)
+        if index is None or index.roster is not self.roster or changed is None:
+            index = self._roster_index = RosterIndex(self.roster)
+        elif self.roster_version != self._roster_index_version:
+            index.update(changed, recovered=True)
+        self._roster_index_version = self.roster_version
+        return index
+
+    @property
+    def rivalry_index(self) -> RivalryIndex:
+        """Return the rivalry/cooldown index, built once and kept current."""
+
+        index = self._rivalry_index
+        if index is None or index.manager is not self.rivalry_manager:
+            index = self._rivalry_index = RivalryIndex(self.rivalry_manager)
+        else:
+            index.sync()
+        return index
+
+    def roster_changes_since(self, version: int) -> set[str] | None:
+        """Return IDs of wrestlers whose stats show results changed after `version`.
+
+        Each roster version is one applied show, so every wrestler not listed
+        only recovered stamina, once per version. Returns None when the change
+        history no longer reaches back that far, in which case callers should
+        treat every wrestler as changed.
+        """
+
+        if version == self.roster_version:
+            return set()
+        if not self._roster_changes or self._roster_changes[0][0] > version + 1:
+            return None
+        changed: set[str] = set()
+        for change_version, wrestler_ids in self._roster_changes:
+            if change_version > version:
+                changed.update(wrestler_ids)
+        return changed
+
+    def stat_version(self, wrestler_id: str) -> int:
+        """Return the roster version at which show results last changed a wrestler.
+
+        Stamina recovery does not move it; see :meth:`roster_changes_since`.
+        """
+
+        return self._stat_versions.get(wrestler_id, 0)
+
+    def _record_roster_change(self, wrestler_ids: Iterable[str]) -> None:
+        self.roster_version += 1
+        changed = frozenset(wrestler_ids)
+        self._roster_changes.append((self.roster_version, changed))
+        self._stat_versions.update(dict.fromkeys(changed, self.roster_version))
+
     def rivalry_value_for_pair(self, wrestler_a_id: str, wrestler_b_id: str) -> int:
         """Return the current rivalry value for a pair, or 0 if none."""
 
@@ -231,8 +343,14 @@ class GameState:
 class ShowApplier:
     """Apply match deltas, recovery, and clamping to roster state."""
 
-    def apply(self, show: Show, roster: Dict[str, WrestlerState]) -> None:
-        """Apply deltas and recovery to the roster in-place."""
+    def apply(self, show: Show, roster: Dict[str, WrestlerState]) -> set[str]:
+        """Apply deltas and recovery to the roster in-place.
+
+        Participants take their summed stat deltas; every other wrestler
+        recovers stamina. Returns the IDs of the participants and of any
+        wrestler whose stats the results changed, so the set stays as small
+        as the card: everyone not returned recovered stamina and nothing else.
+        """
 
         aggregated: Dict[str, StatDelta] = {}
         participants: set[str] = set()
@@ -250,25 +368,24 @@ class ShowApplier:
                     stamina=current.stamina + delta.stamina,
                 )
 
-        new_values: Dict[str, WrestlerState] = {}
-        for wrestler_id, wrestler in roster.items():
-            delta = aggregated.get(wrestler_id, StatDelta(popularity=0, stamina=0))
+        changed = participants.intersection(roster)
+        for wrestler_id, delta in aggregated.items():
+            wrestler = roster.get(wrestler_id)
+            if wrestler is None:
+                continue
             pop = max(0, min(100, wrestler.popularity + delta.popularity))
             sta = max(0, min(100, wrestler.stamina + delta.stamina))
-            new_values[wrestler_id] = WrestlerState(
-                id=wrestler.id,
-                name=wrestler.name,
-                alignment=wrestler.alignment,
-                popularity=pop,
-                stamina=sta,
-                mic_skill=wrestler.mic_skill,
-            )
-
-        for wrestler_id, wrestler in new_values.items():
-            roster[wrestler_id] = wrestler
+            if (pop, sta) != (wrestler.popularity, wrestler.stamina):
+                wrestler.popularity = pop
+                wrestler.stamina = sta
+                changed.add(wrestler_id)
 
         for wrestler_id, wrestler in roster.items():
             if wrestler_id in participants:
                 continue
-            recovered = min(100, wrestler.stamina + constants.STAMINA_RECOVERY_PER_SHOW)
-            roster[wrestler_id].stamina = recovered
+            if wrestler.stamina < 100:
+                wrestler.stamina = min(
+                    100, wrestler.stamina + constants.STAMINA_RECOVERY_PER_SHOW
+                )
+
+        return changed
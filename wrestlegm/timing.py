@@ -0,0 +1,175 @@
+"""Opt-in handler latency tracking for the UI."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+import functools
+import inspect
+import json
+import math
+from pathlib import Path
+import time
+from typing import Any, Callable, Iterator, Mapping, Sequence
+import weakref
+
+ROLLING_WINDOW = 256
+TIMED_METHODS = ("compose", "refresh_view")
+TIMED_HANDLERS = ("on_mount",)
+TIMED_PREFIX = "action_"
+# Textual looks up `on_*` handlers on the class, so handlers are timed where
+# the instance's message pump dispatches them instead.
+DISPATCH_METHOD = "_dispatch_message"
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of `samples` (0.0 when empty)."""
+
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class HandlerTimings:
+    """Rolling latency samples for UI handlers, keyed as ``Class.method``.
+
+    :meth:`instrument` wraps the timed methods of one object as instance
+    attributes, so the class and every other instance (including other apps'
+    screens) stay untouched; :meth:`restore` removes the wrappers again. Each
+    key keeps its last `window` samples for p50/p95 plus a lifetime call
+    count, so long sessions report recent behaviour without growing.
+    """
+
+    def __init__(self, window: int = ROLLING_WINDOW) -> None:
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+        self._patched: weakref.WeakKeyDictionary[Any, list[str]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def record(self, key: str, seconds: float) -> None:
+        """Add one sample for a handler."""
+
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+    @contextmanager
+    def timed(self, key: str) -> Iterator[None]:
+        """Record how long the body of the with-block takes."""
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(key, time.perf_counter() - start)
+
+    def summary(self) -> dict[str, dict[str, float | int]]:
+        """Return count, p50, p95, and max in milliseconds, slowest p95 first."""
+
+        rows = {
+            key: {
+                "count": self._counts[key],
+                "p50_ms": percentile(samples, 0.5) * 1000,
+                "p95_ms": percentile(samples, 0.95) * 1000,
+                "max_ms": max(samples) * 1000,
+            }
+            for key, samples in self._samples.items()
+        }
+        return dict(sorted(rows.items(), key=lambda item: -item[1]["p95_ms"]))
+
+    def dump(self, path: Path) -> None:
+        """Write the summary to `path` as JSON."""
+
+        payload = {"window": self.window, "handlers": self.summary()}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    def instrument(self, target: Any, hooks: Mapping[str, str] | None = None) -> None:
+        """Time `target`'s own handlers on this instance only.
+
+        `hooks` maps further attribute names (such as a framework's paint
+        method) to the label they are recorded under. Instrumenting the same
+        object twice is a no-op.
+        """
+
+        if target in self._patched:
+            return
+        cls = type(target)
+        prefix = cls.__name__
+        names: list[str] = []
+        for name, method in vars(cls).items():
+            if name not in TIMED_METHODS and not name.startswith(TIMED_PREFIX):
+                continue
+            if not inspect.isfunction(method):
+                continue
+            names.append(name)
+            setattr(target, name, self._wrap(getattr(target, name), f"{prefix}.{name}"))
+        for name, label in (hooks or {}).items():
+            names.append(name)
+            setattr(target, name, self._wrap(getattr(target, name), f"{prefix}.{label}"))
+        handlers = {name for name in TIMED_HANDLERS if name in vars(cls)}
+        if handlers and hasattr(target, DISPATCH_METHOD):
+            names.append(DISPATCH_METHOD)
+            setattr(
+                target,
+                DISPATCH_METHOD,
+                self._wrap_dispatch(getattr(target, DISPATCH_METHOD), prefix, handlers),
+            )
+        self._patched[target] = names
+
+    def restore(self) -> None:
+        """Remove every wrapper added by :meth:`instrument`."""
+
+        for target, names in list(self._patched.items()):
+            for name in names:
+                vars(target).pop(name, None)
+        self._patched.clear()
+
+    def _wrap_dispatch(
+        self, dispatch: Callable[[Any], Any], prefix: str, handlers: set[str]
+    ) -> Callable[[Any], Any]:
+        """Return a dispatcher timing messages routed to one of `handlers`."""
+
+        @functools.wraps(dispatch)
+        async def dispatch_wrapper(message: Any) -> Any:
+            handler = getattr(message, "handler_name", None)
+            if handler not in handlers:
+                return await dispatch(message)
+            with self.timed(f"{prefix}.{handler}"):
+                return await dispatch(message)
+
+        return dispatch_wrapper
+
+    def _wrap(self, method: Callable[..., Any], key: str) -> Callable[..., Any]:
+        """Return a wrapper timing `method` with the matching call style."""
+
+        if inspect.isgeneratorfunction(method):
+
+            @functools.wraps(method)
+            def generator_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.timed(key):
+                    return (yield from method(*args, **kwargs))
+
+            return generator_wrapper
+
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def coroutine_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.timed(key):
+                    return await method(*args, **kwargs)
+
+            return coroutine_wrapper
+
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self.timed(key):
+                return method(*args, **kwargs)
+
+        return wrapper
@@ -4,16 +4,26 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import logging
-from typing import Callable, Optional
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence
 
+from rich.cells import set_cell_size
+from rich.segment import Segment
 from textual.app import App, ComposeResult
 from textual import events
+from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
+from textual.geometry import Region, Size
+from textual.message import Message
 from textual.screen import ModalScreen, Screen
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.timer import Timer
+from textual.widget import Widget
+from textual.worker import Worker, WorkerState
 from textual.css.query import NoMatches
 from textual.widgets import (
     Button,
-    DataTable,
     Footer,
     Input,
     ListItem,
@@ -170,50 +180,468 @@ class SafeSelect(Select):
             LOGGER.debug("SafeSelect overlay not mounted; skipping init.")
             pass
 
-class EdgeAwareDataTable(DataTable):
-    """DataTable that can hand off focus when the cursor hits an edge."""
+
+class RosterTable(ScrollView, can_focus=True):
+    """Virtualized wrestler table that only renders the rows in view.
+
+    Rows are wrestler IDs. Cell text is fetched from `render_row` when a row
+    is drawn and cached until the row is invalidated, so building the table
+    costs the same on any roster size. Like EdgeAwareListView, it can hand
+    focus off when the cursor hits an edge.
+    """
+
+    BINDINGS = [
+        Binding("enter", "select_cursor", "Select", show=False),
+        Binding("up", "cursor_up", "Cursor up", show=False),
+        Binding("down", "cursor_down", "Cursor down", show=False),
+        Binding("pageup", "page_up", "Page up", show=False),
+        Binding("pagedown", "page_down", "Page down", show=False),
+        Binding("home", "cursor_home", "Home", show=False),
+        Binding("end", "cursor_end", "End", show=False),
+    ]
+
+    COMPONENT_CLASSES = {"roster-table--header", "roster-table--cursor"}
+
+    DEFAULT_CSS = """
+    RosterTable {
+        background: $surface;
+        color: $foreground;
+        height: auto;
+        max-height: 100%;
+
+        &:focus {
+            background-tint: $foreground 5%;
+            & > .roster-table--cursor {
+                background: $block-cursor-background;
+                color: $block-cursor-foreground;
+                text-style: $block-cursor-text-style;
+            }
+        }
+
+        & > .roster-table--header {
+            text-style: bold;
+            background: $panel;
+            color: $foreground;
+        }
+
+        & > .roster-table--cursor {
+            background: $block-cursor-blurred-background;
+            color: $block-cursor-blurred-foreground;
+            text-style: $block-cursor-blurred-text-style;
+        }
+    }
+    """
+
+    class RowSelected(Message):
+        """Posted when a row is chosen with Enter or a click."""
+
+        def __init__(self, table: RosterTable, row_key: str) -> None:
+            super().__init__()
+            self.table = table
+            self.row_key = row_key
+
+        @property
+        def control(self) -> RosterTable:
+            return self.table
+
+    class HeaderSelected(Message):
+        """Posted when a column header is clicked."""
+
+        def __init__(self, table: RosterTable, label: str) -> None:
+            super().__init__()
+            self.table = table
+            self.label = label
+
+        @property
+        def control(self) -> RosterTable:
+            return self.table
 
     def __init__(
         self,
+        columns: Sequence[tuple[str, int]],
+        render_row: Callable[[str], Sequence[str]],
         *,
         on_edge_prev: Callable[[], None] | None = None,
         on_edge_next: Callable[[], None] | None = None,
     ) -> None:
+        """Create a table with (label, width) columns and a row renderer."""
+
         super().__init__()
+        self.columns = list(columns)
+        self._render_row = render_row
         self._on_edge_prev = on_edge_prev
         self._on_edge_next = on_edge_next
-        self.cursor_type = "row"
+        self._rows: list[str] = []
+        self._cells: dict[str, Sequence[str]] = {}
+        self.cursor_row = 0
+        self.sorted_column: str | None = None
+        self._line_width = sum(width + 2 for _, width in self.columns)
+
+    @property
+    def row_count(self) -> int:
+        """Return the number of rows."""
+
+        return len(self._rows)
+
+    @property
+    def row_ids(self) -> Sequence[str]:
+        """Return the wrestler IDs in display order."""
+
+        return self._rows
+
+    @property
+    def cursor_id(self) -> str | None:
+        """Return the wrestler ID under the cursor."""
+
+        if 0 <= self.cursor_row < len(self._rows):
+            return self._rows[self.cursor_row]
+        return None
+
+    def set_rows(self, row_ids: Sequence[str]) -> None:
+        """Replace the displayed rows, keeping the cursor on the same ID if present."""
+
+        current = self.cursor_id
+        self._rows = list(row_ids)
+        self.virtual_size = Size(self._line_width, len(self._rows) + 1)
+        self.cursor_row = 0
+        if current is not None and current in self._rows:
+            self.move_cursor(self._rows.index(current))
+        self.refresh()
+
+    def set_sorted_column(self, label: str | None) -> None:
+        """Mark a column header as the active sort."""
+
+        self.sorted_column = label
+        self.refresh(Region(0, 0, self.size.width, 1))
+
+    def invalidate_rows(self, row_ids: Iterable[str] | None = None) -> None:
+        """Drop cached cells for some rows (all when None) and redraw."""
+
+        if row_ids is None:
+            self._cells.clear()
+        else:
+            for row_id in row_ids:
+                self._cells.pop(row_id, None)
+        self.refresh()
+
+    def move_cursor(self, row: int) -> None:
+        """Move the cursor to a row and scroll it into view."""
+
+        if not self._rows:
+            return
+        self.cursor_row = max(0, min(row, len(self._rows) - 1))
+        visible = max(self.scrollable_content_region.height - 1, 1)
+        top = round(self.scroll_offset.y)
+        if self.cursor_row < top:
+            self.scroll_to(y=self.cursor_row, animate=False)
+        elif self.cursor_row >= top + visible:
+            self.scroll_to(y=self.cursor_row - visible + 1, animate=False)
+        self.refresh()
 
     def action_cursor_down(self) -> None:
-        """Move focus to the next widget when already at the last row."""
+        """Move down, handing focus on when already at the last row."""
 
-        if self.cursor_row is not None and self.cursor_row >= self.row_count - 1:
-            if self._on_edge_next is not None:
-                self._on_edge_next()
-                return
-        super().action_cursor_down()
+        if self.cursor_row >= len(self._rows) - 1 and self._on_edge_next is not None:
+            self._on_edge_next()
+            return
+        self.move_cursor(self.cursor_row + 1)
 
     def action_cursor_up(self) -> None:
-        """Move focus to the previous widget when already at the first row."""
+        """Move up, handing focus back when already at the first row."""
 
-        if self.cursor_row is not None and self.cursor_row <= 0:
-            if self._on_edge_prev is not None:
-                self._on_edge_prev()
-                return
-        super().action_cursor_up()
+        if self.cursor_row <= 0 and self._on_edge_prev is not None:
+            self._on_edge_prev()
+            return
+        self.move_cursor(self.cursor_row - 1)
+
+    def action_page_down(self) -> None:
+        """Move the cursor down one page."""
+
+        self.move_cursor(self.cursor_row + max(self.scrollable_content_region.height - 1, 1))
+
+    def action_page_up(self) -> None:
+        """Move the cursor up one page."""
+
+        self.move_cursor(self.cursor_row - max(self.scrollable_content_region.height - 1, 1))
+
+    def action_cursor_home(self) -> None:
+        """Move the cursor to the first row."""
+
+        self.move_cursor(0)
+
+    def action_cursor_end(self) -> None:
+        """Move the cursor to the last row."""
+
+        self.move_cursor(len(self._rows) - 1)
+
+    def action_select_cursor(self) -> None:
+        """Post a selection for the row under the cursor."""
+
+        row_id = self.cursor_id
+        if row_id is not None:
+            self.post_message(self.RowSelected(self, row_id))
+
+    def on_click(self, event: events.Click) -> None:
+        """Select a clicked row, or report a clicked column header."""
+
+        if event.y < 1:
+            x = round(self.scroll_offset.x) + event.x
+            for label, column_width in self.columns:
+                if x < column_width + 2:
+                    self.post_message(self.HeaderSelected(self, label))
+                    event.stop()
+                    return
+                x -= column_width + 2
+            return
+        row = round(self.scroll_offset.y) + event.y - 1
+        if row < len(self._rows):
+            self.move_cursor(row)
+            self.action_select_cursor()
+            event.stop()
+
+    def render_line(self, y: int) -> Strip:
+        """Render the fixed header or one visible row."""
+
+        width = self.size.width
+        scroll_x, scroll_y = self.scroll_offset
+        if y == 0:
+            # The sorted column's left padding carries the sort marker.
+            text = "".join(
+                f"{'▼' if label == self.sorted_column else ' '}"
+                f"{set_cell_size(label, column_width)} "
+                for label, column_width in self.columns
+            )
+            style = self.get_component_rich_style("roster-table--header")
+        else:
+            row = scroll_y + y - 1
+            if row >= len(self._rows):
+                return Strip.blank(width, self.rich_style)
+            row_id = self._rows[row]
+            cells = self._cells.get(row_id)
+            if cells is None:
+                cells = self._cells[row_id] = tuple(self._render_row(row_id))
+            style = self.rich_style
+            if row == self.cursor_row:
+                style += self.get_component_rich_style("roster-table--cursor")
+            text = "".join(
+                f" {set_cell_size(cell, column_width)} "
+                for cell, (_, column_width) in zip(cells, self.columns)
+            )
+        strip = Strip([Segment(text, style)])
+        return strip.crop(scroll_x, scroll_x + width).adjust_cell_length(width, self.rich_style)
 
 from wrestlegm import constants
-from wrestlegm.data import load_match_types, load_wrestlers
-from wrestlegm.models import Match, MatchTypeDefinition, Promo, PromoResult, WrestlerState
+from wrestlegm.data import (
+    DATA_DIR,
+    DEFAULT_CACHE_DIR,
+    load_data_packs,
+    load_match_types,
+    load_wrestlers,
+)
+from wrestlegm.models import (
+    Match,
+    MatchTypeDefinition,
+    Promo,
+    PromoResult,
+    Show,
+    ShowSlot,
+)
+from wrestlegm.preview import PreviewCache, SlotPreview, preview_slot, projected_show_rating
 from wrestlegm import persistence
 from wrestlegm.session import SessionManager
 from wrestlegm.state import GameState
+from wrestlegm.timing import HandlerTimings
 
 
 FATIGUE_ICON = "🥱"
 EMPTY_ICON = "⚠️"
 BLOCK_ICON = "⛔"
 ALIGNMENT_EMOJI = {"Face": "😃", "Heel": "😈"}
+WRESTLER_COLUMNS = (("Name", 21), ("Sta", 3), ("Mic", 3), ("Pop", 9))
+ALIGNMENT_FACET_OPTIONS = (
+    ("Face & Heel", "all"),
+    (f"{ALIGNMENT_EMOJI['Face']} Face", "Face"),
+    (f"{ALIGNMENT_EMOJI['Heel']} Heel", "Heel"),
+)
+STAMINA_FACET_OPTIONS = (
+    ("Any stamina", "any"),
+    ("Bookable", "bookable"),
+    (f"{FATIGUE_ICON} Fatigued", "fatigued"),
+)
+SORT_OPTIONS = (
+    ("Roster", "roster"),
+    ("Pop ▼", "popularity"),
+    ("Sta ▼", "stamina"),
+    ("Mic ▼", "mic_skill"),
+)
+COLUMN_SORT_KEYS = {"Sta": "stamina", "Mic": "mic_skill", "Pop": "popularity"}
+TIMINGS_OVERLAY_ROWS = 15
+# Screen._compositor_refresh renders the dirty regions and writes them out.
+TIMED_SCREEN_HOOKS = {"_compositor_refresh": "frame"}
+RIVALRY_PAGE_SIZE = 15
+RIVALRY_ORDER_LABELS = {"heat": "Rivalries by heat", "expiry": "Cooldowns by expiry"}
+AUTOSAVE_EVERY_SHOWS = 3
+AUTOSAVE_INTERVAL_SECONDS = 300.0
+PREVIEW_DEBOUNCE_SECONDS = 0.15
+AUTOSAVE_BACKUP_COUNT = 3
+
+
+def _select_choice(select: Select, default: str) -> str:
+    """Return a select's value, or `default` while it is still blank."""
+
+    value = select.value
+    return value if isinstance(value, str) else default
+
+
+class RosterFilterBar(Horizontal):
+    """Search box, alignment/stamina facets, and sort order for a roster table.
+
+    The bar only collects the query; screens run it through the state's
+    :class:`~wrestlegm.search.RosterIndex` on every :class:`Changed` message.
+    """
+
+    DEFAULT_CSS = """
+    RosterFilterBar {
+        height: auto;
+    }
+
+    RosterFilterBar Input {
+        width: 1fr;
+    }
+
+    RosterFilterBar SafeSelect {
+        width: 20;
+    }
+    """
+
+    class Changed(Message):
+        """Posted when the query or a facet changes."""
+
+        def __init__(self, bar: RosterFilterBar) -> None:
+            super().__init__()
+            self.bar = bar
+
+        @property
+        def control(self) -> RosterFilterBar:
+            return self.bar
+
+    def compose(self) -> ComposeResult:
+        """Build the search box and facet selects."""
+
+        self.search_input = Input(
+            placeholder="Search name or ID",
+            select_on_focus=False,
+            id="roster-search",
+        )
+        self.alignment_select = SafeSelect(
+            ALIGNMENT_FACET_OPTIONS,
+            value="all",
+            allow_blank=False,
+            id="alignment-facet",
+        )
+        self.stamina_select = SafeSelect(
+            STAMINA_FACET_OPTIONS,
+            value="any",
+            allow_blank=False,
+            id="stamina-facet",
+        )
+        self.sort_select = SafeSelect(
+            SORT_OPTIONS,
+            value="roster",
+            allow_blank=False,
+            id="sort-order",
+        )
+        yield self.search_input
+        yield self.alignment_select
+        yield self.stamina_select
+        yield self.sort_select
+
+    @property
+    def controls(self) -> list[Widget]:
+        """Return the focusable controls in focus order."""
+
+        return [
+            self.search_input,
+            self.alignment_select,
+            self.stamina_select,
+            self.sort_select,
+        ]
+
+    @property
+    def alignment(self) -> str | None:
+        """Return the selected alignment facet, or None for both."""
+
+        alignment = _select_choice(self.alignment_select, "all")
+        return None if alignment == "all" else alignment
+
+    @property
+    def stamina(self) -> str:
+        """Return the selected stamina facet."""
+
+        return _select_choice(self.stamina_select, "any")
+
+    @property
+    def sort_key(self) -> str | None:
+        """Return the selected sort stat, or None for roster order."""
+
+        sort = _select_choice(self.sort_select, "roster")
+        return None if sort == "roster" else sort
+
+    @property
+    def is_default(self) -> bool:
+        """Return whether the bar shows the whole roster in roster order."""
+
+        return (
+            not self.search_input.value.strip()
+            and self.alignment is None
+            and self.stamina == "any"
+            and self.sort_key is None
+        )
+
+    def search(self, state: GameState) -> list[str]:
+        """Return the roster IDs matching the current query, facets, and sort."""
+
+        return state.roster_index.search(
+            self.search_input.value,
+            alignment=self.alignment,
+            stamina=self.stamina,
+            sort=self.sort_key,
+        )
+
+    @property
+    def sort_label(self) -> str | None:
+        """Return the table column label for the selected sort, if any."""
+
+        sort = self.sort_key
+        return next((label for label, key in COLUMN_SORT_KEYS.items() if key == sort), None)
+
+    def reset(self) -> None:
+        """Clear the search and return the facets and sort to their defaults."""
+
+        self.search_input.value = ""
+        self.alignment_select.value = "all"
+        self.stamina_select.value = "any"
+        self.sort_select.value = "roster"
+
+    def sort_by_column(self, label: str) -> None:
+        """Sort by a table column; columns without a stat restore roster order."""
+
+        self.sort_select.value = COLUMN_SORT_KEYS.get(label, "roster")
+
+    def type_ahead(self, character: str) -> None:
+        """Move focus to the search box and append a typed character."""
+
+        self.search_input.focus()
+        self.search_input.cursor_position = len(self.search_input.value)
+        self.search_input.insert_text_at_cursor(character)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        event.stop()
+        self.post_message(self.Changed(self))
+
+    def on_select_changed(self, event: Select.Changed) -> None:
+        event.stop()
+        self.post_message(self.Changed(self))
 
 
 def format_stars(rating: float) -> str:
@@ -240,12 +668,197 @@ def build_pop_cell(popularity: int, stamina: int, booked_marker: str = "") -> st
     return f"{popularity:>3}{fatigue}{booked_marker}"
 
 
-def build_match_participants(wrestlers: list[WrestlerState]) -> str:
-    """Format a vs-separated list of wrestlers with alignment emoji."""
+class CellCache:
+    """Rendered roster cells keyed by (wrestler id, stat version, stamina).
 
-    return " vs ".join(
-        build_name_cell(wrestler.name, wrestler.alignment) for wrestler in wrestlers
-    )
+    Every screen that shows a wrestler's name or stats reads it from here,
+    so reopening a screen reuses the strings formatted for wrestlers whose
+    stats have not changed. An entry is re-rendered when
+    :meth:`GameState.stat_version` moves on or the wrestler's stamina
+    recovered, and the cache starts over when a different GameState is
+    passed in.
+    """
+
+    def __init__(self) -> None:
+        self._state: GameState | None = None
+        self._entries: dict[str, tuple[int, int, tuple[str, str, str, str]]] = {}
+
+    def row(self, state: GameState, wrestler_id: str) -> tuple[str, str, str, str]:
+        """Return the (name, stamina, mic, popularity) cells for a wrestler."""
+
+        if state is not self._state:
+            self._state = state
+            self._entries.clear()
+        version = state.stat_version(wrestler_id)
+        wrestler = state.roster[wrestler_id]
+        entry = self._entries.get(wrestler_id)
+        if entry is None or entry[0] != version or entry[1] != wrestler.stamina:
+            entry = self._entries[wrestler_id] = (
+                version,
+                wrestler.stamina,
+                (
+                    build_name_cell(wrestler.name, wrestler.alignment),
+                    f"{wrestler.stamina:>3}",
+                    f"{wrestler.mic_skill:>3}",
+                    build_pop_cell(wrestler.popularity, wrestler.stamina),
+                ),
+            )
+        return entry[2]
+
+    def name(self, state: GameState, wrestler_id: str) -> str:
+        """Return the emoji + name cell for a wrestler."""
+
+        return self.row(state, wrestler_id)[0]
+
+    def participants(self, state: GameState, wrestler_ids: Iterable[str]) -> str:
+        """Return a vs-separated list of name cells."""
+
+        return " vs ".join(self.name(state, wrestler_id) for wrestler_id in wrestler_ids)
+
+
+class RatingPreview(Static):
+    """Status line for expected ratings computed off the event loop.
+
+    Screens call :meth:`request` with the slots to preview whenever the
+    booking changes. Slots already in the app's :class:`PreviewCache` render
+    at once; otherwise the request waits for input to settle for
+    ``PREVIEW_DEBOUNCE_SECONDS`` and then runs in a thread worker, replacing
+    any worker still running for an older request. The worker only computes
+    the slots missing from the cache; results are cached back on the UI
+    thread, and dropped if the roster changed meanwhile.
+    """
+
+    class Ready(Message):
+        """Posted when fresh previews have been rendered."""
+
+        def __init__(
+            self,
+            rating_preview: RatingPreview,
+            previews: list[SlotPreview | None],
+        ) -> None:
+            super().__init__()
+            self.rating_preview = rating_preview
+            self.previews = previews
+
+    def __init__(
+        self,
+        describe: Callable[[list[ShowSlot | None], list[SlotPreview | None]], str],
+        **kwargs,
+    ) -> None:
+        """Create a preview line rendered by `describe(slots, previews)`."""
+
+        super().__init__("", **kwargs)
+        self._describe = describe
+        self._timer: Timer | None = None
+        self._worker: Worker[list[SlotPreview]] | None = None
+        self._slots: list[ShowSlot | None] = []
+        self._known: list[SlotPreview | None] = []
+        self._source: tuple[GameState, int] | None = None
+        self.previews: list[SlotPreview | None] = []
+
+    @property
+    def pending(self) -> bool:
+        """Return whether a requested preview has not been rendered yet."""
+
+        return self._timer is not None or (
+            self._worker is not None and not self._worker.is_finished
+        )
+
+    def request(self, slots: Sequence[ShowSlot | None]) -> None:
+        """Preview `slots`, rendering cached results immediately."""
+
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        slots = list(slots)
+        cached = self.app.previews.cached(self.app.state, slots)
+        if cached is not None:
+            if self._worker is not None:
+                self._worker.cancel()
+                self._worker = None
+            self._show(slots, cached)
+            return
+        self._timer = self.set_timer(
+            PREVIEW_DEBOUNCE_SECONDS, lambda: self._start(slots)
+        )
+
+    def clear(self) -> None:
+        """Drop any pending request and blank the line."""
+
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self.previews = []
+        self.update("")
+
+    def _start(self, slots: list[ShowSlot | None]) -> None:
+        """Compute previews for a settled request in a thread worker."""
+
+        self._timer = None
+        state, cache = self.app.state, self.app.previews
+        self._slots = slots
+        self._known = [cache.get(state, slot) for slot in slots]
+        self._source = (state, state.roster_version)
+        missing = [
+            slot
+            for slot, known in zip(slots, self._known)
+            if slot is not None and known is None
+        ]
+        self._worker = self.run_worker(
+            lambda: [preview_slot(state, slot) for slot in missing],
+            name="rating-preview",
+            thread=True,
+            exclusive=True,
+        )
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Render previews from the latest worker."""
+
+        if event.worker is not self._worker:
+            return
+        event.stop()
+        if event.state != WorkerState.SUCCESS:
+            return
+        self._worker = None
+        state = self.app.state
+        if self._source != (state, state.roster_version):
+            # The game or roster changed while computing; preview it afresh.
+            self.request(self._slots)
+            return
+        computed = iter(event.worker.result or [])
+        previews = []
+        for slot, known in zip(self._slots, self._known):
+            if slot is not None and known is None:
+                known = next(computed)
+                self.app.previews.store(state, slot, known)
+            previews.append(known)
+        self._show(self._slots, previews)
+
+    def _show(
+        self,
+        slots: list[ShowSlot | None],
+        previews: list[SlotPreview | None],
+    ) -> None:
+        """Render previews and tell the screen they are ready."""
+
+        self.previews = previews
+        self.update(self._describe(slots, previews))
+        self.post_message(self.Ready(self, previews))
+
+
+def format_expected(preview: SlotPreview) -> str:
+    """Render a preview's expected rating as stars."""
+
+    return f"Expected {format_stars(preview.expected_rating)}"
+
+
+def format_odds(preview: SlotPreview, wrestler_id: str) -> str:
+    """Render one wrestler's win chance as a whole percentage."""
+
+    return f"{preview.win_odds.get(wrestler_id, 0.0):.0%}"
 
 
 def match_category_label(match_category_id: str) -> str:
@@ -273,13 +886,6 @@ def slot_label(slot_index: int, slot_type: str) -> str:
     return f"{slot_type.title()} {count}"
 
 
-def row_key_to_id(row_key: object) -> str:
-    """Normalize Textual row keys to their underlying string ID."""
-
-    value = getattr(row_key, "value", row_key)
-    return str(value)
-
-
 def truncate_name(name: str, max_len: int = 18) -> str:
     """Return the name trimmed to max_len characters with an ellipsis when needed."""
 
@@ -333,11 +939,19 @@ class PromoDraft:
         return bool(self.wrestler_id)
 
 
+class SaveCompleted(Message):
+    """Posted to the app when a background save finishes."""
+
+    def __init__(self, error: BaseException | None) -> None:
+        super().__init__()
+        self.error = error
+
+
 class WrestleGMApp(App):
     """Top-level Textual application entry point.
 
     Responsibilities:
-    - Load data definitions and create the shared GameState instance.
+    - Load data definitions and lazily create the shared GameState instance.
     - Own the application-wide CSS and lifecycle hooks.
     - Push the initial screen into the navigation stack.
     """
@@ -372,14 +986,81 @@ class WrestleGMApp(App):
     }
     """
 
-    def __init__(self) -> None:
-        """Initialize the app with loaded data and a fresh GameState."""
+    # Screens revisited throughout a session are built once and reused: each
+    # keeps its widget tree and re-reads GameState when it is shown again.
+    SCREENS = {
+        "game_hub": lambda: GameHubScreen(),
+        "booking_hub": lambda: BookingHubScreen(),
+        "roster": lambda: RosterScreen(),
+        "rivalries": lambda: RivalryScreen(),
+        "match_booking": lambda: MatchBookingScreen(),
+        "wrestler_selection": lambda: WrestlerSelectionScreen(),
+    }
+
+    BINDINGS = [
+        Binding("f9", "toggle_timings", "Timings", show=False, priority=True),
+    ]
+
+    timings: HandlerTimings | None = None
+    _timings_path: Path | None = None
+
+    def __init__(
+        self,
+        data_packs: Sequence[Path] = (),
+        timings_path: Path | None = None,
+        *,
+        save_dir: Path | None = None,
+        save_format: str = persistence.DEFAULT_SAVE_FORMAT,
+        journal_mode: bool = False,
+        save_backend: str = "files",
+    ) -> None:
+        """Initialize the app with loaded data; GameState is built on demand.
+
+        `data_packs` are layered over the bundled data, later packs winning.
+        Passing `timings_path` turns on handler timing (see
+        :meth:`enable_timings`). `save_format` is used for newly created
+        slots; existing slots keep the format they were saved in. With
+        `journal_mode`, saves after the first append delta records to the
+        slot's journal. `save_backend="sqlite"` keeps every slot in one
+        database with no slot limit; rolling backups are file-backend only.
+        """
 
         super().__init__()
-        self._wrestlers = load_wrestlers()
-        self._match_types = load_match_types()
-        self.session = SessionManager(self._wrestlers, self._match_types)
-        self.state = GameState(self._wrestlers, self._match_types)
+        if data_packs:
+            merged = load_data_packs((DATA_DIR, *data_packs), cache_dir=DEFAULT_CACHE_DIR)
+            self._wrestlers = merged.wrestlers
+            self._match_types = merged.match_types
+        else:
+            self._wrestlers = load_wrestlers(cache_dir=DEFAULT_CACHE_DIR)
+            self._match_types = load_match_types(cache_dir=DEFAULT_CACHE_DIR)
+        self.session = SessionManager(
+            self._wrestlers,
+            self._match_types,
+            save_dir=save_dir,
+            save_format=save_format,
+            journal_mode=journal_mode,
+            save_backend=save_backend,
+            autosave_every=AUTOSAVE_EVERY_SHOWS,
+            autosave_interval=AUTOSAVE_INTERVAL_SECONDS,
+            backup_count=AUTOSAVE_BACKUP_COUNT if save_backend == "files" else 0,
+        )
+        self._state: GameState | None = None
+        self.cells = CellCache()
+        self.previews = PreviewCache()
+        if timings_path is not None:
+            self.enable_timings(timings_path)
+
+    @property
+    def state(self) -> GameState:
+        """Return the active GameState, creating a fresh one on first use."""
+
+        if self._state is None:
+            self._state = GameState(self._wrestlers, self._match_types)
+        return self._state
+
+    @state.setter
+    def state(self, value: GameState) -> None:
+        self._state = value
 
     def on_mount(self) -> None:
         """Show the main menu at startup."""
@@ -390,7 +1071,7 @@ class WrestleGMApp(App):
         """Start a fresh session and show the booking hub."""
 
         self.state = self.session.new_game(slot_index, slot_name)
-        self.switch_screen(BookingHubScreen())
+        self.switch_screen(self.get_screen("booking_hub", BookingHubScreen).prepare())
 
     def load_game(self, slot_index: int) -> None:
         """Load a saved session and show the game hub."""
@@ -407,7 +1088,104 @@ class WrestleGMApp(App):
                 message = "Save file is missing."
             self.push_screen(ErrorModal(message=message))
             return
-        self.switch_screen(GameHubScreen())
+        self.switch_screen("game_hub")
+
+    def save_current_slot(self) -> None:
+        """Save the active slot off the event loop and report back when done."""
+
+        self.session.save_current_slot_async(self.state, on_complete=self._save_finished)
+
+    def show_completed(self) -> None:
+        """Save the active slot after a show: on schedule, or every show without one."""
+
+        if not self.session.autosave_enabled:
+            self.save_current_slot()
+            return
+        self.session.show_completed(self.state, on_complete=self._save_finished)
+
+    def save_unsaved_shows(self) -> None:
+        """Save shows the autosave schedule has not written yet, off the event loop."""
+
+        if self._state is not None:
+            self.session.save_unsaved_shows(self._state, on_complete=self._save_finished)
+
+    def _save_finished(self, error: BaseException | None) -> None:
+        """Forward a background save result to the app thread.
+
+        Runs on the saver thread. ``post_message`` queues onto the app's event
+        loop thread-safely without blocking, so the saver never waits on the
+        UI thread (which may itself be waiting on the saver).
+        """
+
+        self.post_message(SaveCompleted(error))
+
+    def on_save_completed(self, message: SaveCompleted) -> None:
+        """Surface background save failures to the player."""
+
+        if message.error is not None:
+            LOGGER.error("Background save failed: %s", message.error)
+            self.push_screen(ErrorModal(message="Unable to save game."))
+
+    def enable_timings(self, path: Path | None = None) -> HandlerTimings:
+        """Time this app's screen handlers and frames, writing the summary to `path`.
+
+        Screens are instrumented one instance at a time as the app shows them,
+        so other apps in the same process are never timed. F9 toggles an
+        overlay with the slowest handlers while playing.
+        """
+
+        self.timings = HandlerTimings()
+        self._timings_path = path
+        for screen in self.screen_stack:
+            self._time_screen(screen)
+        return self.timings
+
+    def disable_timings(self) -> None:
+        """Unwrap every timed screen and write the summary if a path was given."""
+
+        if self.timings is None:
+            return
+        self.timings.restore()
+        if self._timings_path is not None:
+            self.timings.dump(self._timings_path)
+        self.timings = None
+
+    def get_screen(
+        self, screen: Screen | str, screen_class: type[Screen] | None = None
+    ) -> Screen:
+        """Return the screen as Textual does, timing it while timing is enabled."""
+
+        instance = super().get_screen(screen, screen_class)
+        self._time_screen(instance)
+        return instance
+
+    def _time_screen(self, screen: Screen) -> None:
+        """Instrument one of this module's screens, including its paints."""
+
+        if (
+            self.timings is not None
+            and type(screen).__module__ == __name__
+            and not isinstance(screen, TimingsModal)
+        ):
+            self.timings.instrument(screen, TIMED_SCREEN_HOOKS)
+
+    def action_toggle_timings(self) -> None:
+        """Show or hide the handler timings overlay."""
+
+        if self.timings is None:
+            return
+        if isinstance(self.screen, TimingsModal):
+            self.pop_screen()
+        else:
+            self.push_screen(TimingsModal())
+
+    def on_unmount(self) -> None:
+        """Save any unsaved shows and give queued saves a chance to land."""
+
+        if self._state is not None:
+            self.session.save_unsaved_shows(self._state)
+        self.session.flush_saves(timeout=5.0)
+        self.disable_timings()
 
 
 class MainMenuScreen(Screen):
@@ -517,7 +1295,13 @@ class SaveSlotSelectionScreen(Screen):
         if slot.exists:
             show_index = (slot.last_saved_show_index or 0) + 1
             name = slot.name or "Unnamed"
-            return f"Slot {slot.slot_index} · {name} · Show #{show_index}"
+            label = f"Slot {slot.slot_index} · {name} · Show #{show_index}"
+            meta = self.app.session.slot_metadata(slot.slot_index)
+            if meta is not None:
+                label += f" · {meta.roster_size} wrestlers"
+                if meta.last_show_rating is not None:
+                    label += f" · Last {format_stars(meta.last_show_rating)}"
+            return label
         empty_label = f"Slot {slot.slot_index} · [ Empty ]"
         if self.mode == "load":
             return f"[dim]{empty_label}[/dim]"
@@ -810,11 +1594,13 @@ class GameHubScreen(Screen):
 
         self.current_show = Static("")
         self.roster = Static("Roster Overview\n")
+        self.rivalries = Static("Rivalries\n")
         self.exit = Static("Exit to Main Menu\n")
 
         self.menu = EdgeAwareListView(
             ListItem(self.current_show, id="current-show"),
             ListItem(self.roster, id="roster"),
+            ListItem(self.rivalries, id="rivalries"),
             ListItem(self.exit, id="exit"),
         )
         yield self.menu
@@ -852,10 +1638,15 @@ class GameHubScreen(Screen):
         """Route the selected menu option to the target screen."""
 
         if item_id == "current-show":
-            self.app.switch_screen(BookingHubScreen())
+            self.app.switch_screen(
+                self.app.get_screen("booking_hub", BookingHubScreen).prepare()
+            )
         elif item_id == "roster":
-            self.app.push_screen(RosterScreen())
+            self.app.push_screen(self.app.get_screen("roster", RosterScreen).prepare())
+        elif item_id == "rivalries":
+            self.app.push_screen(self.app.get_screen("rivalries", RivalryScreen).prepare())
         elif item_id == "exit":
+            self.app.save_unsaved_shows()
             self.app.switch_screen(MainMenuScreen())
 
 
@@ -864,6 +1655,7 @@ class BookingHubScreen(Screen):
 
     Responsibilities:
     - Display the current show number and slot summaries.
+    - Preview each booked slot's expected rating and the projected show rating.
     - Allow the user to open a slot editor.
     - Gate Run Show based on validation.
     """
@@ -895,6 +1687,8 @@ class BookingHubScreen(Screen):
             on_edge_next=self.action_focus_next,
         )
         yield self.slot_list
+        self.rating_preview = RatingPreview(self.projected_text, id="projected-rating")
+        yield self.rating_preview
 
         with Vertical():
             self.run_button = Button("Run Show", id="run-show")
@@ -911,13 +1705,50 @@ class BookingHubScreen(Screen):
         self.slot_list.focus()
         self.refresh_view()
 
+    def prepare(self) -> BookingHubScreen:
+        """Reset a reused hub to the first slot before it is shown again."""
+
+        if self.is_mounted:
+            self.slot_list.index = 0
+            self.slot_list.focus()
+        return self
+
     def refresh_view(self) -> None:
         """Update slot text and Run Show enablement."""
 
         self.show_header.update(f"Show #{self.app.state.show_index}")
+        self.refresh_slots()
+        self.run_button.disabled = bool(self.app.state.validate_show())
+        self.rating_preview.request(self.app.state.show_card)
+
+    def refresh_slots(self) -> None:
+        """Update the slot summaries."""
+
         for index, slot_static in enumerate(self.slot_items):
             slot_static.update(self.slot_text(index))
-        self.run_button.disabled = bool(self.app.state.validate_show())
+
+    @property
+    def preview_pending(self) -> bool:
+        """Return whether slot previews are still being computed."""
+
+        return self.rating_preview.pending
+
+    def projected_text(
+        self,
+        slots: list[ShowSlot | None],
+        previews: list[SlotPreview | None],
+    ) -> str:
+        """Render the projected show rating line."""
+
+        rating = projected_show_rating(previews)
+        if rating is None:
+            return ""
+        return f"Projected show rating: {format_stars(rating)}"
+
+    def on_rating_preview_ready(self, message: RatingPreview.Ready) -> None:
+        """Show the previews in the slot summaries."""
+
+        self.refresh_slots()
 
     def slot_text(self, index: int) -> str:
         """Render the slot summary text for a match slot."""
@@ -928,18 +1759,32 @@ class BookingHubScreen(Screen):
         if slot is None:
             return f"{label}\n[ Empty ]"
         if isinstance(slot, Match):
-            wrestlers = [self.app.state.roster[w_id] for w_id in slot.wrestler_ids]
             match_type = self.app.state.match_types.get(slot.match_type_id)
             match_type_name = match_type.name if match_type else "Unknown"
             category_name = match_category_label(slot.match_category_id)
             emojis = self.app.state.rivalry_emojis_for_match(slot.wrestler_ids)
             label_text = f"{label}  {emojis}" if emojis else label
-            return (
-                f"{label_text}\n{build_match_participants(wrestlers)}\n"
-                f"{category_name} · {match_type_name}"
-            )
+            preview = self.app.previews.get(self.app.state, slot)
+            if preview is None:
+                participants = self.app.cells.participants(
+                    self.app.state, slot.wrestler_ids
+                )
+                detail = f"{category_name} · {match_type_name}"
+            else:
+                participants = " vs ".join(
+                    f"{self.app.cells.name(self.app.state, wrestler_id)} "
+                    f"{format_odds(preview, wrestler_id)}"
+                    for wrestler_id in slot.wrestler_ids
+                )
+                detail = (
+                    f"{category_name} · {match_type_name} · {format_expected(preview)}"
+                )
+            return f"{label_text}\n{participants}\n{detail}"
         wrestler = self.app.state.roster[slot.wrestler_id]
-        return f"{label}\n{wrestler.name}"
+        preview = self.app.previews.get(self.app.state, slot)
+        if preview is None:
+            return f"{label}\n{wrestler.name}"
+        return f"{label}\n{wrestler.name} · {format_expected(preview)}"
 
     def action_edit_slot(self) -> None:
         """Open the booking screen for the selected slot."""
@@ -985,7 +1830,11 @@ class BookingHubScreen(Screen):
     def open_match_booking(self, slot_index: int, match_category_id: str) -> None:
         """Open match booking with a preselected match category."""
 
-        self.app.push_screen(MatchBookingScreen(slot_index, match_category_id))
+        self.app.push_screen(
+            self.app.get_screen("match_booking", MatchBookingScreen).prepare(
+                slot_index, match_category_id
+            )
+        )
 
     def action_run_show(self) -> None:
         """Run the show if the current card is valid."""
@@ -997,7 +1846,7 @@ class BookingHubScreen(Screen):
     def action_back(self) -> None:
         """Return to the game hub."""
 
-        self.app.switch_screen(GameHubScreen())
+        self.app.switch_screen("game_hub")
 
     def action_focus_next(self) -> None:
         """Move focus to the next booking hub control."""
@@ -1048,6 +1897,7 @@ class MatchBookingScreen(Screen):
     Responsibilities:
     - Maintain a local BookingDraft until confirmation.
     - Launch selection screens for wrestlers and match types.
+    - Preview the draft's expected rating and win odds as it changes.
     - Validate the draft and commit it to GameState on confirmation.
     """
 
@@ -1057,15 +1907,27 @@ class MatchBookingScreen(Screen):
         ("escape", "cancel", "Cancel"),
     ]
 
-    def __init__(self, slot_index: int, match_category_id: str) -> None:
+    def __init__(self, slot_index: int = 0, match_category_id: str | None = None) -> None:
         """Create a booking screen for a specific slot."""
 
         super().__init__()
+        self._match_type_options: list[tuple[str, str]] = []
+        self.prepare(slot_index, match_category_id)
+
+    def prepare(self, slot_index: int, match_category_id: str | None) -> MatchBookingScreen:
+        """Point the screen at a slot, reloading a reused screen's draft."""
+
         self.slot_index = slot_index
         self.draft = BookingDraft()
         self.initial_category_id = match_category_id
         self.draft.match_category_id = match_category_id
-        self.draft.ensure_size(match_category_size(match_category_id))
+        if match_category_id is not None:
+            self.draft.ensure_size(match_category_size(match_category_id))
+        if self.is_mounted:
+            self.rating_preview.clear()
+            self.fields.index = 0
+            self.load_slot()
+        return self
 
     def compose(self) -> ComposeResult:
         """Build the match booking layout."""
@@ -1095,11 +1957,13 @@ class MatchBookingScreen(Screen):
 
         self.match_type_label = Static("Stipulation")
         yield self.match_type_label
-        self.match_type_select = SafeSelect(
-            self._match_type_options_for_category(self.initial_category_id),
-            id="match-type",
+        self._match_type_options = self._match_type_options_for_category(
+            self.initial_category_id
         )
+        self.match_type_select = SafeSelect(self._match_type_options, id="match-type")
         yield self.match_type_select
+        self.rating_preview = RatingPreview(self.preview_text, id="match-preview")
+        yield self.rating_preview
 
         with Vertical():
             self.confirm_button = Button("Confirm", id="confirm")
@@ -1114,6 +1978,11 @@ class MatchBookingScreen(Screen):
     def on_mount(self) -> None:
         """Load existing slot data and focus the field list."""
 
+        self.load_slot()
+
+    def load_slot(self) -> None:
+        """Load the slot's booked match into the draft and focus the field list."""
+
         self.fields.focus()
         existing = self.app.state.show_card[self.slot_index]
         if isinstance(existing, Match):
@@ -1157,6 +2026,44 @@ class MatchBookingScreen(Screen):
             self.validate_draft()
         )
         self.clear_button.disabled = self.app.state.show_card[self.slot_index] is None
+        self.rating_preview.request([self.draft_match()])
+
+    @property
+    def preview_pending(self) -> bool:
+        """Return whether the draft preview is still being computed."""
+
+        return self.rating_preview.pending
+
+    def draft_match(self) -> Match | None:
+        """Return the draft as a match once every field is filled."""
+
+        if not self.draft.is_complete(self.required_wrestler_count()):
+            return None
+        if self.draft.match_type_id not in self.app.state.match_types:
+            return None
+        return Match(
+            wrestler_ids=[wrestler_id for wrestler_id in self.draft.wrestler_ids if wrestler_id],
+            match_category_id=self.draft.match_category_id or "",
+            match_type_id=self.draft.match_type_id,
+        )
+
+    def preview_text(
+        self,
+        slots: list[ShowSlot | None],
+        previews: list[SlotPreview | None],
+    ) -> str:
+        """Render the draft's expected rating and win odds."""
+
+        match = slots[0] if slots else None
+        preview = previews[0] if previews else None
+        if not isinstance(match, Match) or preview is None:
+            return ""
+        odds = " · ".join(
+            f"{truncate_name(self.app.state.roster[wrestler_id].name)} "
+            f"{format_odds(preview, wrestler_id)}"
+            for wrestler_id in match.wrestler_ids
+        )
+        return f"{format_expected(preview)} · {odds}"
 
     def field_text(self, label: str, value_id: Optional[str], match_type: bool = False) -> str:
         """Render the display text for a booking field."""
@@ -1166,16 +2073,14 @@ class MatchBookingScreen(Screen):
         if match_type:
             match_type_def = self.app.state.match_types[value_id]
             return f"{label}\n{match_type_def.name}"
-        wrestler = self.app.state.roster[value_id]
-        return f"{label}\n{build_name_cell(wrestler.name, wrestler.alignment)}"
+        return f"{label}\n{self.app.cells.name(self.app.state, value_id)}"
 
     def wrestler_field_text(self, wrestler_id: Optional[str]) -> str:
         """Render the display text for a wrestler row."""
 
         if wrestler_id is None:
             return "[ Empty ]"
-        wrestler = self.app.state.roster[wrestler_id]
-        return build_name_cell(wrestler.name, wrestler.alignment)
+        return self.app.cells.name(self.app.state, wrestler_id)
 
     def category_label(self) -> str:
         """Return the current category label for the header detail."""
@@ -1230,6 +2135,9 @@ class MatchBookingScreen(Screen):
         """Update match type dropdown options based on the category."""
 
         options = self._match_type_options_for_category(self.draft.match_category_id)
+        if options != self._match_type_options:
+            self._match_type_options = options
+            self.match_type_select.set_options(options)
         self.match_type_select.disabled = not options
         valid_ids = {value for _, value in options}
         if self.draft.match_type_id not in valid_ids:
@@ -1263,7 +2171,7 @@ class MatchBookingScreen(Screen):
         title = f"Select Wrestler ({slot_label(self.slot_index, 'match')} · {selected + 1})"
         current_ids = self._current_ids(exclude_index=selected)
         self.app.push_screen(
-            WrestlerSelectionScreen(
+            self.app.get_screen("wrestler_selection", WrestlerSelectionScreen).prepare(
                 slot_index=self.slot_index,
                 title=title,
                 current_ids=current_ids,
@@ -1283,7 +2191,7 @@ class MatchBookingScreen(Screen):
     def on_select_changed(self, event: Select.Changed) -> None:
         """Update draft match type when selection changes."""
 
-        if event.select is self.match_type_select and event.value is not None:
+        if event.select is self.match_type_select and isinstance(event.value, str):
             self.draft.match_type_id = event.value
             self.refresh_view()
 
@@ -1297,7 +2205,9 @@ class MatchBookingScreen(Screen):
                 slot_index=slot_index,
                 initial_category_id=initial_category_id,
                 on_select=lambda category_id: self.app.push_screen(
-                    MatchBookingScreen(slot_index, category_id)
+                    self.app.get_screen("match_booking", MatchBookingScreen).prepare(
+                        slot_index, category_id
+                    )
                 ),
             )
         )
@@ -1476,7 +2386,7 @@ class PromoBookingScreen(Screen):
     def action_select_field(self) -> None:
         title = f"Select Wrestler ({slot_label(self.slot_index, 'promo')})"
         self.app.push_screen(
-            WrestlerSelectionScreen(
+            self.app.get_screen("wrestler_selection", WrestlerSelectionScreen).prepare(
                 slot_index=self.slot_index,
                 title=title,
                 current_ids=set(),
@@ -1585,6 +2495,29 @@ class WrestlerSelectionScreen(Screen):
     ]
 
     def __init__(
+        self,
+        slot_index: int = 0,
+        title: str = "",
+        current_ids: set[str] | None = None,
+        booked_ids: set[str] | None = None,
+        on_select: Callable[[str], None] | None = None,
+        allow_low_stamina: bool = False,
+    ) -> None:
+        """Create a wrestler selection screen for a slot and side."""
+
+        super().__init__()
+        self.title_label = Static("")
+        self.message = Static("")
+        self.prepare(
+            slot_index,
+            title,
+            current_ids or set(),
+            booked_ids or set(),
+            on_select or (lambda wrestler_id: None),
+            allow_low_stamina,
+        )
+
+    def prepare(
         self,
         slot_index: int,
         title: str,
@@ -1592,45 +2525,39 @@ class WrestlerSelectionScreen(Screen):
         booked_ids: set[str],
         on_select: Callable[[str], None],
         allow_low_stamina: bool = False,
-    ) -> None:
-        """Create a wrestler selection screen for a slot and side."""
+    ) -> WrestlerSelectionScreen:
+        """Point the picker at a slot, resetting a reused picker's view."""
 
-        super().__init__()
         self.slot_index = slot_index
         self.title = title
         self.current_ids = current_ids
         self.booked_ids = booked_ids
         self.on_select = on_select
         self.allow_low_stamina = allow_low_stamina
-        self.message = Static("")
+        self.title_label.update(title)
+        self.message.update("")
+        if self.is_mounted:
+            # Booking hints and stats may differ from the last visit.
+            self.filter_bar.reset()
+            self.table.set_rows(list(self.app.state.roster))
+            self.table.invalidate_rows()
+            self.table.focus()
+            self.table.move_cursor(0)
+        return self
 
     def compose(self) -> ComposeResult:
         """Build the wrestler selection layout."""
 
-        yield Static(self.title)
-        self.table = EdgeAwareDataTable(
+        yield self.title_label
+        self.filter_bar = RosterFilterBar()
+        yield self.filter_bar
+        self.table = RosterTable(
+            WRESTLER_COLUMNS,
+            self.row_cells,
             on_edge_prev=self.action_focus_prev,
             on_edge_next=self.action_focus_next,
         )
-        self.table.add_column("Name", key="name")
-        self.table.add_column("Sta", key="sta")
-        self.table.add_column("Mic", key="mic")
-        self.table.add_column("Pop", key="pop")
-        for wrestler in self.app.state.roster.values():
-            booked = self.app.state.is_wrestler_booked(
-                wrestler.id,
-                exclude_slot=self.slot_index,
-            )
-            if wrestler.id in self.booked_ids:
-                booked = True
-            booked_marker = " 📅" if booked else ""
-            self.table.add_row(
-                build_name_cell(wrestler.name, wrestler.alignment),
-                f"{wrestler.stamina:>3}",
-                f"{wrestler.mic_skill:>3}",
-                build_pop_cell(wrestler.popularity, wrestler.stamina, booked_marker),
-                key=wrestler.id,
-            )
+        self.table.set_rows(list(self.app.state.roster))
         yield self.table
         yield self.message
         with Horizontal():
@@ -1640,12 +2567,24 @@ class WrestlerSelectionScreen(Screen):
             yield self.cancel_button
         yield Footer()
 
+    def row_cells(self, wrestler_id: str) -> tuple[str, ...]:
+        """Render one roster row with stamina and booking hints."""
+
+        cells = self.app.cells.row(self.app.state, wrestler_id)
+        booked = wrestler_id in self.booked_ids or self.app.state.is_wrestler_booked(
+            wrestler_id,
+            exclude_slot=self.slot_index,
+        )
+        if not booked:
+            return cells
+        name, stamina, mic, popularity = cells
+        return (name, stamina, mic, f"{popularity} 📅")
+
     def on_mount(self) -> None:
         """Focus the wrestler list and select the first entry."""
 
         self.table.focus()
-        if self.table.row_count:
-            self.table.cursor_coordinate = (0, 0)
+        self.table.move_cursor(0)
 
     def action_cancel(self) -> None:
         """Close the selection screen without changes."""
@@ -1663,32 +2602,28 @@ class WrestlerSelectionScreen(Screen):
         self._move_focus(-1)
 
     def _move_focus(self, delta: int) -> None:
-        """Cycle focus between the list and action buttons."""
+        """Cycle focus between the search controls, list, and action buttons."""
 
-        focus_order = [self.table, self.select_button, self.cancel_button]
+        focus_order = [
+            *self.filter_bar.controls,
+            self.table,
+            self.select_button,
+            self.cancel_button,
+        ]
         focused = self.app.focused
         if focused not in focus_order:
             self.table.focus()
-            if self.table.cursor_row is None and self.table.row_count:
-                self.table.cursor_coordinate = (0, 0)
             return
         index = focus_order.index(focused)
         next_index = (index + delta) % len(focus_order)
-        next_focus = focus_order[next_index]
-        if next_focus is self.table and self.table.cursor_row is None and self.table.row_count:
-            self.table.cursor_coordinate = (0, 0)
-        next_focus.focus()
+        focus_order[next_index].focus()
 
     def action_select(self) -> None:
         """Select the highlighted wrestler if valid."""
 
-        if self.table.cursor_row is None:
-            return
-        try:
-            row_key = self.table.ordered_rows[self.table.cursor_row]
-        except IndexError:
+        wrestler_id = self.table.cursor_id
+        if wrestler_id is None:
             return
-        wrestler_id = row_key_to_id(row_key)
         error = self.validate_selection(wrestler_id)
         if error:
             self.message.update(f"{BLOCK_ICON} {error}")
@@ -1696,12 +2631,36 @@ class WrestlerSelectionScreen(Screen):
         self.on_select(wrestler_id)
         self.app.pop_screen()
 
-    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+    def on_roster_filter_bar_changed(self, event: RosterFilterBar.Changed) -> None:
+        """Narrow and order the table by the search, facets, and sort."""
+
+        self.table.set_rows(self.filter_bar.search(self.app.state))
+        self.table.set_sorted_column(self.filter_bar.sort_label)
+
+    def on_roster_table_header_selected(self, event: RosterTable.HeaderSelected) -> None:
+        """Sort by a clicked column header."""
+
+        self.filter_bar.sort_by_column(event.label)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Return from the search box to the filtered table."""
+
+        self.table.focus()
+
+    def on_key(self, event: events.Key) -> None:
+        """Start a search when typing while the table has focus."""
+
+        if self.app.focused is self.table and event.is_printable and event.character:
+            event.stop()
+            event.prevent_default()
+            self.filter_bar.type_ahead(event.character)
+
+    def on_roster_table_row_selected(self, event: RosterTable.RowSelected) -> None:
         """Select the wrestler from table input."""
 
-        if event.data_table is not self.table:
+        if event.table is not self.table:
             return
-        wrestler_id = row_key_to_id(event.row_key)
+        wrestler_id = event.row_key
         error = self.validate_selection(wrestler_id)
         if error:
             self.message.update(f"{BLOCK_ICON} {error}")
@@ -1996,12 +2955,64 @@ class ErrorModal(ModalScreen):
         focus_order[(index + delta) % len(focus_order)].focus()
 
 
+class TimingsModal(ModalScreen):
+    """Overlay listing the slowest screen handlers while timing is enabled."""
+
+    DEFAULT_CSS = """
+    TimingsModal > Vertical {
+        width: 76;
+        height: auto;
+        padding: 1 2;
+        border: solid gray;
+    }
+    """
+
+    BINDINGS = [
+        ("escape", "close", "Close"),
+    ]
+
+    def compose(self) -> ComposeResult:
+        """Build the timings overlay layout."""
+
+        with Vertical():
+            yield Static("Handler timings (ms, rolling)", classes="section-title")
+            self.table = Static("")
+            yield self.table
+
+    def on_mount(self) -> None:
+        """Render the timings and keep them current."""
+
+        self.refresh_view()
+        self.set_interval(0.5, self.refresh_view)
+
+    def refresh_view(self) -> None:
+        """Render the handlers with the highest p95."""
+
+        timings = self.app.timings
+        rows = list(timings.summary().items()) if timings is not None else []
+        lines = [f"{'Handler':<44} {'calls':>6} {'p50':>8} {'p95':>8}"]
+        for key, row in rows[:TIMINGS_OVERLAY_ROWS]:
+            lines.append(
+                f"{key[:44]:<44} {row['count']:>6} "
+                f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f}"
+            )
+        if not rows:
+            lines.append("No handlers timed yet.")
+        self.table.update("\n".join(lines))
+
+    def action_close(self) -> None:
+        """Hide the overlay."""
+
+        self.dismiss()
+
+
 class SimulatingScreen(Screen):
-    """Simulating screen that runs the show and auto-advances.
+    """Simulating screen that starts the show and hands it to the results.
 
     Responsibilities:
-    - Call GameState.run_show() to perform simulation and state updates.
-    - Advance to ResultsScreen after a short delay.
+    - Call GameState.begin_show() to lock in the current card.
+    - Switch straight to ResultsScreen, which simulates the show in the
+      background and reveals each slot as it finishes.
     """
 
     def compose(self) -> ComposeResult:
@@ -2011,21 +3022,18 @@ class SimulatingScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Run the show and schedule auto-advance."""
-
-        self.app.state.run_show()
-        self.set_timer(0.4, self.advance)
+        """Start the show and advance to the results."""
 
-    def advance(self) -> None:
-        """Advance to the results screen."""
-
-        self.app.switch_screen(ResultsScreen())
+        show = self.app.state.begin_show()
+        self.app.switch_screen(ResultsScreen(show))
 
 
 class ResultsScreen(Screen):
     """Show results screen for completed matches.
 
     Responsibilities:
+    - Simulate a started show in a worker thread, revealing each slot's
+      result as it finishes.
     - Render per-match winners and star ratings.
     - Display the overall show rating.
     - Route to the game hub.
@@ -2039,6 +3047,24 @@ class ResultsScreen(Screen):
         ("down", "focus_next", "Next"),
     ]
 
+    class SlotSimulated(Message):
+        """Posted from the simulation worker after each slot finishes."""
+
+    def __init__(self, show: Show | None = None) -> None:
+        """Create the results screen; a started show is simulated on mount."""
+
+        super().__init__()
+        self.show = show
+        self._lines: list[str] = []
+        self._rendered = 0
+        self._worker: Worker[None] | None = None
+
+    @property
+    def is_simulating(self) -> bool:
+        """Return whether the show is still being simulated."""
+
+        return self.show is not None and self.show.show_rating is None
+
     def compose(self) -> ComposeResult:
         """Build the results screen layout."""
 
@@ -2052,57 +3078,100 @@ class ResultsScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Populate results when the screen is shown."""
+        """Start simulating a live show, or populate finished results."""
+
+        if self.show is not None:
+            self.continue_button.disabled = True
+            self._worker = self.run_worker(
+                self._simulate_show,
+                name="simulate-show",
+                thread=True,
+                exclusive=True,
+            )
+        self.refresh_view()
+        self.continue_button.focus()
+
+    def _simulate_show(self) -> None:
+        """Simulate the show slot by slot off the event loop."""
+
+        assert self.show is not None
+        for _ in self.app.state.iter_show_results(self.show):
+            self.post_message(self.SlotSimulated())
+
+    def on_results_screen_slot_simulated(self, message: SlotSimulated) -> None:
+        """Reveal the slots finished so far."""
 
         self.refresh_view()
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Apply the show once every slot has been simulated."""
+
+        if event.worker is not self._worker or event.state != WorkerState.SUCCESS:
+            return
+        assert self.show is not None
+        self.app.state.finish_show(self.show)
+        self.app.show_completed()
+        self.refresh_view()
+        self.continue_button.disabled = False
         self.continue_button.focus()
 
     def refresh_view(self) -> None:
-        """Update match results and show rating text."""
+        """Render results not yet shown and the show rating text."""
 
-        show = self.app.state.last_show
+        show = self.show or self.app.state.last_show
         if show is None:
             self.results.update("No results.")
             self.show_rating.update("")
             return
-        lines = []
-        for index, (slot, result) in enumerate(
-            zip(show.scheduled_slots, show.results), start=0
-        ):
-            if isinstance(slot, Match):
-                label = slot_label(index, "match")
-                winner = self.app.state.roster[result.winner_id]
-                non_winners = ", ".join(
-                    build_name_cell(
-                        self.app.state.roster[wrestler_id].name,
-                        self.app.state.roster[wrestler_id].alignment,
-                    )
-                    for wrestler_id in result.non_winner_ids
-                )
-                match_type = self.app.state.match_types.get(result.match_type_id)
-                match_type_name = match_type.name if match_type else "Unknown"
-                category_name = match_category_label(result.match_category_id)
-                lines.append(label)
-                lines.append(f" {build_name_cell(winner.name, winner.alignment)} def. {non_winners}")
-                lines.append(f" {category_name} · {match_type_name}")
-                lines.append(f" {format_stars(result.rating)}")
-                lines.append("")
-            else:
-                label = slot_label(index, "promo")
-                wrestler = self.app.state.roster[result.wrestler_id].name
-                lines.append(label)
-                lines.append(f" {wrestler}")
-                lines.append(f" {format_stars(result.rating)}")
-                lines.append("")
-        self.results.update("\n".join(lines).strip())
+        # The worker only appends, so a snapshot of the finished count is safe.
+        finished = len(show.results)
+        for index in range(self._rendered, finished):
+            self._lines.extend(self._result_lines(index, show))
+        if finished != self._rendered:
+            self._rendered = finished
+            self.results.update("\n".join(self._lines).strip())
+        if self.is_simulating:
+            total = len(show.scheduled_slots)
+            self.show_rating.update(f"Simulating show... {finished}/{total}")
+            return
         rating = show.show_rating or 0.0
         self.show_rating.update(f"Show Rating: {format_stars(rating)}")
 
+    def _result_lines(self, index: int, show: Show) -> list[str]:
+        """Format one slot's result."""
+
+        slot = show.scheduled_slots[index]
+        result = show.results[index]
+        if isinstance(slot, Match):
+            winner = self.app.cells.name(self.app.state, result.winner_id)
+            non_winners = ", ".join(
+                self.app.cells.name(self.app.state, wrestler_id)
+                for wrestler_id in result.non_winner_ids
+            )
+            match_type = self.app.state.match_types.get(result.match_type_id)
+            match_type_name = match_type.name if match_type else "Unknown"
+            category_name = match_category_label(result.match_category_id)
+            return [
+                slot_label(index, "match"),
+                f" {winner} def. {non_winners}",
+                f" {category_name} · {match_type_name}",
+                f" {format_stars(result.rating)}",
+                "",
+            ]
+        wrestler = self.app.state.roster[result.wrestler_id].name
+        return [
+            slot_label(index, "promo"),
+            f" {wrestler}",
+            f" {format_stars(result.rating)}",
+            "",
+        ]
+
     def action_continue(self) -> None:
-        """Return to the game hub."""
-        # Fail fast if the save state is invalid; inputs are validated upstream.
-        self.app.session.save_current_slot(self.app.state)
-        self.app.switch_screen(GameHubScreen())
+        """Return to the game hub once the show is finished."""
+        if self.is_simulating:
+            return
+        # The finished show was already handed to App.show_completed().
+        self.app.switch_screen("game_hub")
 
     def action_focus_next(self) -> None:
         """Move focus to the next results action."""
@@ -2146,43 +3215,104 @@ class RosterScreen(Screen):
         ("escape", "back", "Back"),
     ]
 
+    def __init__(self) -> None:
+        """Create the roster screen; rows are synced from state on mount."""
+
+        super().__init__()
+        self._synced_state: GameState | None = None
+        self._synced_version = 0
+
     def compose(self) -> ComposeResult:
         """Build the roster screen layout."""
 
         yield Static("Roster Overview", classes="section-title")
-        self.table = EdgeAwareDataTable(
+        self.filter_bar = RosterFilterBar()
+        yield self.filter_bar
+        self.table = RosterTable(
+            WRESTLER_COLUMNS,
+            self.row_cells,
             on_edge_prev=self.action_focus_prev,
             on_edge_next=self.action_focus_next,
         )
-        self.table.add_column("Name", key="name")
-        self.table.add_column("Sta", key="sta")
-        self.table.add_column("Mic", key="mic")
-        self.table.add_column("Pop", key="pop")
         yield self.table
         self.back_button = Button("Back", id="back")
         yield self.back_button
         yield Footer()
 
-    async def on_mount(self) -> None:
+    def on_mount(self) -> None:
         """Populate the roster list and focus it."""
 
-        await self.refresh_view()
+        self.refresh_view()
         self.table.focus()
-        if self.table.row_count:
-            self.table.cursor_coordinate = (0, 0)
-
-    async def refresh_view(self) -> None:
-        """Rebuild roster rows from current state."""
-
-        self.table.clear()
-        for wrestler in self.app.state.roster.values():
-            self.table.add_row(
-                build_name_cell(wrestler.name, wrestler.alignment),
-                f"{wrestler.stamina:>3}",
-                f"{wrestler.mic_skill:>3}",
-                build_pop_cell(wrestler.popularity, wrestler.stamina),
-                key=wrestler.id,
-            )
+        self.table.move_cursor(0)
+
+    def prepare(self) -> RosterScreen:
+        """Clear a reused screen's search and return to the top of the roster.
+
+        Rows are synced on resume, which redraws only wrestlers whose stats
+        changed since the last visit.
+        """
+
+        if self.is_mounted:
+            self.filter_bar.reset()
+            self.table.focus()
+            self.table.move_cursor(0)
+        return self
+
+    def row_cells(self, wrestler_id: str) -> tuple[str, ...]:
+        """Render one roster row from current state."""
+
+        return self.app.cells.row(self.app.state, wrestler_id)
+
+    def refresh_view(self) -> None:
+        """Sync rows with state, re-rendering only wrestlers whose cells changed."""
+
+        state = self.app.state
+        if state is not self._synced_state:
+            self.table.set_rows(self._visible_ids(state))
+            self.table.invalidate_rows()
+        elif state.roster_version != self._synced_version:
+            if not self.filter_bar.is_default:
+                # Stat changes can move wrestlers across the stamina facet or
+                # the sort order.
+                self.table.set_rows(self._visible_ids(state))
+            # Every show recovers stamina for non-participants, so drop the
+            # drawn rows; the cell cache re-renders only those whose values
+            # moved.
+            self.table.invalidate_rows()
+        self._synced_state = state
+        self._synced_version = state.roster_version
+
+    def _visible_ids(self, state: GameState) -> list[str]:
+        """Return the roster IDs shown under the current search, facets, and sort."""
+
+        if self.filter_bar.is_default:
+            return list(state.roster)
+        return self.filter_bar.search(state)
+
+    def on_roster_filter_bar_changed(self, event: RosterFilterBar.Changed) -> None:
+        """Narrow and order the table by the search, facets, and sort."""
+
+        self.table.set_rows(self._visible_ids(self.app.state))
+        self.table.set_sorted_column(self.filter_bar.sort_label)
+
+    def on_roster_table_header_selected(self, event: RosterTable.HeaderSelected) -> None:
+        """Sort by a clicked column header."""
+
+        self.filter_bar.sort_by_column(event.label)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Return from the search box to the filtered table."""
+
+        self.table.focus()
+
+    def on_key(self, event: events.Key) -> None:
+        """Start a search when typing while the table has focus."""
+
+        if self.app.focused is self.table and event.is_printable and event.character:
+            event.stop()
+            event.prevent_default()
+            self.filter_bar.type_ahead(event.character)
 
     def action_back(self) -> None:
         """Close the roster screen."""
@@ -2200,21 +3330,16 @@ class RosterScreen(Screen):
         self._move_focus(-1)
 
     def _move_focus(self, delta: int) -> None:
-        """Cycle focus between the roster list and Back button."""
+        """Cycle focus between the search controls, roster list, and Back button."""
 
-        focus_order = [self.table, self.back_button]
+        focus_order = [*self.filter_bar.controls, self.table, self.back_button]
         focused = self.app.focused
         if focused not in focus_order:
             self.table.focus()
-            if self.table.cursor_row is None and self.table.row_count:
-                self.table.cursor_coordinate = (0, 0)
             return
         index = focus_order.index(focused)
         next_index = (index + delta) % len(focus_order)
-        next_focus = focus_order[next_index]
-        if next_focus is self.table and self.table.cursor_row is None and self.table.row_count:
-            self.table.cursor_coordinate = (0, 0)
-        next_focus.focus()
+        focus_order[next_index].focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle Back button presses."""
@@ -2222,7 +3347,137 @@ class RosterScreen(Screen):
         if event.button.id == "back":
             self.action_back()
 
-    async def on_screen_resume(self) -> None:
+    def on_screen_resume(self) -> None:
         """Refresh roster data when returning to the screen."""
 
-        await self.refresh_view()
+        self.refresh_view()
+
+
+class RivalryScreen(Screen):
+    """Paged browser over rivalry and cooldown state.
+
+    Responsibilities:
+    - List rivalries hottest first, or cooldowns soonest to expire first.
+    - Fetch only the visible page from the GameState rivalry index.
+    - Refresh on resume so pairs changed by the last show are re-filed.
+    """
+
+    BINDINGS = [
+        ("left", "prev_page", "Prev Page"),
+        ("right", "next_page", "Next Page"),
+        ("o", "toggle_order", "Heat/Expiry"),
+        ("escape", "back", "Back"),
+    ]
+
+    def __init__(self) -> None:
+        """Create the browser on the first page of the heat order."""
+
+        super().__init__()
+        self.order = "heat"
+        self.page = 0
+
+    def compose(self) -> ComposeResult:
+        """Build the rivalry browser layout."""
+
+        yield Static("Rivalries", classes="section-title")
+        self.order_label = Static("")
+        yield self.order_label
+        self.rows = Static("")
+        yield self.rows
+        self.page_label = Static("")
+        yield self.page_label
+        self.back_button = Button("Back", id="back")
+        yield self.back_button
+        yield Footer()
+
+    def on_mount(self) -> None:
+        """Render the first page and focus Back."""
+
+        self.refresh_view()
+        self.back_button.focus()
+
+    def prepare(self) -> RivalryScreen:
+        """Return a reused browser to the first page of the heat order."""
+
+        self.order = "heat"
+        self.page = 0
+        return self
+
+    def page_count(self) -> int:
+        """Return the number of pages in the current order (at least one)."""
+
+        total = self.app.state.rivalry_index.count(self.order)
+        return max(1, -(-total // RIVALRY_PAGE_SIZE))
+
+    def refresh_view(self) -> None:
+        """Render the visible page of the current order."""
+
+        state = self.app.state
+        index = state.rivalry_index
+        total = index.count(self.order)
+        pages = max(1, -(-total // RIVALRY_PAGE_SIZE))
+        self.page = min(self.page, pages - 1)
+        keys = index.page(self.order, self.page * RIVALRY_PAGE_SIZE, RIVALRY_PAGE_SIZE)
+        self.order_label.update(RIVALRY_ORDER_LABELS[self.order])
+        if keys:
+            self.rows.update("\n".join(self.row_text(key) for key in keys))
+        elif self.order == "heat":
+            self.rows.update("No active rivalries.")
+        else:
+            self.rows.update("No cooldowns.")
+        self.page_label.update(f"Page {self.page + 1}/{pages} · {total} pairs")
+
+    def row_text(self, key: tuple[str, str]) -> str:
+        """Render one pair with its emoji and heat or remaining cooldown."""
+
+        state = self.app.state
+        emoji = state.rivalry_emojis_for_match(key)
+        names = " vs ".join(
+            truncate_name(state.roster[wrestler_id].name)
+            if wrestler_id in state.roster
+            else wrestler_id
+            for wrestler_id in key
+        )
+        if self.order == "heat":
+            detail = f"Heat {state.rivalry_value_for_pair(*key)}"
+        else:
+            remaining = state.cooldown_remaining_for_pair(*key)
+            detail = f"{remaining} show{'s' if remaining != 1 else ''} left"
+        return f"{emoji} {names:<40} {detail}"
+
+    def action_next_page(self) -> None:
+        """Show the next page."""
+
+        if self.page + 1 < self.page_count():
+            self.page += 1
+            self.refresh_view()
+
+    def action_prev_page(self) -> None:
+        """Show the previous page."""
+
+        if self.page > 0:
+            self.page -= 1
+            self.refresh_view()
+
+    def action_toggle_order(self) -> None:
+        """Switch between rivalries by heat and cooldowns by expiry."""
+
+        self.order = "expiry" if self.order == "heat" else "heat"
+        self.page = 0
+        self.refresh_view()
+
+    def action_back(self) -> None:
+        """Close the rivalry browser."""
+
+        self.app.pop_screen()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Handle Back button presses."""
+
+        if event.button.id == "back":
+            self.action_back()
+
+    def on_screen_resume(self) -> None:
+        """Re-read rivalry state when returning to the screen."""
+
+        self.refresh_view()